@@ -6,12 +6,27 @@ import json
 import time
 
 from steamgriddy import http
-from steamgriddy import ocr
 from steamgriddy import SteamGridDB
+from steamgriddy import RateLimiter
+from steamgriddy import Ranker
 from steamgriddy import steam_helpers
 from steamgriddy import enums
 
+def fetch_library_grids(sgdb, app_ids):
+    """Fetch every grid of the library with a handful of multi-id requests,
+    then pick the best capsule of each game locally.
+
+    Returns a dict of app id to grid, ``None`` for games without one.
+    """
+    library_grids = sgdb.bulk_asset_table(app_ids, enums.AssetType.Grid)
+    ranker = Ranker(authors=sgdb.authors)
+    return {app_id: ranker.best(library_grids, enums.SlotType.Capsule, app_id) for app_id in app_ids}
+
 if __name__ == '__main__':
+    # Only needed to run the utility; importing cli (e.g. from
+    # utils/benchmark.py) does not pull in OpenCV
+    from steamgriddy import ocr
+
     aparser = argparse.ArgumentParser(
         description="SteamGriddy utility",
         formatter_class=lambda prog: argparse.RawTextHelpFormatter(
@@ -33,14 +48,35 @@ if __name__ == '__main__':
             action='store',
             help="Your SteamGridDB API KEY (if not stored in ~/.config/steamgriddy)"
     )
+    aparser.add_argument('-r', '--rate-limit',
+            action='store',
+            type=float,
+            default=4.0,
+            help="Maximum SteamGridDB requests per second (default: 4)"
+    )
+    aparser.add_argument('--no-cache',
+            action='store_true',
+            help="Do not use the SteamGridDB response cache in ~/.cache/steamgriddy"
+    )
+    aparser.add_argument('--base-url',
+            action='store',
+            help="SteamGridDB API root, e.g. a local steamgriddy.fakeserver (default: steamgriddb.com)"
+    )
     args = aparser.parse_args()
 
     # Init
-    sgdb = SteamGridDB(args.api_key)
+    # Throttled (429) and failed (5xx) requests are retried with backoff
+    sgdb = SteamGridDB(
+        args.api_key,
+        rate_limiter=RateLimiter(args.rate_limit),
+        cache=not args.no_cache,
+        memo=True,
+        base_url=args.base_url
+    )
 
     # Get games in users library to interate through
-    users = steam_helpers.get_steam_users()
     if not args.steam_user:
+        users = steam_helpers.get_steam_users()
         if len(users) > 1:
             exit("Multiple Steam users found on this system, please set --steam-user <NAME>")
         else:
@@ -77,8 +113,14 @@ if __name__ == '__main__':
     #   "statsLink": "https://steamcommunity.com/id/ProfessorKaos64/stats/WormsClanWars",
     #   "globalStatsLink": "https://steamcommunity.com/stats/WormsClanWars/achievements/"
 
-    print(f"Fetching {user_id}'s Steam games")
-    games = steam_helpers.fetch_and_parse_games_xml(steam_id)
+    # The offline inventory (appmanifests, localconfig.vdf and appinfo.vdf)
+    # needs no public profile; non-Steam shortcuts have no Steam app id to
+    # look up on SteamGridDB, so they are skipped here
+    print(f"Reading {user_id}'s Steam games")
+    games = [game for game in steam_helpers.get_game_inventory(steam_id) if not game['non_steam']]
+    if not games:
+        print(f"Fetching {user_id}'s Steam games")
+        games = steam_helpers.fetch_and_parse_games_xml(steam_id)
 
     count = 0
     applied_count = 0
@@ -86,6 +128,13 @@ if __name__ == '__main__':
     if not games:
         exit("Error fetching games!")
     sorted_games = sorted(games, key=lambda item: item['name'], reverse=False)
+
+    print(f"Fetching SteamGridDB grids for {total_games} games")
+    try:
+        library_grids = fetch_library_grids(sgdb, [int(this_game["appID"]) for this_game in sorted_games])
+    except http.HTTPException as e:
+        exit(f"Failed to fetch grids from SteamGridDB: {e}")
+
     for this_game in sorted_games:
         count += 1
         game_appid = this_game["appID"]
@@ -117,53 +166,40 @@ if __name__ == '__main__':
         #        just the capsule cover art
 
         # https://www.steamgriddb.com/api/v2
-        # {'id': 3120, 'name': 'A Hat in Time', 'release_date': 1507237200, 'types': ['steam', 'gog'], 'verified': True}
-        try:
-            steamgriddb_game = sgdb.get_game_by_steam_appid(int(game_appid)).to_json()
-            grids = sgdb.get_grids_by_gameid(game_ids = [steamgriddb_game["id"]], dimensions = ["600x900"])
-        except http.HTTPException:
-            print(f"Game grid data not found for {game_name} ({game_appid})")
-            continue
-
-        if not grids:
+        grid = library_grids.get(int(game_appid))
+        if grid is None:
             print(f"Game grid data not found for {game_name} ({game_appid})")
             continue
 
         print(f"Checking if {header_image} exists inside of {capsule_image}")
         missing_cover_art = ocr.check_image_contains_template(capsule_image, header_image)
 
-        # Process grid results
-        for grid in grids:
-            grid_json = grid.to_json()
-            grid_image_url = grid_json["url"]
-            grid_image_filetype= os.path.basename(grid_image_url).split('.')[1]
-
-            # TODO - this part needs to be dynamic base don image type
-            #        start with cover/capsule 600x900. For some reason that
-            #        needs a "p" on the end (portrait?)
-            grid_image_newfile = f"{game_appid}p.{grid_image_filetype}"
-
-            # DEBUG
-            # print(json.dumps(grid_json))
-
-            # Same image with appropriate name
-            # For automation, take the first result
-            # Users can always use Decky Loader "steamgrid DB" plugin to adjust later
-
-            # Cover art handling
-            # Only download :
-            #   * User wants to fix missing cover art
-            #   * User does not* have args.only_missing set
-            if missing_cover_art or args.force:
-                print(f"Downloading 600x900 capsule cover image: {grid_image_url} as {grid_image_newfile}")
-                steam_helpers.download_grid_image(grid_image_newfile, grid_image_url, steam_grid_dir)
-                applied_count += 1
-            else:
-                print("Skipping capsule cover art download: Artwork not missing or --only-missing specified")
-
-            # Need backoff mechanism for rate limiting?
-
-            # Stop processing rest of grids
-            break
+        # Process the best grid
+        grid_json = grid.to_json()
+        grid_image_url = grid_json["url"]
+        grid_image_filetype= os.path.basename(grid_image_url).split('.')[1]
+
+        # TODO - this part needs to be dynamic base don image type
+        #        start with cover/capsule 600x900. For some reason that
+        #        needs a "p" on the end (portrait?)
+        grid_image_newfile = f"{game_appid}p.{grid_image_filetype}"
+
+        # DEBUG
+        # print(json.dumps(grid_json))
+
+        # Same image with appropriate name
+        # For automation, take the best ranked capsule
+        # Users can always use Decky Loader "steamgrid DB" plugin to adjust later
+
+        # Cover art handling
+        # Only download :
+        #   * User wants to fix missing cover art
+        #   * User does not* have args.only_missing set
+        if missing_cover_art or args.force:
+            print(f"Downloading 600x900 capsule cover image: {grid_image_url} as {grid_image_newfile}")
+            steam_helpers.download_grid_image(grid_image_newfile, grid_image_url, steam_grid_dir)
+            applied_count += 1
+        else:
+            print("Skipping capsule cover art download: Artwork not missing or --only-missing specified")
 
     print(f"DONE! Applied cover art to {applied_count} games.")
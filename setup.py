@@ -18,6 +18,10 @@ setuptools.setup(
         'vdf',
         'xmltodict'
     ],
+    extras_require = {
+        'async': ['aiohttp'],
+        'fast': ['orjson'],
+    },
     packages=setuptools.find_packages(),
     license="MIT",
     keywords=['steamgriddb', 'steamgrid', 'steamgriddy', 'steam', 'grid', 'db', 'api', 'wrapper'],
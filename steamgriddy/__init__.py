@@ -19,7 +19,17 @@ DEALINGS IN THE SOFTWARE.
 """
 
 from .steamgriddy import *
+from .async_steamgriddy import *
 from .enums import *
+from .ratelimit import *
+from .cache import *
+from .transport import *
 from .asset import *
 from .game import *
 from .author import *
+from .table import *
+from .snapshot import *
+from .ranking import *
+from .query import *
+from .bulk import *
+from .resolver import *
@@ -0,0 +1,448 @@
+"""
+The MIT License (MIT)
+Copyright (c) 2015-present Rapptz
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import mmap
+import os
+import struct
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+__all__ = (
+    'AppInfo',
+    'AppInfoError',
+    'Shortcut',
+    'read_shortcuts',
+)
+
+# Binary VDF value types
+_MAP = 0x00
+_STRING = 0x01
+_INT32 = 0x02
+_FLOAT32 = 0x03
+_POINTER = 0x04
+_WIDESTRING = 0x05
+_COLOR = 0x06
+_UINT64 = 0x07
+_END = 0x08
+_INT64 = 0x0A
+_END_ALT = 0x0B
+
+_FIXED = {
+    _INT32: struct.Struct('<i'),
+    _FLOAT32: struct.Struct('<f'),
+    _POINTER: struct.Struct('<i'),
+    _COLOR: struct.Struct('<i'),
+    _UINT64: struct.Struct('<Q'),
+    _INT64: struct.Struct('<q'),
+}
+
+_UINT32 = struct.Struct('<I')
+_RECORD = struct.Struct('<II')
+_HEADER = struct.Struct('<II')
+
+# appinfo.vdf magic numbers, mapped to the format version and the size of
+# the record header that follows the size field (state, last update, PICS
+# token, SHA-1s, change number)
+_VERSIONS = {
+    0x07564427: (27, 40),
+    0x07564428: (28, 60),
+    0x07564429: (29, 60),
+}
+_STRING_TABLE_VERSION = 0x07564429
+
+# The common keys that name the library artwork of an app
+ASSET_KEYS = (
+    'clienticon',
+    'clienttga',
+    'icon',
+    'logo',
+    'logo_small',
+    'header_image',
+    'library_assets',
+    'library_assets_full',
+)
+
+class AppInfoError(Exception):
+    """Exception raised when a binary VDF file cannot be decoded."""
+
+class _Decoder:
+    __slots__ = ('data', 'strings')
+
+    def __init__(self, data: Any, strings: Optional[List[str]] = None) -> None:
+        self.data = data
+        self.strings = strings
+
+    def kind(self, pos: int) -> int:
+        if pos >= len(self.data):
+            raise AppInfoError(f'Truncated data at offset {pos}.')
+        return self.data[pos]
+
+    def cstring_end(self, pos: int) -> int:
+        # Returns the offset just past the NUL ending the string at ``pos``.
+        end = self.data.find(b'\x00', pos)
+        if end < 0:
+            raise AppInfoError(f'Unterminated string at offset {pos}.')
+        return end + 1
+
+    def cstring(self, pos: int) -> Tuple[str, int]:
+        end = self.cstring_end(pos)
+        return self.data[pos:end - 1].decode('utf-8', 'replace'), end
+
+    def key(self, pos: int) -> Tuple[str, int]:
+        if self.strings is None:
+            return self.cstring(pos)
+        if pos + 4 > len(self.data):
+            raise AppInfoError(f'Truncated data at offset {pos}.')
+        index, = _UINT32.unpack_from(self.data, pos)
+        try:
+            return self.strings[index], pos + 4
+        except IndexError:
+            raise AppInfoError(f'Unknown key index {index} at offset {pos}.') from None
+
+    def value(self, kind: int, pos: int) -> Tuple[Any, int]:
+        # Reads a scalar value; maps are handled by the callers.
+        if kind == _STRING:
+            return self.cstring(pos)
+        fixed = _FIXED.get(kind)
+        if fixed is not None:
+            if pos + fixed.size > len(self.data):
+                raise AppInfoError(f'Truncated data at offset {pos}.')
+            return fixed.unpack_from(self.data, pos)[0], pos + fixed.size
+        if kind == _WIDESTRING:
+            # The terminator is a NUL code unit, so it starts at an even offset
+            end = self.data.find(b'\x00\x00', pos)
+            while end >= 0 and (end - pos) % 2:
+                end = self.data.find(b'\x00\x00', end + 1)
+            if end < 0:
+                raise AppInfoError(f'Unterminated wide string at offset {pos}.')
+            return self.data[pos:end].decode('utf-16-le', 'replace'), end + 2
+        raise AppInfoError(f'Unknown value type {kind:#x} at offset {pos - 1}.')
+
+    def decode(self, pos: int) -> Tuple[Dict[str, Any], int]:
+        # Decodes the children of a map up to and including its end marker.
+        result: Dict[str, Any] = {}
+        stack = [result]
+        while stack:
+            kind = self.kind(pos)
+            pos += 1
+            if kind == _END or kind == _END_ALT:
+                stack.pop()
+                continue
+            key, pos = self.key(pos)
+            if kind == _MAP:
+                child: Dict[str, Any] = {}
+                stack[-1][key] = child
+                stack.append(child)
+            else:
+                stack[-1][key], pos = self.value(kind, pos)
+        return result, pos
+
+    def skip(self, pos: int) -> int:
+        # Skips the children of a map up to and including its end marker.
+        depth = 1
+        strings = self.strings
+        while depth:
+            kind = self.kind(pos)
+            pos += 1
+            if kind == _END or kind == _END_ALT:
+                depth -= 1
+                continue
+            pos = pos + 4 if strings is not None else self.cstring_end(pos)
+            if kind == _MAP:
+                depth += 1
+            elif kind == _STRING:
+                pos = self.cstring_end(pos)
+            else:
+                pos = self.value(kind, pos)[1]
+        return pos
+
+    def select(self, pos: int, paths: Iterable[Tuple[str, ...]]) -> Dict[Tuple[str, ...], Any]:
+        # Reads only the given lowercase key paths of the map starting at
+        # ``pos``, stopping as soon as every one has been found.
+        wanted = set(paths)
+        prefixes = {path[:i] for path in wanted for i in range(1, len(path))}
+        found: Dict[Tuple[str, ...], Any] = {}
+        stack: Tuple[str, ...] = ()
+        while wanted:
+            kind = self.kind(pos)
+            pos += 1
+            if kind == _END or kind == _END_ALT:
+                if not stack:
+                    break
+                # Keys are unique within a map, so nothing left under it can match
+                depth = len(stack)
+                wanted = {path for path in wanted if path[:depth] != stack}
+                stack = stack[:-1]
+                continue
+            key, pos = self.key(pos)
+            path = stack + (key.lower(),)
+            if path in wanted:
+                wanted.discard(path)
+                if kind == _MAP:
+                    found[path], pos = self.decode(pos)
+                else:
+                    found[path], pos = self.value(kind, pos)
+            elif kind == _MAP:
+                if path in prefixes:
+                    stack = path
+                else:
+                    pos = self.skip(pos)
+            else:
+                pos = self.value(kind, pos)[1]
+        return found
+
+class AppInfo:
+    """Lazy reader of Steam's ``appcache/appinfo.vdf``.
+
+    The file is memory-mapped and only the record headers are walked when
+    it is opened, to index every app by id. A record is decoded on first
+    access, and :meth:`name` and :meth:`assets` decode only the keys they
+    need. Versions 27 to 29 of the format are supported.
+
+    .. container:: operations
+        .. describe:: len(x)
+            Returns the number of apps.
+        .. describe:: x in y
+            Checks if an app id is in the file.
+        .. describe:: iter(x)
+            Returns an iterator of the app ids.
+
+    Parameters
+    -----------
+    path: :class:`str`
+        The ``appinfo.vdf`` file.
+
+    Attributes
+    -----------
+    version: :class:`int`
+        The format version of the file.
+
+    Raises
+    --------
+    AppInfoError
+        If the file is not a supported ``appinfo.vdf``.
+    """
+
+    __slots__ = (
+        'path',
+        'version',
+        '_file',
+        '_data',
+        '_decoder',
+        '_index',
+        '_records',
+        '_summaries',
+    )
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._open()
+        except (ValueError, struct.error):
+            self.close()
+            raise AppInfoError('Not an appinfo.vdf file.') from None
+        except BaseException:
+            self.close()
+            raise
+
+    def _open(self) -> None:
+        data = self._data
+        magic, _ = _HEADER.unpack_from(data, 0)
+        if magic not in _VERSIONS:
+            raise AppInfoError(f'Unsupported appinfo.vdf version {magic:#x}.')
+        self.version, header_size = _VERSIONS[magic]
+
+        pos, end, strings = 8, len(data), None
+        if magic == _STRING_TABLE_VERSION:
+            end, = struct.unpack_from('<q', data, 8)
+            count, = _UINT32.unpack_from(data, end)
+            strings = data[end + 4:].decode('utf-8', 'replace').split('\x00', count)[:count]
+            pos = 16
+        self._decoder = _Decoder(data, strings)
+
+        index: Dict[int, Tuple[int, int]] = {}
+        unpack = _RECORD.unpack_from
+        while pos + 8 <= end:
+            app_id, size = unpack(data, pos)
+            if app_id == 0:
+                break
+            index[app_id] = (pos + 8 + header_size, pos + 8 + size)
+            pos += 8 + size
+        self._index = index
+        self._records: Dict[int, Dict[str, Any]] = {}
+        self._summaries: Dict[int, Dict[str, Any]] = {}
+
+    def __repr__(self) -> str:
+        return f'<AppInfo path={self.path!r} version={self.version} apps={len(self)}>'
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, app_id: int) -> bool:
+        return app_id in self._index
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._index)
+
+    def __enter__(self) -> 'AppInfo':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmaps and closes the file."""
+        data = getattr(self, '_data', None)
+        if data is not None:
+            data.close()
+        self._file.close()
+
+    def _start(self, app_id: int) -> Optional[int]:
+        record = self._index.get(app_id)
+        return record[0] if record is not None else None
+
+    def get(self, app_id: int) -> Optional[Dict[str, Any]]:
+        """Optional[:class:`dict`]: Returns the decoded ``appinfo`` section of an app, ``None`` if missing."""
+        record = self._records.get(app_id)
+        if record is None:
+            start = self._start(app_id)
+            if start is None:
+                return None
+            record, _ = self._decoder.decode(start)
+            record = self._records[app_id] = record.get('appinfo', record)
+        return record
+
+    def _select(self, app_id: int, keys: Iterable[str]) -> Dict[str, Any]:
+        start = self._start(app_id)
+        if start is None:
+            return {}
+        found = self._decoder.select(start, [('appinfo', 'common', key) for key in keys])
+        return {path[-1]: value for path, value in found.items()}
+
+    def name(self, app_id: int) -> Optional[str]:
+        """Optional[:class:`str`]: Returns the name of an app, ``None`` if missing."""
+        return self._select(app_id, ('name',)).get('name')
+
+    def type(self, app_id: int) -> Optional[str]:
+        """Optional[:class:`str`]: Returns the lowercase type of an app, e.g. ``'game'`` or ``'dlc'``."""
+        kind = self._select(app_id, ('type',)).get('type')
+        return kind.lower() if kind else None
+
+    def assets(self, app_id: int) -> Dict[str, Any]:
+        """:class:`dict`: Returns the artwork hashes and file names of an app, keyed as in ``common``."""
+        return self._select(app_id, ASSET_KEYS)
+
+    def summary(self, app_id: int) -> Optional[Dict[str, Any]]:
+        """Optional[:class:`dict`]: Returns the name, lowercase type and artwork of an app in one pass."""
+        summary = self._summaries.get(app_id)
+        if summary is None and app_id in self._index:
+            found = self._select(app_id, ('name', 'type') + ASSET_KEYS)
+            kind = found.pop('type', None)
+            summary = self._summaries[app_id] = {
+                'name': found.pop('name', None),
+                'type': kind.lower() if kind else None,
+                'assets': found,
+            }
+        return summary
+
+class Shortcut:
+    """A non-Steam game from a user's ``shortcuts.vdf``.
+
+    Attributes
+    -----------
+    app_id: :class:`int`
+        The unsigned 32-bit shortcut id, used to name its grid images.
+    name: :class:`str`
+        The name shown in the library.
+    exe: :class:`str`
+        The quoted path of the executable.
+    start_dir: :class:`str`
+        The working directory.
+    icon: :class:`str`
+        Path of the custom icon, if any.
+    launch_options: :class:`str`
+        The launch options.
+    tags: List[:class:`str`]
+        The collections the shortcut belongs to.
+    """
+
+    __slots__ = (
+        'app_id',
+        'name',
+        'exe',
+        'start_dir',
+        'icon',
+        'launch_options',
+        'tags',
+    )
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        fields = {key.lower(): value for key, value in payload.items()}
+        self.name = fields.get('appname', '')
+        self.exe = fields.get('exe', '')
+        self.start_dir = fields.get('startdir', '')
+        self.icon = fields.get('icon', '')
+        self.launch_options = fields.get('launchoptions', '')
+        tags = fields.get('tags')
+        self.tags = list(tags.values()) if isinstance(tags, dict) else []
+        app_id = fields.get('appid')
+        if app_id is None:
+            # Shortcuts written before Steam stored their id use this checksum
+            app_id = zlib.crc32((self.exe + self.name).encode('utf-8')) | 0x80000000
+        self.app_id = app_id & 0xFFFFFFFF
+
+    def __repr__(self) -> str:
+        return f'<Shortcut name={self.name!r} app_id={self.app_id}>'
+
+    @property
+    def game_id(self) -> int:
+        """:class:`int`: The 64-bit game id, as used by ``steam://rungameid/`` URLs."""
+        return (self.app_id << 32) | 0x02000000
+
+def read_shortcuts(path: str) -> List[Shortcut]:
+    """Reads the non-Steam games of a ``userdata/<id>/config/shortcuts.vdf`` file.
+
+    Parameters
+    -----------
+    path: :class:`str`
+        The file.
+
+    Raises
+    --------
+    AppInfoError
+        If the file is not a binary VDF file.
+
+    Returns
+    --------
+    List[:class:`Shortcut`]
+        The shortcuts, in library order.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if not data:
+        return []
+    try:
+        root, _ = _Decoder(data).decode(0)
+    except (IndexError, struct.error):
+        raise AppInfoError('Not a shortcuts.vdf file.') from None
+    shortcuts = next((value for key, value in root.items() if key.lower() == 'shortcuts'), {})
+    return [Shortcut(payload) for payload in shortcuts.values() if isinstance(payload, dict)]
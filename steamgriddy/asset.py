@@ -18,7 +18,7 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
-from typing import Tuple, Iterator, Any
+from typing import Dict, Tuple, Iterator, Any
 
 from .http import HTTPClient
 from .author import Author
@@ -73,6 +73,10 @@ class Asset:
         The URL of the asset.
     thumbnail: :class:`str`
         The URL of the asset's thumbnail.
+    upvotes: :class:`int`
+        The number of upvotes of the asset.
+    downvotes: :class:`int`
+        The number of downvotes of the asset.
     type: :class:`AssetType`
         The type of the asset.
     """
@@ -94,19 +98,47 @@ class Asset:
         'thumbnail',
         '_lock',
         '_epilepsy',
+        'upvotes',
+        'downvotes',
         'type',
         'author'
     )
 
+    # Attribute -> payload key of the fields decoded on first access when lazy
+    _FIELDS: Dict[str, str] = {
+        'id': 'id',
+        'author': 'author',
+        'score': 'score',
+        'width': 'width',
+        'height': 'height',
+        'style': 'style',
+        '_nsfw': 'nsfw',
+        '_humor': 'humor',
+        'notes': 'notes',
+        'mime': 'mime',
+        'language': 'language',
+        'url': 'url',
+        'thumbnail': 'thumb',
+        '_lock': 'lock',
+        '_epilepsy': 'epilepsy',
+        'upvotes': 'upvotes',
+        'downvotes': 'downvotes',
+    }
+
     def __init__(self, payload: dict, type: AssetType,  http: HTTPClient) -> None:
-        self._payload = payload
         self._http = http
-        self._from_data(payload)
         self.type = type
+        if http.lazy:
+            self._payload = payload
+            http.authors.record(payload['author'], type, payload.get('id'), payload.get('score'))
+            return
+        self._from_data(payload)
+        self._payload = payload if http.keep_payload else None
 
     def _from_data(self, asset: dict):
         self.id = asset.get('id')
-        self.author: Author = Author(asset['author'])
+        self._http.authors.record(asset['author'], self.type, asset.get('id'), asset.get('score'))
+        self.author: Author = self._http.authors.get(asset['author'])
         self.score = asset.get('score')
         self.width = asset.get('width')
         self.height = asset.get('height')
@@ -123,6 +155,16 @@ class Asset:
         self.upvotes = asset.get('upvotes')
         self.downvotes = asset.get('downvotes')
 
+    def __getattr__(self, name: str) -> Any:
+        key = self._FIELDS.get(name)
+        if key is None or self._payload is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = self._payload.get(key)
+        if name == 'author':
+            value = self._http.authors.get(value)
+        setattr(self, name, value)
+        return value
+
     def __str__(self) -> str:
         return self.url
 
@@ -140,23 +182,44 @@ class Asset:
                     yield (attr, value)
 
     def to_json(self) -> dict:
-        return self._payload
+        """:class:`dict`: Returns a JSON-compatible representation of the asset."""
+        if self._payload is not None:
+            return self._payload
+        return {
+            'id': self.id,
+            'score': self.score,
+            'style': self.style,
+            'width': self.width,
+            'height': self.height,
+            'nsfw': self._nsfw,
+            'humor': self._humor,
+            'notes': self.notes,
+            'mime': self.mime,
+            'language': self.language,
+            'url': self.url,
+            'thumb': self.thumbnail,
+            'lock': self._lock,
+            'epilepsy': self._epilepsy,
+            'upvotes': self.upvotes,
+            'downvotes': self.downvotes,
+            'author': self.author.to_json(),
+        }
 
     def is_lock(self) -> bool:
         """:class:`bool`: Returns whether the asset is locked."""
-        return self.lock
+        return self._lock
 
     def is_humor(self) -> bool:
         """:class:`bool`: Returns whether the asset is a humor asset."""
-        return self.humor
+        return self._humor
 
     def is_nsfw(self) -> bool:
         """:class:`bool`: Returns whether the asset is NSFW."""
-        return self.nsfw
+        return self._nsfw
 
     def is_epilepsy(self) -> bool:
         """:class:`bool`: Returns whether the asset is epilepsy-inducing."""
-        return self.is_epilepsy
+        return self._epilepsy
 
 
 class Grid(Asset):
@@ -172,7 +235,7 @@ class Grid(Asset):
 
     def delete(self) -> None:
         """Delete the grid."""
-        self._http.delete_grid([self.id])
+        return self._http.delete_grid([self.id])
 
 class Hero(Asset):
     def __init__(self, payload: dict, http: HTTPClient) -> None:
@@ -187,7 +250,7 @@ class Hero(Asset):
     
     def delete(self) -> None:
         """Delete the hero."""
-        self._http.delete_hero([self.id])
+        return self._http.delete_hero([self.id])
 
 class Logo(Asset):
     def __init__(self, payload: dict, http: HTTPClient) -> None:
@@ -202,7 +265,7 @@ class Logo(Asset):
     
     def delete(self) -> None:
         """Delete the logo."""
-        self._http.delete_logo([self.id])
+        return self._http.delete_logo([self.id])
 
 class Icon(Asset):
     def __init__(self, payload: dict, http: HTTPClient) -> None:
@@ -217,4 +280,4 @@ class Icon(Asset):
     
     def delete(self) -> None:
         """Delete the icon."""
-        self._http.delete_icon([self.id])
\ No newline at end of file
+        return self._http.delete_icon([self.id])
\ No newline at end of file
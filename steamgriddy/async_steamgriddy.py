@@ -0,0 +1,672 @@
+"""
+The MIT License (MIT)
+Copyright (c) 2015-present Rapptz
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+
+from .http import AsyncHTTPClient, HTTPException
+from .ratelimit import RateLimiter, Backoff
+from .cache import ResponseCache, MemoryCache, AutocompleteCache
+from .transport import AsyncTransport
+from .game import Game, GameRegistry
+from .author import AuthorRegistry
+from .enums import (
+    StyleType,
+    MimeType,
+    ImageType,
+    PlatformType,
+    AssetType
+)
+from .asset import *
+from .steamgriddy import _query, _bulk_queries, _bulk_jobs, _page_queries, _closest_game
+from .query import AssetQuery
+from .asset import Asset
+from .table import AssetTable
+from .snapshot import Snapshot, _tables_from_assets
+from . import bulk
+
+__all__ = (
+    'AsyncSteamGridDB',
+)
+
+class AsyncSteamGridDB:
+    """Asynchronous counterpart of :class:`SteamGridDB`.
+
+    Every method mirrors the one of the same name on :class:`SteamGridDB`
+    and takes the same parameters, but is a coroutine. Requires ``aiohttp``.
+
+    .. container:: operations
+        .. describe:: async with x
+            Closes the underlying HTTP session on exit.
+
+    Attributes
+    -----------
+    auth_key: :class:`str`
+        The auth key of the steamgriddb for authorization.
+    rate_limiter: Optional[:class:`RateLimiter`]
+        Token bucket shared by every request of this client. Defaults to
+        no limit.
+    backoff: Optional[:class:`Backoff`]
+        Retry policy for ``429`` and ``5xx`` responses. Defaults to three
+        retries with jittered exponential backoff, honoring ``Retry-After``.
+    cache: Union[:class:`bool`, :class:`str`, :class:`ResponseCache`, None]
+        Persistent cache of ``GET`` responses. ``True`` uses the default
+        location under ``~/.cache/steamgriddy``, a string is the database
+        path. Defaults to no cache.
+    memo: Union[:class:`bool`, :class:`MemoryCache`, None]
+        In-process LRU memo of game and asset-list lookups, checked before
+        ``cache``. ``True`` uses the default size and time-to-live.
+        Defaults to no memo.
+    transport: Optional[:class:`AsyncTransport`]
+        The HTTP backend, with its connection pool and timeouts. Defaults to
+        :class:`AiohttpTransport` with its default settings.
+    decoder: Optional[:class:`str`]
+        JSON decoder of response bodies: ``'orjson'``, ``'msgspec'`` or
+        ``'json'``. Defaults to the fastest one installed.
+    keep_payload: :class:`bool`
+        Whether models keep the decoded response dict they were built from.
+        When ``False`` the dict is dropped after its fields are copied and
+        ``to_json()`` rebuilds it on demand. Defaults to ``True``.
+    base_url: Optional[:class:`str`]
+        Root URL of the API, e.g. a local :class:`~steamgriddy.fakeserver.FakeSteamGridDB`.
+        Defaults to ``https://www.steamgriddb.com/api/v2``.
+    lazy: :class:`bool`
+        Whether models decode their fields from the response dict on first
+        access instead of up front, so that e.g. reading only ``url`` never
+        builds the :class:`Author`. Lazy models always keep the response
+        dict. Defaults to ``False``.
+    autocomplete: Union[:class:`bool`, :class:`AutocompleteCache`, None]
+        Prefix-trie cache of :meth:`search_game` results, so that longer
+        terms can be answered locally. ``True`` uses the default time-to-live.
+        Defaults to no cache.
+    
+    """
+
+    __slots__ = ('_http')
+
+    def __init__(
+        self,
+        auth_key: str,
+        rate_limiter: Optional[RateLimiter] = None,
+        backoff: Optional[Backoff] = None,
+        cache: Union[bool, str, ResponseCache, None] = None,
+        memo: Union[bool, MemoryCache, None] = None,
+        transport: Optional[AsyncTransport] = None,
+        decoder: Optional[str] = None,
+        keep_payload: bool = True,
+        base_url: Optional[str] = None,
+        lazy: bool = False,
+        autocomplete: Union[bool, AutocompleteCache, None] = None,
+    ) -> None:
+        self._http = AsyncHTTPClient(
+            auth_key,
+            rate_limiter=rate_limiter,
+            backoff=backoff,
+            cache=cache,
+            memo=memo,
+            transport=transport,
+            decoder=decoder,
+            keep_payload=keep_payload,
+            base_url=base_url,
+            lazy=lazy,
+            autocomplete=autocomplete
+        )
+
+    async def __aenter__(self) -> 'AsyncSteamGridDB':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the underlying HTTP session."""
+        await self._http.close()
+
+    @property
+    def authors(self) -> AuthorRegistry:
+        """:class:`AuthorRegistry`: The shared authors of every asset built by this client, with their aggregates."""
+        return self._http.authors
+
+    @property
+    def games(self) -> GameRegistry:
+        """:class:`GameRegistry`: The identity map of every game looked up by this client."""
+        return self._http.games
+
+    def invalidate(self) -> None:
+        """Forgets every memoized game and asset-list lookup, including :attr:`games`.
+
+        The persistent ``cache``, if any, is left untouched.
+        """
+        if self._http.memo is not None:
+            self._http.memo.invalidate()
+        self._http.games.clear()
+
+    def auth_key(self) -> str:
+        """:class:`str`: Returns the auth key of the steamgriddb."""
+        return self._http.auth_key
+
+    async def get_game_by_gameid(
+        self,
+        game_id: int,
+    ) -> Optional[Game]:
+        """Coroutine version of :meth:`SteamGridDB.get_game_by_gameid`."""
+        if not isinstance(game_id, int):
+            raise TypeError('\'game_id\' must be an integer.')
+
+        game = self._http.games.get(game_id)
+        if game is not None:
+            return game
+
+        payload = await self._http.get_game(game_id, 'game')
+        return self._http.games.add(payload) if payload != [] else None
+
+    async def get_game_by_steam_appid(
+        self,
+        app_id: int,
+    ) -> Optional[Game]:
+        """Coroutine version of :meth:`SteamGridDB.get_game_by_steam_appid`."""
+        if not isinstance(app_id, int):
+            raise TypeError('\'app_id\' must be an integer.')
+
+        game = self._http.games.by_platform(PlatformType.Steam.value, app_id)
+        if game is not None:
+            return game
+
+        payload = await self._http.get_game(app_id, 'steam')
+        return self._http.games.add(payload, PlatformType.Steam.value, app_id) if payload != [] else None
+
+    async def get_grids_by_gameid(
+        self,
+        game_ids: List[int],
+        dimensions: List[str] = [],
+        styles: List[StyleType] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> Optional[List[Grid]]:
+        """Coroutine version of :meth:`SteamGridDB.get_grids_by_gameid`."""
+        if not isinstance(game_ids, List):
+            raise TypeError('\'game_ids\' must be a list of integers.')
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
+
+        payloads = await self._http.get_grid(game_ids, 'game', queries=queries)
+        if payloads != []:
+            return [Grid(payload, self._http) for payload in payloads]
+        return None
+
+    async def get_grids_by_platform(
+        self,
+        game_ids: List[int],
+        platform: PlatformType,
+        styles: List[StyleType] = [],
+        dimensions: List[str] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> Optional[List[Grid]]:
+        """Coroutine version of :meth:`SteamGridDB.get_grids_by_platform`."""
+        if not isinstance(platform, PlatformType):
+            raise TypeError('\'platform\' must be a PlatformType.')
+        if not isinstance(game_ids, List):
+            raise TypeError('\'game_ids\' must be a list of integers.')
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
+
+        payloads = await self._http.get_grid(
+            game_ids,
+            'platform',
+            platform=platform.value,
+            queries=queries
+        )
+        if payloads != []:
+            return [Grid(payload, self._http) for payload in payloads]
+        return None
+
+    async def get_heroes_by_gameid(
+        self,
+        game_ids: List[int],
+        styles: List[StyleType] = [],
+        dimensions: List[str] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> Optional[List[Hero]]:
+        """Coroutine version of :meth:`SteamGridDB.get_heroes_by_gameid`."""
+        if not isinstance(game_ids, List):
+            raise TypeError('\'game_ids\' must be a list of integers.')
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
+
+        payloads = await self._http.get_hero(game_ids, 'game', queries=queries)
+        if payloads != []:
+            return [Hero(payload, self._http) for payload in payloads]
+        return None
+
+    async def get_heroes_by_platform(
+        self,
+        game_ids: List[int],
+        platform: PlatformType,
+        styles: List[StyleType] = [],
+        dimensions: List[str] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> Optional[List[Hero]]:
+        """Coroutine version of :meth:`SteamGridDB.get_heroes_by_platform`."""
+        if not isinstance(platform, PlatformType):
+            raise TypeError('\'platform\' must be a PlatformType.')
+        if not isinstance(game_ids, List):
+            raise TypeError('\'game_ids\' must be a list of integers.')
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
+
+        payloads = await self._http.get_hero(
+            game_ids,
+            'platform',
+            platform=platform.value,
+            queries=queries
+        )
+        if payloads != []:
+            return [Hero(payload, self._http) for payload in payloads]
+        return None
+
+    async def get_logos_by_gameid(
+        self,
+        game_ids: List[int],
+        styles: List[StyleType] = [],
+        dimensions: List[str] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> Optional[List[Logo]]:
+        """Coroutine version of :meth:`SteamGridDB.get_logos_by_gameid`."""
+        if not isinstance(game_ids, List):
+            raise TypeError('\'game_ids\' must be a list of integers.')
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
+
+        payloads = await self._http.get_logo(game_ids, 'game', queries=queries)
+        if payloads != []:
+            return [Logo(payload, self._http) for payload in payloads]
+        return None
+
+    async def get_logos_by_platform(
+        self,
+        game_ids: List[int],
+        platform: PlatformType,
+        styles: List[StyleType] = [],
+        dimensions: List[str] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> Optional[List[Logo]]:
+        """Coroutine version of :meth:`SteamGridDB.get_logos_by_platform`."""
+        if not isinstance(platform, PlatformType):
+            raise TypeError('\'platform\' must be a PlatformType.')
+        if not isinstance(game_ids, List):
+            raise TypeError('\'game_ids\' must be a list of integers.')
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
+
+        payloads = await self._http.get_logo(
+            game_ids,
+            'platform',
+            platform=platform.value,
+            queries=queries
+        )
+        if payloads != []:
+            return [Logo(payload, self._http) for payload in payloads]
+        return None
+
+    async def get_icons_by_gameid(
+        self,
+        game_ids: List[int],
+        styles: List[StyleType] = [],
+        dimensions: List[str] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> Optional[List[Icon]]:
+        """Coroutine version of :meth:`SteamGridDB.get_icons_by_gameid`."""
+        if not isinstance(game_ids, List):
+            raise TypeError('\'game_ids\' must be a list of integers.')
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
+
+        payloads = await self._http.get_icon(game_ids, 'game', queries=queries)
+        if payloads != []:
+            return [Icon(payload, self._http) for payload in payloads]
+        return None
+
+    async def get_icons_by_platform(
+        self,
+        game_ids: List[int],
+        platform: PlatformType,
+        styles: List[StyleType] = [],
+        dimensions: List[str] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> Optional[List[Icon]]:
+        """Coroutine version of :meth:`SteamGridDB.get_icons_by_platform`."""
+        if not isinstance(platform, PlatformType):
+            raise TypeError('\'platform\' must be a PlatformType.')
+        if not isinstance(game_ids, List):
+            raise TypeError('\'game_ids\' must be a list of integers.')
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
+
+        payloads = await self._http.get_icon(
+            game_ids,
+            'platform',
+            platform=platform.value,
+            queries=queries
+        )
+        if payloads != []:
+            return [Icon(payload, self._http) for payload in payloads]
+        return None
+
+    async def _iter_assets(self, asset_type: AssetType, game_id: int, queries: dict) -> AsyncIterator[Asset]:
+        getter = getattr(self._http, bulk.HTTP_GETTERS[asset_type])
+        cls = bulk.ASSET_CLASSES[asset_type]
+        page = 0
+        while True:
+            payloads = await getter([game_id], 'game', queries=dict(queries, page=str(page)))
+            for payload in payloads or ():
+                yield cls(payload, self._http)
+            if not payloads or len(payloads) < bulk.PAGE_SIZE:
+                return
+            page += 1
+
+    def iter_grids(
+        self,
+        game_id: int,
+        dimensions: List[str] = [],
+        styles: List[StyleType] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> AsyncIterator[Grid]:
+        """Asynchronous iterator version of :meth:`SteamGridDB.iter_grids`."""
+        queries = _page_queries(game_id, _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor))
+        return self._iter_assets(AssetType.Grid, game_id, queries)
+
+    def iter_heroes(
+        self,
+        game_id: int,
+        styles: List[StyleType] = [],
+        dimensions: List[str] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> AsyncIterator[Hero]:
+        """Asynchronous iterator version of :meth:`SteamGridDB.iter_heroes`."""
+        queries = _page_queries(game_id, _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor))
+        return self._iter_assets(AssetType.Hero, game_id, queries)
+
+    def iter_logos(
+        self,
+        game_id: int,
+        styles: List[StyleType] = [],
+        dimensions: List[str] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> AsyncIterator[Logo]:
+        """Asynchronous iterator version of :meth:`SteamGridDB.iter_logos`."""
+        queries = _page_queries(game_id, _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor))
+        return self._iter_assets(AssetType.Logo, game_id, queries)
+
+    def iter_icons(
+        self,
+        game_id: int,
+        styles: List[StyleType] = [],
+        dimensions: List[str] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> AsyncIterator[Icon]:
+        """Asynchronous iterator version of :meth:`SteamGridDB.iter_icons`."""
+        queries = _page_queries(game_id, _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor))
+        return self._iter_assets(AssetType.Icon, game_id, queries)
+
+    async def bulk_assets(
+        self,
+        app_ids: List[int],
+        asset_types: List[AssetType] = [AssetType.Grid],
+        filters: Union[AssetQuery, dict, None] = None,
+        platform: PlatformType = PlatformType.Steam,
+    ) -> Dict[int, Dict[AssetType, List[Asset]]]:
+        """Coroutine version of :meth:`SteamGridDB.bulk_assets`.
+
+        Every chunk is requested concurrently; use a :class:`RateLimiter` to
+        bound the request rate.
+        """
+        results = {}
+        for asset_type, app_id, items in await self._bulk_fetch(app_ids, asset_types, filters, platform):
+            results.setdefault(app_id, {t: [] for t in asset_types})[asset_type] = bulk.build_assets(asset_type, items, self._http)
+        return results
+
+    async def bulk_asset_table(
+        self,
+        app_ids: List[int],
+        asset_type: AssetType = AssetType.Grid,
+        filters: Union[AssetQuery, dict, None] = None,
+        platform: PlatformType = PlatformType.Steam,
+    ) -> AssetTable:
+        """Coroutine version of :meth:`SteamGridDB.bulk_asset_table`."""
+        table = AssetTable(asset_type, self._http)
+        for _, app_id, items in await self._bulk_fetch(app_ids, [asset_type], filters, platform):
+            table.extend(items, app_id)
+        return table
+
+    async def _bulk_fetch(
+        self,
+        app_ids: List[int],
+        asset_types: List[AssetType],
+        filters: Union[AssetQuery, dict, None],
+        platform: PlatformType,
+    ) -> List[Tuple[AssetType, int, List[dict]]]:
+        if not isinstance(app_ids, List):
+            raise TypeError('\'app_ids\' must be a list of integers.')
+        if not isinstance(platform, PlatformType):
+            raise TypeError('\'platform\' must be a PlatformType.')
+
+        app_ids = bulk.unique(app_ids)
+        queries = _bulk_queries(asset_types, filters)
+        results = {app_id: {asset_type: [] for asset_type in asset_types} for app_id in app_ids}
+
+        async def fetch(asset_type, chunk):
+            getter = getattr(self._http, bulk.HTTP_GETTERS[asset_type])
+            try:
+                payloads = await getter(chunk, 'platform', platform=platform.value, queries=queries[asset_type])
+            except HTTPException as e:
+                if len(chunk) == 1 and e.status == 404:
+                    payloads = []
+                else:
+                    raise
+            return asset_type, chunk, payloads
+
+        jobs = _bulk_jobs(self._http, app_ids, platform, queries)
+        for asset_type, chunk, payloads in await asyncio.gather(*(fetch(*job) for job in jobs)):
+            for app_id, items in bulk.split_platform_payload(chunk, payloads).items():
+                results[app_id][asset_type] = items
+
+        return [
+            (asset_type, app_id, items)
+            for app_id, by_type in results.items()
+            for asset_type, items in by_type.items()
+        ]
+
+    async def bulk_delete(
+        self,
+        asset_ids: List[int],
+        asset_type: AssetType = AssetType.Grid,
+    ) -> bulk.DeleteReport:
+        """Coroutine version of :meth:`SteamGridDB.bulk_delete`.
+
+        Every chunk is deleted concurrently; use a :class:`RateLimiter` to
+        bound the request rate.
+        """
+        if not isinstance(asset_ids, List):
+            raise TypeError('\'asset_ids\' must be a list of integers.')
+        if not isinstance(asset_type, AssetType):
+            raise TypeError('\'asset_type\' must be an AssetType.')
+
+        deleter = getattr(self._http, bulk.HTTP_DELETERS[asset_type])
+        prefix = self._http.BASE_URL + '/' + bulk.ASSET_PATHS[asset_type] + '/'
+        results = {}
+
+        async def delete(chunk):
+            try:
+                await deleter(chunk)
+            except HTTPException as e:
+                if len(chunk) > 1 and bulk.should_split(e):
+                    middle = len(chunk) // 2
+                    await asyncio.gather(delete(chunk[:middle]), delete(chunk[middle:]))
+                else:
+                    results.update(dict.fromkeys(chunk, e))
+            else:
+                results.update(dict.fromkeys(chunk))
+
+        asset_ids = bulk.unique(asset_ids)
+        await asyncio.gather(*(delete(chunk) for chunk in bulk.chunk_ids(asset_ids, prefix)))
+
+        return bulk.DeleteReport(asset_type, {i: results[i] for i in asset_ids})
+
+    async def delete_grid(
+        self,
+        grid_ids: List[int],
+    ) -> None:
+        """Coroutine version of :meth:`SteamGridDB.delete_grid`."""
+        if not isinstance(grid_ids, List):
+            raise TypeError('\'grid_ids\' must be a list of integers.')
+
+        await self._http.delete_grid(grid_ids)
+
+    async def delete_hero(
+        self,
+        hero_ids: List[int],
+    ) -> None:
+        """Coroutine version of :meth:`SteamGridDB.delete_hero`."""
+        if not isinstance(hero_ids, List):
+            raise TypeError('\'hero_ids\' must be a list of integers.')
+
+        await self._http.delete_hero(hero_ids)
+
+    async def delete_logo(
+        self,
+        logo_ids: List[int],
+    ) -> None:
+        """Coroutine version of :meth:`SteamGridDB.delete_logo`."""
+        if not isinstance(logo_ids, List):
+            raise TypeError('\'logo_ids\' must be a list of integers.')
+
+        await self._http.delete_logo(logo_ids)
+
+    async def delete_icon(
+        self,
+        icon_ids: List[int],
+    ) -> None:
+        """Coroutine version of :meth:`SteamGridDB.delete_icon`."""
+        if not isinstance(icon_ids, List):
+            raise TypeError('\'icon_ids\' must be a list of integers.')
+
+        await self._http.delete_icon(icon_ids)
+
+    async def search_game(
+        self,
+        term: str
+    ) -> Optional[List[Game]]:
+        """Coroutine version of :meth:`SteamGridDB.search_game`."""
+        if not isinstance(term, str):
+            raise TypeError('\'term\' must be a string.')
+
+        cache = self._http.autocomplete
+        payloads = cache.get(term) if cache is not None else None
+        if payloads is None:
+            payloads = await self._http.search_games(term)
+            if cache is not None:
+                cache.set(term, payloads)
+        return [self._http.games.add(payload) for payload in payloads]
+
+    async def resolve_game(
+        self,
+        name: str,
+        threshold: Optional[float] = None,
+    ) -> Optional[Game]:
+        """Coroutine version of :meth:`SteamGridDB.resolve_game`."""
+        if not isinstance(name, str):
+            raise TypeError('\'name\' must be a string.')
+
+        resolver = self._http.games.names
+        match = resolver.resolve(name, threshold)
+        if match is not None and match.game_id is not None:
+            return await self.get_game_by_gameid(match.game_id)
+        if match is not None and match.app_id is not None:
+            game = await self.get_game_by_steam_appid(match.app_id)
+            if game is not None:
+                return game
+        return _closest_game(resolver, name, await self.search_game(name), threshold)
+
+    def dump_snapshot(
+        self,
+        assets: Union[Dict[int, Dict[AssetType, List[Asset]]], Iterable[AssetTable], None] = None,
+        games: Optional[Iterable[Game]] = None,
+    ) -> bytes:
+        """Same as :meth:`SteamGridDB.dump_snapshot`."""
+        if isinstance(assets, dict):
+            assets = _tables_from_assets(assets, self._http)
+        return Snapshot.dumps(
+            assets or (), self._http.games if games is None else games, self._http.games.links()
+        )
+
+    def load_snapshot(self, data: bytes) -> Snapshot:
+        """Same as :meth:`SteamGridDB.load_snapshot`."""
+        return Snapshot.loads(data, self._http)
+
+    def set_auth_key(
+        self,
+        auth_key: str
+    ) -> None:
+        """Sets the new auth key for the API. See :meth:`SteamGridDB.set_auth_key`."""
+        if not isinstance(auth_key, str):
+            raise TypeError('\'auth_key\' must be a string.')
+        if len(auth_key) != 32:
+            raise ValueError('\'auth_key\' must be a 32-character string.')
+
+        self._http.set_auth_key(auth_key)
@@ -18,10 +18,15 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
-from typing import Iterator, Tuple, Any
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+
+from .enums import AssetType
 
 __all__ = (
     'Author',
+    'AuthorStats',
+    'AuthorRegistry',
 )
 
 class Author:
@@ -60,15 +65,33 @@ class Author:
         'avatar',
     )
 
-    def __init__(self, payload: dict) -> None:
-        self._payload = payload
+    # Attribute -> payload key of the fields decoded on first access when lazy
+    _FIELDS: Dict[str, str] = {
+        'name': 'name',
+        'steam64': 'steam64',
+        'avatar': 'avatar',
+    }
+
+    def __init__(self, payload: dict, keep_payload: bool = True, lazy: bool = False) -> None:
+        if lazy:
+            self._payload = payload
+            return
         self._from_data(payload)
+        self._payload = payload if keep_payload else None
 
     def _from_data(self, author: dict):
         self.name = author.get('name')
         self.steam64 = author.get('steam64')
         self.avatar = author.get('avatar')
 
+    def __getattr__(self, name: str) -> Any:
+        key = self._FIELDS.get(name)
+        if key is None or self._payload is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = self._payload.get(key)
+        setattr(self, name, value)
+        return value
+
     def __str__(self) -> str:
         return self.name
     
@@ -90,4 +113,173 @@ class Author:
 
     def to_json(self) -> dict:
         """:class:`dict`: Returns a JSON-compatible representation of the author."""
-        return self._payload
\ No newline at end of file
+        if self._payload is not None:
+            return self._payload
+        return {'name': self.name, 'steam64': self.steam64, 'avatar': self.avatar}
+
+
+class AuthorStats:
+    """Running aggregates of the assets seen from one author.
+
+    Attributes
+    -----------
+    count: :class:`int`
+        Number of distinct assets seen.
+    total_score: :class:`int`
+        Sum of their scores.
+    """
+
+    __slots__ = (
+        'count',
+        'total_score',
+    )
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_score = 0
+
+    def __repr__(self) -> str:
+        return f'<AuthorStats count={self.count} mean_score={self.mean_score:.2f}>'
+
+    @property
+    def mean_score(self) -> float:
+        """:class:`float`: The mean score of the assets seen, ``0.0`` if none."""
+        return self.total_score / self.count if self.count else 0.0
+
+
+class AuthorRegistry:
+    """Interns :class:`Author` objects by ``steam64`` so that every asset of an
+    author shares one instance, and keeps per-author :class:`AuthorStats` as
+    assets are built. Each client owns one, see :attr:`SteamGridDB.authors`.
+
+    .. container:: operations
+        .. describe:: len(x)
+            Returns the number of authors seen.
+        .. describe:: steam64 in x
+            Checks whether an author was seen.
+        .. describe:: iter(x)
+            Returns an iterator of the shared :class:`Author` objects.
+
+    Parameters
+    -----------
+    keep_payload: :class:`bool`
+        Passed on to the :class:`Author` objects.
+    lazy: :class:`bool`
+        Passed on to the :class:`Author` objects.
+
+    Attributes
+    -----------
+    version: :class:`int`
+        Incremented whenever the aggregates change, so that values derived
+        from them, such as :class:`Ranker` indexes, can tell they are stale.
+    """
+
+    __slots__ = (
+        '_authors',
+        '_payloads',
+        '_stats',
+        '_seen',
+        '_lock',
+        'keep_payload',
+        'lazy',
+        'version',
+    )
+
+    def __init__(self, keep_payload: bool = True, lazy: bool = False) -> None:
+        self._authors: Dict[str, Author] = {}
+        self._payloads: Dict[str, dict] = {}
+        self._stats: Dict[str, AuthorStats] = {}
+        self._seen: set = set()
+        self._lock = threading.Lock()
+        self.keep_payload = keep_payload
+        self.lazy = lazy
+        self.version = 0
+
+    def __repr__(self) -> str:
+        return f'<AuthorRegistry authors={len(self)}>'
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def __contains__(self, steam64: str) -> bool:
+        return steam64 in self._stats
+
+    def __iter__(self) -> Iterator[Author]:
+        for steam64 in list(self._stats):
+            yield self._author(steam64)
+
+    @staticmethod
+    def _key(payload: dict) -> str:
+        # Fall back to the name for the odd author without a steam64.
+        return payload.get('steam64') or payload.get('name') or ''
+
+    def _author(self, key: str) -> Author:
+        author = self._authors.get(key)
+        if author is None:
+            with self._lock:
+                author = self._authors.get(key)
+                if author is None:
+                    author = self._authors[key] = Author(self._payloads[key], self.keep_payload, self.lazy)
+        return author
+
+    def record(self, payload: dict, asset_type: AssetType, asset_id: Optional[int], score: Optional[int]) -> None:
+        """Counts an asset towards its author's :class:`AuthorStats`.
+
+        Assets are counted once per type and id, however many times they are
+        built; grids, heroes, logos and icons have separate id spaces.
+        No :class:`Author` is created.
+        """
+        key = self._key(payload)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = AuthorStats()
+                self._payloads[key] = payload
+            if asset_id is not None:
+                seen = (asset_type, asset_id)
+                if seen in self._seen:
+                    return
+                self._seen.add(seen)
+            stats.count += 1
+            stats.total_score += score or 0
+            self.version += 1
+
+    def get(self, payload: dict) -> Author:
+        """:class:`Author`: Returns the shared author of an author dict."""
+        key = self._key(payload)
+        if key not in self._payloads:
+            with self._lock:
+                if key not in self._stats:
+                    self._stats[key] = AuthorStats()
+                self._payloads.setdefault(key, payload)
+        return self._author(key)
+
+    def stats(self, steam64: str) -> Optional[AuthorStats]:
+        """Optional[:class:`AuthorStats`]: Returns the aggregates of an author, ``None`` if unseen."""
+        return self._stats.get(steam64)
+
+    def count(self, steam64: str) -> int:
+        """:class:`int`: Returns the number of assets seen from an author."""
+        stats = self._stats.get(steam64)
+        return stats.count if stats else 0
+
+    def mean_score(self, steam64: str) -> float:
+        """:class:`float`: Returns the mean score of the assets seen from an author."""
+        stats = self._stats.get(steam64)
+        return stats.mean_score if stats else 0.0
+
+    def top(self, n: int = 10, key: str = 'count') -> List[Tuple[Author, AuthorStats]]:
+        """Returns the ``n`` authors with the most assets, or the best
+        ``mean_score`` with ``key='mean_score'``, with their aggregates.
+        """
+        ranked = sorted(self._stats.items(), key=lambda item: getattr(item[1], key), reverse=True)
+        return [(self._author(steam64), stats) for steam64, stats in ranked[:n]]
+
+    def clear(self) -> None:
+        """Forgets every author and aggregate."""
+        with self._lock:
+            self._authors.clear()
+            self._payloads.clear()
+            self._stats.clear()
+            self._seen.clear()
+            self.version += 1
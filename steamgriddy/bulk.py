@@ -0,0 +1,170 @@
+"""
+The MIT License (MIT)
+Copyright (c) 2015-present Rapptz
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+from typing import Dict, Iterator, List, Optional, Sequence
+from urllib.parse import urlencode
+
+from .asset import Asset, Grid, Hero, Logo, Icon
+from .enums import AssetType
+from .http import HTTPException
+
+__all__ = (
+    'DeleteReport',
+)
+
+ASSET_CLASSES = {
+    AssetType.Grid: Grid,
+    AssetType.Hero: Hero,
+    AssetType.Logo: Logo,
+    AssetType.Icon: Icon,
+}
+
+ASSET_PATHS = {
+    AssetType.Grid: 'grids',
+    AssetType.Hero: 'heroes',
+    AssetType.Logo: 'logos',
+    AssetType.Icon: 'icons',
+}
+
+HTTP_DELETERS = {
+    AssetType.Grid: 'delete_grid',
+    AssetType.Hero: 'delete_hero',
+    AssetType.Logo: 'delete_logo',
+    AssetType.Icon: 'delete_icon',
+}
+
+HTTP_GETTERS = {
+    AssetType.Grid: 'get_grid',
+    AssetType.Hero: 'get_hero',
+    AssetType.Logo: 'get_logo',
+    AssetType.Icon: 'get_icon',
+}
+
+MAX_IDS = 100
+MAX_URL_LENGTH = 2000
+
+# Assets per page of the /{assets}/game/{id} endpoints; a shorter page is the last one.
+PAGE_SIZE = 50
+
+def unique(ids: Sequence[int]) -> List[int]:
+    """Returns ``ids`` without duplicates, keeping the first occurrence."""
+    return list(dict.fromkeys(ids))
+
+def chunk_ids(
+    ids: Sequence[int],
+    prefix: str,
+    queries: Optional[dict] = None,
+    max_ids: int = MAX_IDS,
+    max_url_length: int = MAX_URL_LENGTH,
+) -> Iterator[List[int]]:
+    """Splits ``ids`` so that ``prefix + ','.join(chunk)`` plus the query
+    string stays under ``max_url_length`` with at most ``max_ids`` per chunk.
+    """
+    budget = max_url_length - len(prefix)
+    if queries:
+        budget -= len(urlencode(queries)) + 1
+
+    chunk: List[int] = []
+    length = 0
+    for i in ids:
+        size = len(str(i)) + (1 if chunk else 0)
+        if chunk and (len(chunk) >= max_ids or length + size > budget):
+            yield chunk
+            chunk, length, size = [], 0, len(str(i))
+        chunk.append(i)
+        length += size
+    if chunk:
+        yield chunk
+
+def split_platform_payload(ids: List[int], payloads: list) -> Dict[int, List[dict]]:
+    """Maps each id of a multi-id platform request to its list of assets.
+
+    With a single id the API answers with the asset list itself; with several
+    it answers with one ``{success, data}`` envelope per id, in request order.
+    Ids the API could not resolve map to an empty list.
+    """
+    if len(ids) == 1:
+        return {ids[0]: payloads or []}
+
+    results = {}
+    for i, entry in zip(ids, payloads or []):
+        if isinstance(entry, dict) and entry.get('success'):
+            results[i] = entry.get('data') or []
+        else:
+            results[i] = []
+    return results
+
+def build_assets(asset_type: AssetType, payloads: List[dict], http) -> List[Asset]:
+    cls = ASSET_CLASSES[asset_type]
+    return [cls(payload, http) for payload in payloads]
+
+
+def should_split(error: HTTPException) -> bool:
+    """Whether a failed multi-id delete may succeed for part of its ids.
+
+    Auth, rate limit, server and connection errors fail every id alike, so
+    splitting the chunk would only add requests.
+    """
+    return error.status is not None and 400 <= error.status < 500 and error.status not in (401, 429)
+
+class DeleteReport:
+    """The per-id outcome of :meth:`SteamGridDB.bulk_delete`.
+
+    .. container:: operations
+        .. describe:: len(x)
+            Returns the number of ids.
+        .. describe:: bool(x)
+            Returns whether every id was deleted.
+
+    Attributes
+    -----------
+    asset_type: :class:`AssetType`
+        The type of the deleted assets.
+    results: Dict[:class:`int`, Optional[:class:`HTTPException`]]
+        The error of every id, ``None`` for deleted ones.
+    """
+
+    __slots__ = (
+        'asset_type',
+        'results',
+    )
+
+    def __init__(self, asset_type: AssetType, results: Dict[int, Optional[HTTPException]]) -> None:
+        self.asset_type = asset_type
+        self.results = results
+
+    def __repr__(self) -> str:
+        return f'<DeleteReport type={self.asset_type.name} deleted={len(self.deleted)} failed={len(self.failed)}>'
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __bool__(self) -> bool:
+        return all(error is None for error in self.results.values())
+
+    @property
+    def deleted(self) -> List[int]:
+        """List[:class:`int`]: The ids that were deleted."""
+        return [i for i, error in self.results.items() if error is None]
+
+    @property
+    def failed(self) -> Dict[int, HTTPException]:
+        """Dict[:class:`int`, :class:`HTTPException`]: The ids that could not be deleted, with their error."""
+        return {i: error for i, error in self.results.items() if error is not None}
@@ -0,0 +1,469 @@
+"""
+The MIT License (MIT)
+Copyright (c) 2015-present Rapptz
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+from .resolver import normalize_name
+
+__all__ = (
+    'ResponseCache',
+    'MemoryCache',
+    'AutocompleteCache',
+)
+
+_MISSING = object()
+
+def make_key(method: str, url: str, queries: dict = None) -> str:
+    """Returns the cache key of a request: method, URL and sorted query string.
+
+    Empty query values are dropped, so an unset filter and an empty one
+    share a key.
+    """
+    if queries:
+        query = urlencode(sorted((k, v) for k, v in queries.items() if v not in (None, '')))
+        if query:
+            return f'{method} {url}?{query}'
+    return f'{method} {url}'
+
+def endpoint_name(url: str) -> str:
+    """Returns the first path segment of an API URL or key, e.g. ``grids``."""
+    path = urlsplit(url.split(' ', 1)[-1]).path
+    if '/api/v2/' in path:
+        path = path.split('/api/v2/', 1)[1]
+    return path.strip('/').split('/', 1)[0]
+
+def _default_path() -> str:
+    base = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'steamgriddy', 'responses.sqlite')
+
+
+class CacheEntry:
+    """A response body stored in a :class:`ResponseCache`.
+
+    Attributes
+    -----------
+    body: :class:`bytes`
+        The raw JSON body of the response.
+    etag: Optional[:class:`str`]
+        The ``ETag`` header sent with the response.
+    last_modified: Optional[:class:`str`]
+        The ``Last-Modified`` header sent with the response.
+    expires_at: :class:`float`
+        UNIX timestamp after which the entry must be revalidated.
+    """
+
+    __slots__ = (
+        'body',
+        'etag',
+        'last_modified',
+        'expires_at',
+    )
+
+    def __init__(self, body: bytes, etag: Optional[str], last_modified: Optional[str], expires_at: float) -> None:
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+
+    def __repr__(self) -> str:
+        return f'<CacheEntry size={len(self.body)} fresh={self.is_fresh()}>'
+
+    def is_fresh(self) -> bool:
+        """:class:`bool`: Returns whether the entry can be used without revalidation."""
+        return time.time() < self.expires_at
+
+    def validators(self) -> Dict[str, str]:
+        """Dict[:class:`str`, :class:`str`]: Returns the conditional request headers."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Persistent SQLite cache of successful ``GET`` responses.
+
+    Entries expire after a time-to-live picked from the first path segment of
+    the endpoint (``games``, ``grids``, ``search``...). Expired entries that
+    carry an ``ETag`` or ``Last-Modified`` header are revalidated with a
+    conditional request instead of being fetched again. When the cache grows
+    past ``max_size`` bytes the least recently used entries are evicted.
+
+    The cache is safe to share between threads, and between processes thanks
+    to SQLite's locking.
+
+    Parameters
+    -----------
+    path: Optional[:class:`str`]
+        The database file. Defaults to ``~/.cache/steamgriddy/responses.sqlite``
+        (or under ``$XDG_CACHE_HOME``).
+    ttls: Optional[Dict[:class:`str`, :class:`float`]]
+        Time-to-live in seconds per endpoint, merged over :attr:`DEFAULT_TTLS`.
+    default_ttl: :class:`float`
+        Time-to-live of endpoints missing from ``ttls``. Defaults to one day.
+    max_size: :class:`int`
+        Maximum total size of the stored bodies in bytes. Defaults to 256 MiB.
+    """
+
+    DEFAULT_TTLS: Dict[str, float] = {
+        'games': 7 * 86400,
+        'grids': 86400,
+        'heroes': 86400,
+        'logos': 86400,
+        'icons': 86400,
+        'search': 86400,
+    }
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 86400,
+        max_size: int = 256 * 1024 * 1024,
+    ) -> None:
+        self.path = path or _default_path()
+        self.ttls = dict(self.DEFAULT_TTLS, **(ttls or {}))
+        self.default_ttl = default_ttl
+        self.max_size = max_size
+
+        if self.path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            'key TEXT PRIMARY KEY, body BLOB NOT NULL, etag TEXT, last_modified TEXT, '
+            'stored_at REAL NOT NULL, accessed_at REAL NOT NULL, size INTEGER NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)')
+        self._size = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def __repr__(self) -> str:
+        return f'<ResponseCache path={self.path!r} size={self._size}>'
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+    def ttl_for(self, url: str) -> float:
+        """:class:`float`: Returns the time-to-live of responses from ``url``."""
+        return self.ttls.get(endpoint_name(url), self.default_ttl)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Returns the entry stored under ``key``, fresh or not."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (time.time(), key))
+
+        body, etag, last_modified, stored_at = row
+        return CacheEntry(body, etag, last_modified, stored_at + self.ttl_for(key))
+
+    def set(self, key: str, body: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
+        """Stores a response body under ``key``."""
+        now = time.time()
+        size = len(body)
+        with self._lock:
+            old = self._conn.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (key, body, etag, last_modified, now, now, size)
+            )
+            self._size += size - (old[0] if old else 0)
+            if self._size > self.max_size:
+                self._evict()
+
+    def refresh(self, key: str) -> None:
+        """Restarts the time-to-live of ``key`` after a ``304 Not Modified``."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?',
+                (now, now, key)
+            )
+
+    def _evict(self) -> None:
+        # Drops least recently used entries until the cache is at 90% of its
+        # budget, so eviction does not run again on the very next insert.
+        target = self.max_size * 0.9
+        rows = self._conn.execute('SELECT key, size FROM responses ORDER BY accessed_at')
+        evicted = []
+        for key, size in rows:
+            if self._size <= target:
+                break
+            evicted.append((key,))
+            self._size -= size
+        self._conn.executemany('DELETE FROM responses WHERE key = ?', evicted)
+
+    def invalidate(self, prefix: str = '') -> None:
+        """Removes every entry whose key starts with ``prefix``, or all of them."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+            self._size = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+
+    def close(self) -> None:
+        """Closes the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+
+class MemoryCache:
+    """Bounded in-process memo of decoded API responses.
+
+    Entries are keyed on the endpoint plus normalized query (see
+    :func:`make_key`), expire after ``ttl`` seconds and the least recently
+    used entry is dropped once ``maxsize`` entries are stored. Only game and
+    asset-list lookups are memoized, see :attr:`ENDPOINTS`.
+
+    Parameters
+    -----------
+    maxsize: :class:`int`
+        Maximum number of memoized responses. Defaults to 4096.
+    ttl: :class:`float`
+        Time-to-live of an entry in seconds. Defaults to 10 minutes.
+
+    Attributes
+    -----------
+    hits: :class:`int`
+        Number of lookups answered from memory.
+    misses: :class:`int`
+        Number of lookups that had to go further.
+    """
+
+    ENDPOINTS = frozenset(('games', 'grids', 'heroes', 'logos', 'icons'))
+
+    __slots__ = (
+        'maxsize',
+        'ttl',
+        'hits',
+        'misses',
+        '_entries',
+        '_lock',
+    )
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 600) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'<MemoryCache size={len(self._entries)} hits={self.hits} misses={self.misses}>'
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def accepts(self, key: str) -> bool:
+        """:class:`bool`: Returns whether responses for ``key`` are memoized."""
+        return endpoint_name(key) in self.ENDPOINTS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns the value memoized under ``key``, or ``default``."""
+        with self._lock:
+            item = self._entries.get(key, _MISSING)
+            if item is not _MISSING:
+                expires_at, value = item
+                if time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: str, value: Any) -> None:
+        """Memoizes ``value`` under ``key``."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str = '') -> None:
+        """Drops every entry whose key starts with ``prefix``, or all of them."""
+        with self._lock:
+            if not prefix:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+
+
+class _TrieNode:
+    __slots__ = ('children', 'entry')
+
+    def __init__(self) -> None:
+        self.children: Dict[str, '_TrieNode'] = {}
+        # (stored_at, results, complete) of the term ending here
+        self.entry: Optional[Tuple[float, List[dict], bool]] = None
+
+
+class AutocompleteCache:
+    """Prefix trie of past ``/search/autocomplete`` results.
+
+    A term is answered from its own fresh entry, or by filtering the results
+    of its longest cached prefix whose result list was complete, i.e. shorter
+    than the API's result ``limit``. Terms and game names are normalized the
+    same way (see :func:`resolver.normalize_name`) and matched by substring;
+    since the API's matching is fuzzy, a prefix that yields no game is
+    treated as a miss rather than as an empty answer.
+
+    Parameters
+    -----------
+    ttl: :class:`float`
+        Time-to-live of an entry in seconds. Defaults to 1 hour.
+    maxsize: :class:`int`
+        Maximum number of cached terms; the oldest are dropped first.
+        Defaults to 4096.
+    limit: :class:`int`
+        Most results the API returns for one term. A result list this long
+        may be truncated and is never filtered. Defaults to 10.
+
+    Attributes
+    -----------
+    hits: :class:`int`
+        Number of terms answered from their own entry.
+    prefix_hits: :class:`int`
+        Number of terms answered by filtering a prefix's entry.
+    misses: :class:`int`
+        Number of terms that needed a request.
+    """
+
+    __slots__ = (
+        'ttl',
+        'maxsize',
+        'limit',
+        'hits',
+        'prefix_hits',
+        'misses',
+        '_root',
+        '_terms',
+        '_lock',
+    )
+
+    def __init__(self, ttl: float = 3600, maxsize: int = 4096, limit: int = 10) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.limit = limit
+        self.hits = 0
+        self.prefix_hits = 0
+        self.misses = 0
+        self._root = _TrieNode()
+        self._terms: 'OrderedDict[str, None]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f'<AutocompleteCache size={len(self._terms)} hits={self.hits} '
+            f'prefix_hits={self.prefix_hits} misses={self.misses}>'
+        )
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    @staticmethod
+    def normalize(term: str) -> str:
+        """:class:`str`: Returns the term lowercased, without accents or punctuation."""
+        return normalize_name(term)
+
+    def get(self, term: str) -> Optional[List[dict]]:
+        """Returns the cached results of ``term``, ``None`` on a miss."""
+        term = self.normalize(term)
+        now = time.time()
+        with self._lock:
+            node = self._root
+            best = None
+            for depth, char in enumerate(term):
+                node = node.children.get(char)
+                if node is None:
+                    break
+                entry = node.entry
+                if entry is None:
+                    continue
+                if now - entry[0] >= self.ttl:
+                    self._drop(term[:depth + 1])
+                    continue
+                if depth + 1 == len(term):
+                    self.hits += 1
+                    return list(entry[1])
+                if entry[2]:
+                    best = entry
+            games = [] if best is None else [
+                game for game in best[1] if term in self.normalize(game.get('name') or '')
+            ]
+            if not games:
+                self.misses += 1
+                return None
+            self.prefix_hits += 1
+            return games
+
+    def set(self, term: str, results: List[dict]) -> None:
+        """Stores the API results of ``term``."""
+        term = self.normalize(term)
+        if not term:
+            return
+        with self._lock:
+            node = self._root
+            for char in term:
+                node = node.children.setdefault(char, _TrieNode())
+            node.entry = (time.time(), list(results), len(results) < self.limit)
+            self._terms[term] = None
+            self._terms.move_to_end(term)
+            while len(self._terms) > self.maxsize:
+                self._drop(next(iter(self._terms)))
+
+    def _drop(self, term: str) -> None:
+        # Clears the entry of ``term`` and prunes the branch it leaves empty.
+        self._terms.pop(term, None)
+        path = [self._root]
+        for char in term:
+            node = path[-1].children.get(char)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].entry = None
+        for depth in range(len(term), 0, -1):
+            node = path[depth]
+            if node.entry is not None or node.children:
+                break
+            del path[depth - 1].children[term[depth - 1]]
+
+    def invalidate(self) -> None:
+        """Drops every entry."""
+        with self._lock:
+            self._root = _TrieNode()
+            self._terms.clear()
@@ -0,0 +1,82 @@
+"""
+The MIT License (MIT)
+Copyright (c) 2015-present Rapptz
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+__all__ = (
+    'get_decoder',
+)
+
+Decoder = Callable[[bytes], Any]
+
+def _json_loads(content: bytes) -> Any:
+    return json.loads(content)
+
+def _msgspec_loads(decode: Decoder) -> Decoder:
+    def loads(content: bytes) -> Any:
+        try:
+            return decode(content)
+        except msgspec.DecodeError as e:
+            # Callers only expect the stdlib's ValueError.
+            raise ValueError(str(e)) from e
+    return loads
+
+def _decoders() -> dict:
+    decoders = {'json': _json_loads}
+    if msgspec is not None:
+        decoders['msgspec'] = _msgspec_loads(msgspec.json.Decoder().decode)
+    if orjson is not None:
+        decoders['orjson'] = orjson.loads
+    return decoders
+
+def get_decoder(name: Optional[str] = None) -> Decoder:
+    """Returns a function decoding a JSON response body straight from bytes.
+
+    Parameters
+    -----------
+    name: Optional[:class:`str`]
+        ``'orjson'``, ``'msgspec'`` or ``'json'``. Defaults to the fastest
+        one installed, in that order.
+
+    Raises
+    --------
+    ValueError
+        If the requested decoder is not installed.
+    """
+    decoders = _decoders()
+    if name is None:
+        for name in ('orjson', 'msgspec', 'json'):
+            if name in decoders:
+                break
+    try:
+        return decoders[name]
+    except KeyError:
+        raise ValueError(f'JSON decoder {name!r} is not available.') from None
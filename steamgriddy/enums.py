@@ -26,6 +26,8 @@ __all__ = [
     'StyleType',
     'MimeType',
     'ImageType',
+    'AssetType',
+    'SlotType',
 ]
 
 class PlatformType(Enum):
@@ -73,3 +75,14 @@ class AssetType(Enum):
 
     def __str__(self) -> str:
         return self.name
+
+
+class SlotType(Enum):
+    Capsule = 'capsule'
+    Wide = 'wide'
+    Hero = 'hero'
+    Logo = 'logo'
+    Icon = 'icon'
+
+    def __str__(self) -> str:
+        return self.name
@@ -0,0 +1,447 @@
+"""
+The MIT License (MIT)
+Copyright (c) 2015-present Rapptz
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+"""A local stand-in for the SteamGridDB v2 API, for benchmarks and manual testing.
+
+Run it standalone with ``python -m steamgriddy.fakeserver --port 8080`` and
+point a client at it with ``SteamGridDB(key, base_url='http://127.0.0.1:8080/api/v2')``.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import socket
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+__all__ = (
+    'FakeSteamGridDB',
+)
+
+class _Server(ThreadingHTTPServer):
+    # The default listen backlog of 5 makes the kernel drop connections of
+    # concurrent clients, which then retry after a second and skew timings
+    request_queue_size = 128
+
+ASSET_PATHS = ('grids', 'heroes', 'logos', 'icons')
+DIMENSIONS = {
+    'grids': ('600x900', '460x215', '920x430', '342x482', '660x930', '512x512'),
+    'heroes': ('1920x620', '3840x1240', '1600x650'),
+    'logos': ('512x512', '1024x512'),
+    'icons': ('32x32', '64x64', '256x256', '512x512'),
+}
+STYLES = {
+    'grids': ('alternate', 'blurred', 'white_logo', 'material', 'no_logo'),
+    'heroes': ('alternate', 'blurred', 'material'),
+    'logos': ('official', 'white', 'black', 'custom'),
+    'icons': ('official', 'custom'),
+}
+MIMES = ('image/png', 'image/jpeg', 'image/webp')
+WORDS = (
+    'Half', 'Life', 'Portal', 'Dark', 'Souls', 'Hollow', 'Knight', 'Stardew', 'Valley',
+    'Celeste', 'Hades', 'Doom', 'Eternal', 'Witcher', 'Wild', 'Hunt', 'Risk', 'Rain',
+    'Slay', 'Spire', 'Terraria', 'Factorio', 'Rocket', 'League', 'Crysis', 'Wars',
+)
+
+_ROUTE = re.compile(r'^/api/v2/(?P<path>.*?)/?$')
+
+
+class FakeSteamGridDB:
+    """An in-process fake of the SteamGridDB v2 API served over local HTTP.
+
+    Games and assets are generated deterministically from ``seed``. Steam app
+    ids ``10, 20, 30...`` map to SteamGridDB game ids ``appid + 1000000``;
+    every ``missing_every``-th app id is unknown and answers ``404``.
+
+    .. container:: operations
+        .. describe:: with x
+            Starts the server and stops it on exit.
+
+    Parameters
+    -----------
+    games: :class:`int`
+        Number of games in the catalogue. Defaults to 10000.
+    assets_per_game: :class:`int`
+        Number of assets of each type per game. Defaults to 8.
+    latency: :class:`float`
+        Seconds added to every response. Defaults to 0.
+    jitter: :class:`float`
+        Up to this many extra seconds are added at random. Defaults to 0.
+    error_rate: :class:`float`
+        Probability of answering ``500``. Defaults to 0.
+    throttle_rate: :class:`float`
+        Probability of answering ``429`` with ``Retry-After``. Defaults to 0.
+    retry_after: :class:`float`
+        The ``Retry-After`` value of throttled responses. Defaults to 0.
+    missing_every: :class:`int`
+        Every n-th app id is unknown to the fake. Defaults to 25, 0 disables.
+    foreign_every: :class:`int`
+        Asset ids divisible by this belong to someone else and deleting them
+        answers ``403``. Defaults to 0, which disables it.
+    auth_key: Optional[:class:`str`]
+        Require this bearer token. Defaults to accepting any token.
+    host: :class:`str`
+        Interface to listen on. Defaults to ``127.0.0.1``.
+    port: :class:`int`
+        Port to listen on. Defaults to a free port.
+    seed: :class:`int`
+        Seed of the generated catalogue and of the injected failures.
+
+    Attributes
+    -----------
+    requests: :class:`collections.Counter`
+        Number of requests received per endpoint, e.g. ``'GET grids/game'``.
+    """
+
+    PAGE_SIZE = 50
+    GAME_ID_OFFSET = 1000000
+
+    def __init__(
+        self,
+        games: int = 10000,
+        assets_per_game: int = 8,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 0,
+        missing_every: int = 25,
+        foreign_every: int = 0,
+        auth_key: Optional[str] = None,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        seed: int = 0,
+    ) -> None:
+        self.games = games
+        self.assets_per_game = assets_per_game
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.missing_every = missing_every
+        self.foreign_every = foreign_every
+        self.auth_key = auth_key
+        self.seed = seed
+        self.requests: Counter = Counter()
+        self.deleted: set = set()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = _Server((host, port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    def __enter__(self) -> 'FakeSteamGridDB':
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def __repr__(self) -> str:
+        return f'<FakeSteamGridDB base_url={self.base_url} games={self.games}>'
+
+    @property
+    def base_url(self) -> str:
+        """:class:`str`: The URL to pass as ``base_url`` to a client."""
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}/api/v2'
+
+    @property
+    def total_requests(self) -> int:
+        """:class:`int`: Number of requests received so far."""
+        return sum(self.requests.values())
+
+    def app_ids(self, count: Optional[int] = None) -> List[int]:
+        """List[:class:`int`]: Returns the Steam app ids of the first ``count`` games."""
+        return [10 * (i + 1) for i in range(self.games if count is None else count)]
+
+    def start(self) -> None:
+        """Starts serving in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops serving and closes the socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def reset(self) -> None:
+        """Clears the request counters and restores deleted assets."""
+        with self._lock:
+            self.requests.clear()
+            self.deleted.clear()
+
+    # Catalogue
+
+    def _known_app_id(self, app_id: int) -> bool:
+        if app_id <= 0 or app_id % 10 or app_id // 10 > self.games:
+            return False
+        return not (self.missing_every and (app_id // 10) % self.missing_every == 0)
+
+    def game(self, game_id: int) -> Optional[dict]:
+        """Returns the payload of a SteamGridDB game id, or ``None``."""
+        app_id = game_id - self.GAME_ID_OFFSET
+        if not self._known_app_id(app_id):
+            return None
+        rng = random.Random(self.seed * 1000003 + game_id)
+        return {
+            'id': game_id,
+            'name': ' '.join(rng.sample(WORDS, rng.randint(1, 3))) + f' {app_id}',
+            'release_date': rng.randint(946684800, 1700000000),
+            'types': ['steam'],
+            'verified': rng.random() < 0.8,
+        }
+
+    def assets(self, kind: str, game_id: int) -> List[dict]:
+        """Returns every asset payload of type ``kind`` for a SteamGridDB game id."""
+        if self.game(game_id) is None:
+            return []
+        index = ASSET_PATHS.index(kind)
+        rng = random.Random(self.seed * 1000003 + game_id * 4 + index)
+        assets = []
+        for n in range(self.assets_per_game):
+            asset_id = (game_id * 4 + index) * 1000 + n
+            if asset_id in self.deleted:
+                continue
+            author = rng.randint(1, 500)
+            width, height = (int(i) for i in rng.choice(DIMENSIONS[kind]).split('x'))
+            mime = rng.choice(MIMES)
+            assets.append({
+                'id': asset_id,
+                'score': rng.randint(-5, 50),
+                'style': rng.choice(STYLES[kind]),
+                'width': width,
+                'height': height,
+                'nsfw': rng.random() < 0.03,
+                'humor': rng.random() < 0.05,
+                'notes': None,
+                'mime': mime,
+                'language': 'en',
+                'url': f'https://cdn.example.invalid/{kind}/{asset_id}.{mime.split("/")[1]}',
+                'thumb': f'https://cdn.example.invalid/{kind}/thumb/{asset_id}.{mime.split("/")[1]}',
+                'lock': False,
+                'epilepsy': rng.random() < 0.01,
+                'upvotes': rng.randint(0, 40),
+                'downvotes': rng.randint(0, 5),
+                'author': {
+                    'name': f'artist{author}',
+                    'steam64': str(76561197960265728 + author),
+                    'avatar': f'https://avatars.example.invalid/{author}.jpg',
+                },
+            })
+        return assets
+
+    @staticmethod
+    def _filter(assets: List[dict], query: Dict[str, List[str]]) -> List[dict]:
+        def values(name):
+            raw = query.get(name, [''])[0]
+            return set(raw.split(',')) if raw else None
+
+        dimensions, styles, mimes = values('dimensions'), values('styles'), values('mimes')
+        nsfw = query.get('nsfw', ['false'])[0]
+        humor = query.get('humor', ['false'])[0]
+        selected = []
+        for asset in assets:
+            if dimensions and f"{asset['width']}x{asset['height']}" not in dimensions:
+                continue
+            if styles and asset['style'] not in styles:
+                continue
+            if mimes and asset['mime'] not in mimes:
+                continue
+            if nsfw != 'any' and asset['nsfw'] != (nsfw == 'true'):
+                continue
+            if humor != 'any' and asset['humor'] != (humor == 'true'):
+                continue
+            selected.append(asset)
+        return selected
+
+    # Request handling
+
+    def _inject_failure(self) -> Optional[tuple]:
+        with self._lock:
+            roll = self._random.random()
+        if roll < self.throttle_rate:
+            return 429, {'success': False, 'errors': ['Too many requests']}, {'Retry-After': str(self.retry_after)}
+        if roll < self.throttle_rate + self.error_rate:
+            return 500, {'success': False, 'errors': ['Internal server error']}, {}
+        return None
+
+    def _dispatch(self, method: str, path: str, query: Dict[str, List[str]]) -> tuple:
+        parts = [unquote(p) for p in path.split('/')]
+        not_found = (404, {'success': False, 'errors': ['Game not found']}, {})
+
+        if method == 'GET' and len(parts) == 3 and parts[0] == 'games':
+            if parts[1] == 'steam' and parts[2].isdigit():
+                game = self.game(int(parts[2]) + self.GAME_ID_OFFSET)
+            elif parts[1] == 'id' and parts[2].isdigit():
+                game = self.game(int(parts[2]))
+            else:
+                game = None
+            return (200, {'success': True, 'data': game}, {}) if game else not_found
+
+        if method == 'GET' and len(parts) == 3 and parts[0] == 'search' and parts[1] == 'autocomplete':
+            term = parts[2].lower()
+            matches = []
+            for app_id in self.app_ids():
+                game = self.game(app_id + self.GAME_ID_OFFSET)
+                if game and term in game['name'].lower():
+                    matches.append(game)
+                    if len(matches) == 20:
+                        break
+            return 200, {'success': True, 'data': matches}, {}
+
+        if len(parts) >= 2 and parts[0] in ASSET_PATHS:
+            kind = parts[0]
+            if method == 'DELETE' and len(parts) == 2:
+                asset_ids = [int(i) for i in parts[1].split(',') if i.isdigit()]
+                if self.foreign_every and any(i % self.foreign_every == 0 for i in asset_ids):
+                    return 403, {'success': False, 'errors': ['You do not own this asset']}, {}
+                with self._lock:
+                    self.deleted.update(asset_ids)
+                return 200, {'success': True, 'data': []}, {}
+
+            if method == 'GET' and len(parts) == 3 and parts[1] == 'game' and parts[2].isdigit():
+                game_id = int(parts[2])
+                if self.game(game_id) is None:
+                    return not_found
+                page = int(query.get('page', ['0'])[0] or 0)
+                assets = self._filter(self.assets(kind, game_id), query)
+                return 200, {
+                    'success': True,
+                    'page': page,
+                    'total': len(assets),
+                    'limit': self.PAGE_SIZE,
+                    'data': assets[page * self.PAGE_SIZE:(page + 1) * self.PAGE_SIZE],
+                }, {}
+
+            if method == 'GET' and len(parts) == 3 and parts[1] == 'steam':
+                app_ids = [int(i) for i in parts[2].split(',') if i.isdigit()]
+                results = []
+                for app_id in app_ids:
+                    if self._known_app_id(app_id):
+                        assets = self._filter(self.assets(kind, app_id + self.GAME_ID_OFFSET), query)
+                        results.append({'success': True, 'status': 200, 'data': assets})
+                    else:
+                        results.append({'success': False, 'status': 404, 'errors': ['Game not found']})
+                if len(app_ids) == 1:
+                    return (200, {'success': True, 'data': results[0]['data']}, {}) if results[0]['success'] else not_found
+                return 200, {'success': True, 'data': results}, {}
+
+        return 404, {'success': False, 'errors': ['Unknown endpoint']}, {}
+
+    def _handler(self) -> type:
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self) -> None:
+                super().setup()
+                # Headers and body are written separately; without this the
+                # client's delayed ACK adds ~40ms to every keep-alive response
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def _respond(self, method: str) -> None:
+                url = urlsplit(self.path)
+                match = _ROUTE.match(url.path)
+                path = match.group('path') if match else ''
+                endpoint = '/'.join(path.split('/')[:1 if method == 'DELETE' else 2])
+                with fake._lock:
+                    fake.requests[f'{method} {endpoint}'] += 1
+
+                delay = fake.latency + (fake._random.random() * fake.jitter if fake.jitter else 0)
+                if delay:
+                    time.sleep(delay)
+
+                if fake.auth_key and self.headers.get('Authorization') != f'Bearer {fake.auth_key}':
+                    status, payload, headers = 401, {'success': False, 'errors': ['Unauthorized']}, {}
+                else:
+                    status, payload, headers = fake._inject_failure() or fake._dispatch(
+                        method, path, parse_qs(url.query, keep_blank_values=True)
+                    )
+
+                body = json.dumps(payload).encode()
+                if status == 200 and method == 'GET':
+                    etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                    headers = dict(headers, ETag=etag)
+                    if self.headers.get('If-None-Match') == etag:
+                        status, body = 304, b''
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if status != 304:
+                    self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                self._respond('GET')
+
+            def do_DELETE(self) -> None:
+                self._respond('DELETE')
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for the SteamGridDB v2 API")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--games', type=int, default=10000)
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Up to this many extra seconds at random")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Probability of a 500 response")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="Probability of a 429 response")
+    parser.add_argument('--retry-after', type=float, default=0, help="Retry-After of 429 responses")
+    args = parser.parse_args()
+
+    fake = FakeSteamGridDB(
+        games=args.games,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Serving fake SteamGridDB API at {fake.base_url}")
+    try:
+        fake._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        fake._server.server_close()
+
+
+if __name__ == '__main__':
+    main()
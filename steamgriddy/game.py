@@ -18,11 +18,16 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
+import json
+import threading
 from datetime import datetime
-from typing import Iterator, Tuple, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Any
+
+from .resolver import NameResolver
 
 __all__ = (
     'Game',
+    'GameRegistry',
 )
 
 class Game:
@@ -67,9 +72,22 @@ class Game:
         '_release_date'
     )
 
-    def __init__(self, payload: dict) -> None:
-        self._payload = payload
+    # Attribute -> payload key of the fields decoded on first access when lazy
+    _FIELDS: Dict[str, str] = {
+        'name': 'name',
+        'id': 'id',
+        'types': 'types',
+        'verified': 'verified',
+        '_release_date': 'release_date',
+        'release_date': 'release_date',
+    }
+
+    def __init__(self, payload: dict, keep_payload: bool = True, lazy: bool = False) -> None:
+        if lazy:
+            self._payload = payload
+            return
         self._from_data(payload)
+        self._payload = payload if keep_payload else None
 
     def _from_data(self, game: dict):
         self.name = game.get('name')
@@ -79,6 +97,16 @@ class Game:
         self._release_date = game.get('release_date', None)
         self.release_date = datetime.fromtimestamp(game['release_date']) if self._release_date else None
 
+    def __getattr__(self, name: str) -> Any:
+        key = self._FIELDS.get(name)
+        if key is None or self._payload is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = self._payload.get(key)
+        if name == 'release_date' and value:
+            value = datetime.fromtimestamp(value)
+        setattr(self, name, value)
+        return value
+
     def __str__(self) -> str:
         return self.name
     
@@ -99,5 +127,176 @@ class Game:
                     yield (attr, value)
 
     def to_json(self) -> dict:
-        """:class:`dict`: Returns a JSON-compatible representation of the author."""
-        return self._payload
+        """:class:`dict`: Returns a JSON-compatible representation of the game."""
+        if self._payload is not None:
+            return self._payload
+        return {
+            'id': self.id,
+            'name': self.name,
+            'release_date': self._release_date,
+            'types': self.types,
+            'verified': self.verified,
+        }
+
+
+
+def _steam_appid(platform: Optional[str], platform_id: Any) -> Optional[int]:
+    if platform != 'steam' or platform_id is None or not str(platform_id).isdigit():
+        return None
+    return int(platform_id)
+
+class GameRegistry:
+    """Identity map of :class:`Game` objects.
+
+    Every game is held once, indexed by its SteamGridDB id and by each
+    platform id it was looked up with, so repeated lookups return the same
+    object without an API call. Each client owns one, see
+    :attr:`SteamGridDB.games`.
+
+    .. container:: operations
+        .. describe:: len(x)
+            Returns the number of games.
+        .. describe:: game_id in x
+            Checks whether a SteamGridDB game id is known.
+        .. describe:: iter(x)
+            Returns an iterator of the games.
+
+    Parameters
+    -----------
+    keep_payload: :class:`bool`
+        Passed on to the :class:`Game` objects.
+    lazy: :class:`bool`
+        Passed on to the :class:`Game` objects.
+
+    Attributes
+    -----------
+    names: :class:`NameResolver`
+        Fuzzy name index of every registered game.
+    """
+
+    VERSION = 1
+
+    __slots__ = (
+        '_games',
+        '_platform_ids',
+        '_lock',
+        'keep_payload',
+        'lazy',
+        'names',
+    )
+
+    def __init__(self, keep_payload: bool = True, lazy: bool = False) -> None:
+        self._games: Dict[int, Game] = {}
+        self._platform_ids: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self.names = NameResolver()
+        self.keep_payload = keep_payload
+        self.lazy = lazy
+
+    def __repr__(self) -> str:
+        return f'<GameRegistry games={len(self)} platform_ids={len(self._platform_ids)}>'
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def __contains__(self, game_id: int) -> bool:
+        return game_id in self._games
+
+    def __iter__(self) -> Iterator[Game]:
+        return iter(list(self._games.values()))
+
+    def add(self, payload: dict, platform: Optional[str] = None, platform_id: Any = None) -> Game:
+        """Registers a game dict and returns its shared :class:`Game`.
+
+        A game already known by its id is returned as is. When ``platform``
+        and ``platform_id`` are given the game is also indexed by them.
+        """
+        game_id = payload.get('id')
+        with self._lock:
+            game = self._games.get(game_id)
+            if game is None:
+                game = self._games[game_id] = Game(payload, self.keep_payload, self.lazy)
+            if platform is not None and platform_id is not None:
+                self._platform_ids[(platform, str(platform_id))] = game_id
+        self.names.add(payload.get('name'), game_id, _steam_appid(platform, platform_id))
+        return game
+
+    def link(self, game_id: int, platform: str, platform_id: Any) -> None:
+        """Indexes a known game by one more platform id."""
+        with self._lock:
+            self._platform_ids[(platform, str(platform_id))] = game_id
+        game = self._games.get(game_id)
+        app_id = _steam_appid(platform, platform_id)
+        if game is not None and app_id is not None:
+            self.names.add(game.name, game_id, app_id)
+
+    def get(self, game_id: int) -> Optional[Game]:
+        """Optional[:class:`Game`]: Returns a game by SteamGridDB id, ``None`` if unknown."""
+        return self._games.get(game_id)
+
+    def by_platform(self, platform: str, platform_id: Any) -> Optional[Game]:
+        """Optional[:class:`Game`]: Returns a game by platform id, e.g. ``('steam', 220)``."""
+        game_id = self._platform_ids.get((platform, str(platform_id)))
+        return self._games.get(game_id) if game_id is not None else None
+
+    def platform_ids(self, game_id: int) -> List[Tuple[str, str]]:
+        """List[Tuple[:class:`str`, :class:`str`]]: Returns the ``(platform, id)`` pairs known for a game."""
+        return [key for key, value in self._platform_ids.items() if value == game_id]
+
+    def links(self) -> List[Tuple[str, str, int]]:
+        """List[Tuple[:class:`str`, :class:`str`, :class:`int`]]: Returns every ``(platform, platform_id, game_id)`` link."""
+        with self._lock:
+            return [
+                (platform, platform_id, game_id)
+                for (platform, platform_id), game_id in self._platform_ids.items()
+            ]
+
+    def to_json(self) -> dict:
+        """:class:`dict`: Returns every game and platform id as a JSON-compatible dict."""
+        with self._lock:
+            return {
+                'version': self.VERSION,
+                'games': [game.to_json() for game in self._games.values()],
+                'platform_ids': [
+                    [platform, platform_id, game_id]
+                    for (platform, platform_id), game_id in self._platform_ids.items()
+                ],
+            }
+
+    def update(self, data: dict) -> None:
+        """Merges the output of :meth:`to_json` into this registry.
+
+        Raises
+        --------
+        ValueError
+            If ``data`` was written by an unsupported version.
+        """
+        if data.get('version') != self.VERSION:
+            raise ValueError(f'Unsupported game registry version {data.get("version")!r}.')
+        for payload in data.get('games', []):
+            self.add(payload)
+        for platform, platform_id, game_id in data.get('platform_ids', []):
+            if game_id in self._games:
+                self.link(game_id, platform, platform_id)
+
+    def save(self, path: str) -> None:
+        """Writes every game and platform id to a JSON file."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_json(), f)
+
+    def load(self, path: str) -> None:
+        """Merges games and platform ids saved by :meth:`save`.
+
+        Raises
+        --------
+        ValueError
+            If the file was written by an unsupported version.
+        """
+        with open(path, encoding='utf-8') as f:
+            self.update(json.load(f))
+
+    def clear(self) -> None:
+        """Forgets every game."""
+        with self._lock:
+            self._games.clear()
+            self._platform_ids.clear()
@@ -18,65 +18,247 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
-import requests
-from typing import List
+import asyncio
+import time
+from typing import Any, List, Optional, Union
+
+from .ratelimit import RateLimiter, Backoff
+from .cache import ResponseCache, MemoryCache, AutocompleteCache, make_key
+from .author import AuthorRegistry
+from .game import GameRegistry
+from .singleflight import SingleFlight, AsyncSingleFlight
+from .decoder import get_decoder
+from .transport import (
+    Response,
+    TransportError,
+    Transport,
+    AsyncTransport,
+    RequestsTransport,
+    AiohttpTransport
+)
+
+__all__ = (
+    'HTTPException',
+    'HTTPClient',
+    'AsyncHTTPClient',
+)
+
+_MISSING = object()
 
 class HTTPException(Exception):
-    """Exception raised when the HTTP request fails."""
-    pass
+    """Exception raised when the HTTP request fails.
+
+    Attributes
+    -----------
+    status: Optional[:class:`int`]
+        The HTTP status code of the failed response, if any.
+    """
+
+    def __init__(self, message: str, status: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status = status
 
 class HTTPClient:
 
     BASE_URL = 'https://www.steamgriddb.com/api/v2'
 
-    def __init__(self, auth_key: str):
-        self.session = requests.Session()
+    def __init__(
+        self,
+        auth_key: str,
+        rate_limiter: Optional[RateLimiter] = None,
+        backoff: Optional[Backoff] = None,
+        cache: Union[bool, str, ResponseCache, None] = None,
+        memo: Union[bool, MemoryCache, None] = None,
+        transport: Optional[Transport] = None,
+        decoder: Optional[str] = None,
+        keep_payload: bool = True,
+        base_url: Optional[str] = None,
+        lazy: bool = False,
+        autocomplete: Union[bool, AutocompleteCache, None] = None
+    ):
+        self.transport = transport if transport is not None else self._default_transport()
+        if base_url is not None:
+            self.BASE_URL = base_url.rstrip('/')
         self.auth_key = auth_key
-        self.session.headers.update({'Authorization': 'Bearer ' + self.auth_key})
+        self.keep_payload = keep_payload
+        self.lazy = lazy
+        self.authors = AuthorRegistry(keep_payload, lazy)
+        self.games = GameRegistry(keep_payload, lazy)
+        self._loads = get_decoder(decoder)
+        self.rate_limiter = rate_limiter
+        self.backoff = backoff if backoff is not None else Backoff()
+        self.cache = self._make_cache(cache)
+        self.memo = self._make_memo(memo)
+        self.autocomplete = self._make_autocomplete(autocomplete)
+        self._inflight = SingleFlight()
 
-    def get(self, endpoint: str, queries: dict = None) -> dict:
-        if queries:
-            responce = self.session.get(endpoint, params=queries)
-        else:
-            responce = self.session.get(endpoint)
+    @staticmethod
+    def _default_transport() -> Transport:
+        return RequestsTransport()
 
-        try: 
-            payload = responce.json()
-        except requests.exceptions.JSONDecodeError:
-            raise Exception('Responce JSON Decode Error')
+    @staticmethod
+    def _make_cache(cache: Union[bool, str, ResponseCache, None]) -> Optional[ResponseCache]:
+        if cache is None or cache is False:
+            return None
+        if cache is True:
+            return ResponseCache()
+        if isinstance(cache, str):
+            return ResponseCache(cache)
+        return cache
 
-        if not payload['success']:
-            error_context = payload['errors'][0]
-            raise HTTPException(f'API Error: ({responce.status_code}) {error_context}')
+    @staticmethod
+    def _make_memo(memo: Union[bool, MemoryCache, None]) -> Optional[MemoryCache]:
+        if memo is True:
+            return MemoryCache()
+        if isinstance(memo, MemoryCache):
+            return memo
+        return None
 
-        return payload['data'] if payload else None
+    @staticmethod
+    def _make_autocomplete(autocomplete: Union[bool, AutocompleteCache, None]) -> Optional[AutocompleteCache]:
+        if autocomplete is True:
+            return AutocompleteCache()
+        if isinstance(autocomplete, AutocompleteCache):
+            return autocomplete
+        return None
 
-    def post(self, endpoint: str, body: dict = None) -> dict:
-        responce = self.session.post(endpoint, data=body)
-        try: 
-            payload = responce.json()
-        except requests.exceptions.JSONDecodeError:
+    def set_auth_key(self, auth_key: str) -> None:
+        self.auth_key = auth_key
+
+    def _headers(self, extra: dict = None) -> dict:
+        headers = {'Authorization': 'Bearer ' + self.auth_key}
+        if extra:
+            headers.update(extra)
+        return headers
+
+    def _retry_delay(self, attempt: int, method: str, status: int = None, headers: dict = None) -> Optional[float]:
+        # Returns how long to wait before retrying, or None to give up.
+        if not self.backoff.should_retry(attempt, method, status):
+            return None
+
+        retry_after = Backoff.parse_retry_after(headers.get('Retry-After')) if headers else None
+        delay = self.backoff.delay(attempt, retry_after)
+        if retry_after is not None and self.rate_limiter is not None:
+            # The whole client is being throttled, not just this request.
+            self.rate_limiter.pause(delay)
+        return delay
+
+    def _unwrap(self, status: int, payload: dict) -> dict:
+        if not payload or not payload.get('success', None):
+            errors = payload.get('errors') if payload else None
+            error_context = errors[0] if errors else ''
+            raise HTTPException(f'API Error: ({status}) {error_context}', status)
+
+        return payload.get('data')
+
+    def _decode(self, status: int, content: bytes) -> dict:
+        try:
+            return self._loads(content)
+        except ValueError:
+            if status >= 400:
+                raise HTTPException(f'API Error: ({status})', status)
             raise Exception('Responce JSON Decode Error')
 
-        is_success = payload.get('success', None)
-        if not is_success:
-            error_context = payload['errors'][0] if payload else ''
-            raise HTTPException(f'API Error: ({responce.status_code}) {error_context}')
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        queries: dict = None,
+        body: dict = None,
+        headers: dict = None
+    ) -> Response:
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            try:
+                responce = self.transport.request(
+                    method, endpoint, params=queries or None, data=body, headers=self._headers(headers)
+                )
+            except TransportError as e:
+                delay = self._retry_delay(attempt, method)
+                if delay is None:
+                    raise HTTPException(f'Connection Error: {e}') from e
+            else:
+                delay = self._retry_delay(attempt, method, responce.status, responce.headers)
+                if delay is None:
+                    return responce
+
+            time.sleep(delay)
+            attempt += 1
+
+    def _memo_key(self, method: str, endpoint: str, queries: dict = None) -> Optional[str]:
+        if self.memo is None or method != 'GET':
+            return None
+        key = make_key(method, endpoint, queries)
+        return key if self.memo.accepts(key) else None
+
+    def _deleted(self, endpoint: str) -> None:
+        # Deleted assets may be part of any memoized or cached list of that type.
+        prefix = 'GET ' + endpoint.rsplit('/', 1)[0] + '/'
+        if self.memo is not None:
+            self.memo.invalidate(prefix)
+        if self.cache is not None:
+            self.cache.invalidate(prefix)
+
+    def request(self, method: str, endpoint: str, queries: dict = None, body: dict = None) -> dict:
+        memo_key = self._memo_key(method, endpoint, queries)
+        if memo_key is not None:
+            data = self.memo.get(memo_key, _MISSING)
+            if data is not _MISSING:
+                return data
+
+        if method == 'GET':
+            # Identical GETs already in flight on other threads share one request.
+            key = memo_key if memo_key is not None else make_key(method, endpoint, queries)
+            data = self._inflight.do(key, self._get, endpoint, queries)
+        else:
+            responce = self._send(method, endpoint, queries, body)
+            data = self._unwrap(responce.status, self._decode(responce.status, responce.content))
+            if method == 'DELETE':
+                self._deleted(endpoint)
+
+        if memo_key is not None:
+            self.memo.set(memo_key, data)
+        return data
+
+    def _get(self, endpoint: str, queries: dict = None) -> dict:
+        if self.cache is not None:
+            return self._cached_get(endpoint, queries)
+
+        responce = self._send('GET', endpoint, queries)
+        return self._unwrap(responce.status, self._decode(responce.status, responce.content))
+
+    def _cached_get(self, endpoint: str, queries: dict = None) -> dict:
+        key = make_key('GET', endpoint, queries)
+        entry = self.cache.get(key)
+        if entry is not None and entry.is_fresh():
+            return self._unwrap(200, self._decode(200, entry.body))
 
-        return payload['data'] if payload else None
+        validators = entry.validators() if entry is not None else None
+        responce = self._send('GET', endpoint, queries, headers=validators)
+        if responce.status == 304 and entry is not None:
+            self.cache.refresh(key)
+            return self._unwrap(200, self._decode(200, entry.body))
+
+        data = self._unwrap(responce.status, self._decode(responce.status, responce.content))
+        self.cache.set(
+            key, responce.content, responce.headers.get('ETag'), responce.headers.get('Last-Modified')
+        )
+        return data
+
+    def get(self, endpoint: str, queries: dict = None) -> dict:
+        return self.request('GET', endpoint, queries=queries)
+
+    def post(self, endpoint: str, body: dict = None) -> dict:
+        return self.request('POST', endpoint, body=body)
     
     def delete(self, endpoint: str) -> dict:
-        responce = self.session.delete(endpoint)
-        try: 
-            payload = responce.json()
-        except requests.exceptions.JSONDecodeError:
-            raise Exception('Responce JSON Decode Error')
-
-        if not payload['success']:
-            error_context = payload['errors'][0]
-            raise HTTPException(f'API Error: ({responce.status_code}) {error_context}')
+        return self.request('DELETE', endpoint)
 
-        return payload['data'] if payload else None
+    def close(self) -> None:
+        self.transport.close()
 
     def get_game(self, game_id: int, request_type: str) -> dict:
         if request_type == 'steam':
@@ -102,7 +284,7 @@ class HTTPClient:
 
     def delete_grid(self, grid_ids: List[int]):
         url = self.BASE_URL + '/grids/' + ','.join(str(i) for i in grid_ids)
-        self.delete(url)
+        return self.delete(url)
     
     def get_hero(
         self, 
@@ -120,7 +302,7 @@ class HTTPClient:
 
     def delete_hero(self, hero_ids: List[int]):
         url = self.BASE_URL + '/heroes/' + ','.join(str(i) for i in hero_ids)
-        self.delete(url)
+        return self.delete(url)
     
     def get_logo(
         self, 
@@ -138,7 +320,7 @@ class HTTPClient:
 
     def delete_logo(self, logo_ids: List[int]):
         url = self.BASE_URL + '/logos/' + ','.join(str(i) for i in logo_ids)
-        self.delete(url)
+        return self.delete(url)
     
     def get_icon(self, game_ids: List[int], request_type: str, platform: str = None, queries: dict = None) -> List[dict]:
         if request_type == 'game':
@@ -150,9 +332,107 @@ class HTTPClient:
 
     def delete_icon(self, logo_ids: List[int]):
         url = self.BASE_URL + '/icons/' + ','.join(str(i) for i in logo_ids)
-        self.delete(url)
+        return self.delete(url)
 
     def search_games(self, term: str) -> List[dict]:
         url = self.BASE_URL + '/search/autocomplete/' + term
 
-        return self.get(url)
\ No newline at end of file
+        return self.get(url)
+
+
+class AsyncHTTPClient(HTTPClient):
+    """:class:`HTTPClient` counterpart built on :mod:`asyncio`.
+
+    Only the transport is different: every endpoint helper inherited from
+    :class:`HTTPClient` returns a coroutine instead of the decoded data, so
+    many lookups can be kept in flight on a single event loop. It takes the
+    same arguments, except that ``transport`` is an :class:`AsyncTransport`;
+    the default one requires ``aiohttp``.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._inflight = AsyncSingleFlight()
+
+    @staticmethod
+    def _default_transport() -> AsyncTransport:
+        return AiohttpTransport()
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        queries: dict = None,
+        body: dict = None,
+        headers: dict = None
+    ) -> Response:
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+
+            try:
+                responce = await self.transport.request(
+                    method, endpoint, params=queries or None, data=body, headers=self._headers(headers)
+                )
+            except TransportError as e:
+                delay = self._retry_delay(attempt, method)
+                if delay is None:
+                    raise HTTPException(f'Connection Error: {e}') from e
+            else:
+                delay = self._retry_delay(attempt, method, responce.status, responce.headers)
+                if delay is None:
+                    return responce
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def request(self, method: str, endpoint: str, queries: dict = None, body: dict = None) -> dict:
+        memo_key = self._memo_key(method, endpoint, queries)
+        if memo_key is not None:
+            data = self.memo.get(memo_key, _MISSING)
+            if data is not _MISSING:
+                return data
+
+        if method == 'GET':
+            # Identical GETs already in flight on this loop share one request.
+            key = memo_key if memo_key is not None else make_key(method, endpoint, queries)
+            data = await self._inflight.do(key, self._get, endpoint, queries)
+        else:
+            responce = await self._send(method, endpoint, queries, body)
+            data = self._unwrap(responce.status, self._decode(responce.status, responce.content))
+            if method == 'DELETE':
+                self._deleted(endpoint)
+
+        if memo_key is not None:
+            self.memo.set(memo_key, data)
+        return data
+
+    async def _get(self, endpoint: str, queries: dict = None) -> dict:
+        if self.cache is not None:
+            return await self._cached_get(endpoint, queries)
+
+        responce = await self._send('GET', endpoint, queries)
+        return self._unwrap(responce.status, self._decode(responce.status, responce.content))
+
+    async def _cached_get(self, endpoint: str, queries: dict = None) -> dict:
+        # SQLite lookups are local and short, so they run on the loop directly.
+        key = make_key('GET', endpoint, queries)
+        entry = self.cache.get(key)
+        if entry is not None and entry.is_fresh():
+            return self._unwrap(200, self._decode(200, entry.body))
+
+        validators = entry.validators() if entry is not None else None
+        responce = await self._send('GET', endpoint, queries, headers=validators)
+        if responce.status == 304 and entry is not None:
+            self.cache.refresh(key)
+            return self._unwrap(200, self._decode(200, entry.body))
+
+        data = self._unwrap(responce.status, self._decode(responce.status, responce.content))
+        self.cache.set(
+            key, responce.content, responce.headers.get('ETag'), responce.headers.get('Last-Modified')
+        )
+        return data
+
+    async def close(self) -> None:
+        await self.transport.close()
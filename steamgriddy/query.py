@@ -0,0 +1,137 @@
+"""
+The MIT License (MIT)
+Copyright (c) 2015-present Rapptz
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import re
+from enum import Enum
+from typing import Optional, Sequence, Tuple, Type
+
+from .enums import StyleType, MimeType, ImageType
+
+__all__ = (
+    'AssetQuery',
+)
+
+_DIMENSION = re.compile(r'[0-9]+x[0-9]+')
+
+def _encode(name: str, values: Sequence, enum: Optional[Type[Enum]], hint: str) -> str:
+    # Raw strings go through the enum, so a typo fails here instead of
+    # silently matching no asset.
+    if not isinstance(values, (list, tuple)):
+        raise TypeError(f'\'{name}\' must be a list of {hint}.')
+    encoded = []
+    for value in values:
+        if not isinstance(value, str if enum is None else (enum, str)):
+            raise TypeError(f'\'{name}\' must be a list of {hint}.')
+        if enum is not None:
+            encoded.append(enum(value).value)
+        elif _DIMENSION.fullmatch(value):
+            encoded.append(value)
+        else:
+            raise ValueError(f'{value!r} is not a valid dimension, expected \'WIDTHxHEIGHT\'.')
+    return ','.join(encoded)
+
+class AssetQuery:
+    """The filters of an asset lookup, validated and encoded once.
+
+    Pass the same query to every ``get_*_by_gameid``/``get_*_by_platform``,
+    ``iter_*`` or :meth:`SteamGridDB.bulk_assets` call instead of keyword
+    filters to skip their per-call checks. Queries are immutable and
+    hashable, so they can be used as cache keys.
+
+    .. container:: operations
+        .. describe:: x == y
+            Checks if two queries encode the same filters.
+        .. describe:: hash(x)
+            Returns the query's hash.
+
+    Parameters
+    -----------
+    styles: List[:class:`StyleType`]
+        The styles of the assets. Defaults to all styles.
+    dimensions: List[:class:`str`]
+        The sizes of the assets. Defaults to all sizes.
+    mimes: List[:class:`MimeType`]
+        The mimes of the assets. Defaults to all mimes.
+    types: List[:class:`ImageType`]
+        The types of the assets. Defaults to all types.
+    is_nsfw: :class:`bool`
+        Whether or not the assets are NSFW. Defaults to False.
+    is_humor: :class:`bool`
+        Whether or not the assets are humor. Defaults to False.
+
+    Raises
+    --------
+    TypeError
+        If one of the parameters is not of the correct type.
+    ValueError
+        If a style, mime or type is not a value of its enum, or a
+        dimension is not of the form ``'WIDTHxHEIGHT'``.
+    """
+
+    __slots__ = (
+        '_params',
+        '_hash',
+    )
+
+    def __init__(
+        self,
+        styles: Sequence[StyleType] = (),
+        dimensions: Sequence[str] = (),
+        mimes: Sequence[MimeType] = (),
+        types: Sequence[ImageType] = (),
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+    ) -> None:
+        if not isinstance(is_nsfw, bool):
+            raise TypeError('\'is_nsfw\' must be a boolean.')
+        if not isinstance(is_humor, bool):
+            raise TypeError('\'is_humor\' must be a boolean.')
+
+        params: Tuple[Tuple[str, str], ...] = (
+            ('styles', _encode('styles', styles, StyleType, 'StyleType')),
+            ('dimensions', _encode('dimensions', dimensions, None, 'str')),
+            ('mimes', _encode('mimes', mimes, MimeType, 'MimeType')),
+            ('types', _encode('types', types, ImageType, 'ImageType')),
+            ('nsfw', str(is_nsfw).lower()),
+            ('humor', str(is_humor).lower()),
+        )
+        object.__setattr__(self, '_params', params)
+        object.__setattr__(self, '_hash', hash(params))
+
+    def __setattr__(self, name: str, value) -> None:
+        raise AttributeError('AssetQuery is immutable.')
+
+    def __repr__(self) -> str:
+        filters = ' '.join(f'{key}={value!r}' for key, value in self._params if value)
+        return f'<AssetQuery {filters}>'
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, AssetQuery) and self._params == other._params
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    @property
+    def params(self) -> dict:
+        """:class:`dict`: Returns the encoded query string parameters."""
+        return dict(self._params)
@@ -0,0 +1,354 @@
+"""
+The MIT License (MIT)
+Copyright (c) 2015-present Rapptz
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import heapq
+import weakref
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .asset import Asset
+from .author import AuthorRegistry
+from .enums import AssetType, SlotType
+from .table import AssetTable
+
+__all__ = (
+    'RankingPolicy',
+    'Ranker',
+    'DEFAULT_POLICIES',
+)
+
+def _preference(values: Sequence[str], weight: float) -> Dict[str, float]:
+    # The first preferred value earns the full weight, the last one 1/len of it.
+    count = len(values)
+    return {str(value): weight * (count - i) / count for i, value in enumerate(values)}
+
+class RankingPolicy:
+    """How the assets of one slot are filtered and scored.
+
+    The rank of an asset is the weighted sum of its score, its net votes,
+    the bonus of its dimensions, style and MIME type in their preference
+    lists and, when the ranker has an :class:`AuthorRegistry`, the mean
+    score of its author.
+
+    Parameters
+    -----------
+    asset_type: :class:`AssetType`
+        The asset type the slot is filled from.
+    dimensions: Sequence[:class:`str`]
+        Preferred ``'WIDTHxHEIGHT'`` sizes, best first.
+    require_dimensions: :class:`bool`
+        Drop assets of any other size. Defaults to ``False``.
+    styles: Sequence[:class:`str`]
+        Preferred styles, best first.
+    mimes: Sequence[:class:`str`]
+        Preferred MIME types, best first.
+    allow_authors: Optional[Iterable[:class:`str`]]
+        Only keep assets of these ``steam64`` ids.
+    deny_authors: Iterable[:class:`str`]
+        Drop assets of these ``steam64`` ids.
+    allow_nsfw, allow_humor, allow_epilepsy: :class:`bool`
+        Keep flagged assets. Defaults to ``False``.
+    min_score: Optional[:class:`int`]
+        Drop assets scoring below this.
+    score_weight, vote_weight, dimension_weight, style_weight, mime_weight, author_weight: :class:`float`
+        Weights of the rank terms.
+    """
+
+    __slots__ = (
+        'asset_type',
+        'dimensions',
+        'require_dimensions',
+        'styles',
+        'mimes',
+        'allow_authors',
+        'deny_authors',
+        'allow_nsfw',
+        'allow_humor',
+        'allow_epilepsy',
+        'min_score',
+        'score_weight',
+        'vote_weight',
+        'dimension_weight',
+        'style_weight',
+        'mime_weight',
+        'author_weight',
+    )
+
+    def __init__(
+        self,
+        asset_type: AssetType,
+        dimensions: Sequence[str] = (),
+        require_dimensions: bool = False,
+        styles: Sequence[str] = (),
+        mimes: Sequence[str] = (),
+        allow_authors: Optional[Iterable[str]] = None,
+        deny_authors: Iterable[str] = (),
+        allow_nsfw: bool = False,
+        allow_humor: bool = False,
+        allow_epilepsy: bool = False,
+        min_score: Optional[int] = None,
+        score_weight: float = 1.0,
+        vote_weight: float = 1.0,
+        dimension_weight: float = 100.0,
+        style_weight: float = 10.0,
+        mime_weight: float = 5.0,
+        author_weight: float = 0.0,
+    ) -> None:
+        if not isinstance(asset_type, AssetType):
+            raise TypeError('\'asset_type\' must be an AssetType.')
+        self.asset_type = asset_type
+        self.dimensions = tuple(dimensions)
+        self.require_dimensions = require_dimensions
+        self.styles = tuple(getattr(style, 'value', style) for style in styles)
+        self.mimes = tuple(getattr(mime, 'value', mime) for mime in mimes)
+        self.allow_authors = frozenset(allow_authors) if allow_authors is not None else None
+        self.deny_authors = frozenset(deny_authors)
+        self.allow_nsfw = allow_nsfw
+        self.allow_humor = allow_humor
+        self.allow_epilepsy = allow_epilepsy
+        self.min_score = min_score
+        self.score_weight = score_weight
+        self.vote_weight = vote_weight
+        self.dimension_weight = dimension_weight
+        self.style_weight = style_weight
+        self.mime_weight = mime_weight
+        self.author_weight = author_weight
+
+    def __repr__(self) -> str:
+        return f'<RankingPolicy asset_type={self.asset_type.name} dimensions={self.dimensions}>'
+
+DEFAULT_POLICIES: Dict[SlotType, RankingPolicy] = {
+    SlotType.Capsule: RankingPolicy(AssetType.Grid, dimensions=('600x900', '342x482', '660x930'), require_dimensions=True),
+    SlotType.Wide: RankingPolicy(AssetType.Grid, dimensions=('920x430', '460x215'), require_dimensions=True),
+    SlotType.Hero: RankingPolicy(AssetType.Hero, dimensions=('1920x620', '3840x1240', '1600x650')),
+    SlotType.Logo: RankingPolicy(AssetType.Logo, mimes=('image/png', 'image/webp')),
+    SlotType.Icon: RankingPolicy(AssetType.Icon, dimensions=('256x256', '512x512', '64x64', '32x32')),
+}
+
+def _policy_state(policy: RankingPolicy) -> tuple:
+    # Policies are mutable, so an index remembers the values it was built from
+    return tuple(getattr(policy, name) for name in RankingPolicy.__slots__)
+
+def _registry_version(policy: RankingPolicy, registry: Optional[AuthorRegistry]) -> int:
+    return registry.version if registry is not None and policy.author_weight else -1
+
+class _Index:
+    """The per-code lookups of one policy over one table, built once."""
+
+    __slots__ = ('rows', 'policy', 'state', 'registry', 'version', 'sizes', 'styles', 'mimes', 'authors', 'excluded')
+
+    def __init__(self, table: AssetTable, policy: RankingPolicy, registry: Optional[AuthorRegistry]) -> None:
+        self.rows = len(table)
+        self.policy = policy
+        self.state = _policy_state(policy)
+        # Author means are baked into ``authors``; -1 when they are unused
+        self.registry = registry
+        self.version = _registry_version(policy, registry)
+
+        self.sizes: Dict[Tuple[int, int], float] = {}
+        for dimension, bonus in _preference(policy.dimensions, policy.dimension_weight).items():
+            width, height = (int(i) for i in dimension.split('x'))
+            self.sizes[(width, height)] = bonus
+
+        style_bonus = _preference(policy.styles, policy.style_weight)
+        self.styles = [style_bonus.get(style, 0.0) for style in table.styles]
+        mime_bonus = _preference(policy.mimes, policy.mime_weight)
+        self.mimes = [mime_bonus.get(mime, 0.0) for mime in table.mimes]
+
+        # None marks an excluded author
+        self.authors: List[Optional[float]] = []
+        for steam64 in table.authors:
+            if steam64 in policy.deny_authors or (
+                policy.allow_authors is not None and steam64 not in policy.allow_authors
+            ):
+                self.authors.append(None)
+            elif registry is not None and policy.author_weight:
+                self.authors.append(policy.author_weight * registry.mean_score(steam64))
+            else:
+                self.authors.append(0.0)
+
+        self.excluded = [
+            column for column, allowed in (
+                (table.nsfw, policy.allow_nsfw),
+                (table.humor, policy.allow_humor),
+                (table.epilepsy, policy.allow_epilepsy),
+            ) if not allowed
+        ]
+
+class Ranker:
+    """Picks the best asset of every slot from already fetched asset tables.
+
+    Fetch broadly once, e.g. with :meth:`SteamGridDB.bulk_asset_table`, then
+    change policies and re-rank without any API call. The per-code lookups
+    of each policy are computed once per table and reused for every game,
+    until the policy of the slot is replaced or changed or, with an
+    ``author_weight``, the author registry records more assets.
+
+    Parameters
+    -----------
+    policies: Optional[Dict[:class:`SlotType`, :class:`RankingPolicy`]]
+        Policies overriding :data:`DEFAULT_POLICIES`.
+    authors: Optional[:class:`AuthorRegistry`]
+        Source of the author mean scores used by ``author_weight``, e.g.
+        :attr:`SteamGridDB.authors`.
+    """
+
+    __slots__ = (
+        'policies',
+        'authors',
+        '_indexes',
+    )
+
+    def __init__(
+        self,
+        policies: Optional[Dict[SlotType, RankingPolicy]] = None,
+        authors: Optional[AuthorRegistry] = None,
+    ) -> None:
+        self.policies = dict(DEFAULT_POLICIES)
+        if policies:
+            self.policies.update(policies)
+        self.authors = authors
+        # Indexes die with their table, so ranking many tables keeps none alive
+        self._indexes: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def __repr__(self) -> str:
+        return f'<Ranker slots={[slot.name for slot in self.policies]}>'
+
+    def _index(self, table: AssetTable, slot: SlotType) -> _Index:
+        policy = self.policies[slot]
+        indexes: Optional[Dict[SlotType, _Index]] = self._indexes.get(table)
+        if indexes is None:
+            indexes = self._indexes[table] = {}
+        index = indexes.get(slot)
+        if (
+            index is None
+            or index.rows != len(table)
+            or index.policy is not policy
+            or index.state != _policy_state(policy)
+            or index.registry is not self.authors
+            or index.version != _registry_version(policy, self.authors)
+        ):
+            index = indexes[slot] = _Index(table, policy, self.authors)
+        return index
+
+    def _table(self, tables: Union[AssetTable, Dict[AssetType, AssetTable]], slot: SlotType) -> Optional[AssetTable]:
+        asset_type = self.policies[slot].asset_type
+        if isinstance(tables, AssetTable):
+            if tables.type is not asset_type:
+                raise ValueError(f'{slot.name} is filled from {asset_type.name} assets, not {tables.type.name}.')
+            return tables
+        return tables.get(asset_type)
+
+    def rank(
+        self,
+        table: AssetTable,
+        slot: SlotType,
+        game_id: Optional[int] = None,
+        k: Optional[int] = None,
+    ) -> array:
+        """Ranks the rows of a table for a slot.
+
+        Parameters
+        -----------
+        table: :class:`AssetTable`
+            The assets to rank, of the slot's asset type.
+        slot: :class:`SlotType`
+            The slot to rank for.
+        game_id: Optional[:class:`int`]
+            Only rank the rows of this game. Defaults to every row.
+        k: Optional[:class:`int`]
+            Only return the ``k`` best rows.
+
+        Raises
+        --------
+        ValueError
+            If the table holds another asset type than the slot's.
+
+        Returns
+        --------
+        :class:`array.array`
+            The rows that pass the policy's filters, best first.
+        """
+        policy = self.policies[slot]
+        table = self._table(table, slot)
+        index = self._index(table, slot)
+        rows = table.rows() if game_id is None else table.games().get(game_id, ())
+
+        width, height, style, mime, author = table.width, table.height, table.style, table.mime, table.author
+        score, upvotes, downvotes = table.score, table.upvotes, table.downvotes
+        sizes, styles, mimes, authors, excluded = index.sizes, index.styles, index.mimes, index.authors, index.excluded
+        min_score, require_dimensions = policy.min_score, policy.require_dimensions
+        score_weight, vote_weight = policy.score_weight, policy.vote_weight
+
+        ranked = []
+        for row in rows:
+            author_bonus = authors[author[row]]
+            if author_bonus is None:
+                continue
+            if excluded and any(column[row] for column in excluded):
+                continue
+            if min_score is not None and score[row] < min_score:
+                continue
+            size_bonus = sizes.get((width[row], height[row]))
+            if size_bonus is None:
+                if require_dimensions:
+                    continue
+                size_bonus = 0.0
+            ranked.append((
+                score_weight * score[row]
+                + vote_weight * (upvotes[row] - downvotes[row])
+                + size_bonus + styles[style[row]] + mimes[mime[row]] + author_bonus,
+                -row,
+            ))
+
+        best = heapq.nlargest(k, ranked) if k is not None else sorted(ranked, reverse=True)
+        return array('l', (-row for _, row in best))
+
+    def best(
+        self,
+        tables: Union[AssetTable, Dict[AssetType, AssetTable]],
+        slot: SlotType,
+        game_id: Optional[int] = None,
+    ) -> Optional[Asset]:
+        """Optional[:class:`Asset`]: Returns the best asset of a game for a slot, ``None`` if nothing qualifies."""
+        table = self._table(tables, slot)
+        if table is None:
+            return None
+        rows = self.rank(table, slot, game_id, k=1)
+        return table.asset(rows[0]) if rows else None
+
+    def pick(
+        self,
+        tables: Dict[AssetType, AssetTable],
+        game_id: Optional[int] = None,
+        slots: Optional[Iterable[SlotType]] = None,
+    ) -> Dict[SlotType, Optional[Asset]]:
+        """Returns the best asset of a game for every slot, by default all slots with a policy."""
+        return {
+            slot: self.best(tables, slot, game_id)
+            for slot in (self.policies if slots is None else slots)
+        }
+
+    def rank_assets(self, assets: List[Asset], slot: SlotType) -> List[Asset]:
+        """Ranks a plain list of assets, e.g. the result of :meth:`SteamGridDB.get_grids_by_gameid`."""
+        if not assets:
+            return []
+        table = AssetTable.from_payloads(assets[0].type, (asset.to_json() for asset in assets), assets[0]._http)
+        return [assets[row] for row in self.rank(table, slot)]
@@ -0,0 +1,164 @@
+"""
+The MIT License (MIT)
+Copyright (c) 2015-present Rapptz
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+__all__ = (
+    'RateLimiter',
+    'Backoff',
+)
+
+class RateLimiter:
+    """A token bucket shared by every request of a client.
+
+    Tokens refill continuously at ``rate`` per second up to ``burst``. Each
+    request takes one token and sleeps if the bucket has run dry. The bucket
+    is thread-safe and can be awaited from an event loop, so the same limiter
+    may be shared between a :class:`SteamGridDB` and an :class:`AsyncSteamGridDB`.
+
+    Parameters
+    -----------
+    rate: :class:`float`
+        The sustained number of requests per second.
+    burst: Optional[:class:`int`]
+        How many requests may be sent back to back. Defaults to ``rate``
+        rounded up, with a minimum of one.
+    """
+
+    __slots__ = (
+        'rate',
+        'burst',
+        '_tokens',
+        '_updated',
+        '_paused_until',
+        '_lock',
+    )
+
+    def __init__(self, rate: float, burst: Optional[int] = None) -> None:
+        if rate <= 0:
+            raise ValueError('\'rate\' must be greater than zero.')
+
+        self.rate = float(rate)
+        self.burst = max(1, int(burst if burst is not None else -(-rate // 1)))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'<RateLimiter rate={self.rate} burst={self.burst}>'
+
+    def _reserve(self) -> float:
+        # Takes a token now and returns how long the caller must wait for it.
+        # The balance may go negative, which queues callers fairly.
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def acquire(self) -> None:
+        """Blocks until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Waits without blocking the event loop until a request may be sent."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Holds every request back for ``seconds``, e.g. after a ``429``."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class Backoff:
+    """Retry policy with jittered exponential backoff.
+
+    Parameters
+    -----------
+    max_retries: :class:`int`
+        How many times a request is retried before giving up. Defaults to 3.
+    base: :class:`float`
+        The backoff of the first retry in seconds. Doubles on every attempt.
+    cap: :class:`float`
+        The maximum backoff in seconds, not counting ``Retry-After``.
+    """
+
+    RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+    __slots__ = (
+        'max_retries',
+        'base',
+        'cap',
+    )
+
+    def __init__(self, max_retries: int = 3, base: float = 0.5, cap: float = 30.0) -> None:
+        self.max_retries = max_retries
+        self.base = base
+        self.cap = cap
+
+    def __repr__(self) -> str:
+        return f'<Backoff max_retries={self.max_retries} base={self.base} cap={self.cap}>'
+
+    def should_retry(self, attempt: int, method: str, status: Optional[int] = None) -> bool:
+        """Returns whether the attempt that got ``status`` should be retried.
+
+        A ``status`` of ``None`` means the connection failed. ``POST`` is only
+        retried on ``429`` because the server did not process it.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if status is not None and status not in self.RETRY_STATUSES:
+            return False
+        return method != 'POST' or status == 429
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Returns how long to sleep before retry number ``attempt + 1``."""
+        if retry_after is not None:
+            # Never retry before the server asked us to, but spread the
+            # waiters out so they do not come back at the same instant.
+            return retry_after + random.uniform(0, self.base)
+        return random.uniform(0, min(self.cap, self.base * 2 ** attempt))
+
+    @staticmethod
+    def parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Parses a ``Retry-After`` header given in seconds or as an HTTP date."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
@@ -0,0 +1,190 @@
+"""
+The MIT License (MIT)
+Copyright (c) 2015-present Rapptz
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import heapq
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+__all__ = (
+    'NameMatch',
+    'NameResolver',
+)
+
+_TRADEMARKS = re.compile('[™®©]')
+_NON_WORD = re.compile(r'[^0-9a-z]+')
+
+def normalize_name(name: str) -> str:
+    """Returns ``name`` lowercased, without accents, trademark signs or punctuation."""
+    name = unicodedata.normalize('NFKD', _TRADEMARKS.sub('', name))
+    name = ''.join(c for c in name if not unicodedata.combining(c)).lower().replace('&', ' and ')
+    return _NON_WORD.sub(' ', name).strip()
+
+def trigrams(name: str) -> Set[str]:
+    """Returns the character trigrams of a normalized name, padded at both ends."""
+    padded = f'  {name} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+class NameMatch:
+    """A game resolved from its name by :class:`NameResolver`.
+
+    Attributes
+    -----------
+    name: :class:`str`
+        The indexed name that matched.
+    score: :class:`float`
+        Trigram similarity between ``0`` and ``1``; ``1`` for an exact
+        normalized match.
+    game_id: Optional[:class:`int`]
+        The SteamGridDB game id, if known.
+    app_id: Optional[:class:`int`]
+        The Steam app id, if known.
+    """
+
+    __slots__ = (
+        'name',
+        'score',
+        'game_id',
+        'app_id',
+    )
+
+    def __init__(self, name: str, score: float, game_id: Optional[int], app_id: Optional[int]) -> None:
+        self.name = name
+        self.score = score
+        self.game_id = game_id
+        self.app_id = app_id
+
+    def __repr__(self) -> str:
+        return f'<NameMatch name={self.name!r} score={self.score:.2f} game_id={self.game_id} app_id={self.app_id}>'
+
+class NameResolver:
+    """Offline fuzzy index from game names to SteamGridDB and Steam ids.
+
+    Names are normalized and indexed by trigram; a lookup is an exact
+    dictionary hit or a Dice-coefficient ranking of the names sharing
+    trigrams with the query. The client's :class:`GameRegistry` feeds every
+    game it sees into its resolver, and installed Steam games can be added
+    with :meth:`add_installed`.
+
+    .. container:: operations
+        .. describe:: len(x)
+            Returns the number of indexed names.
+
+    Parameters
+    -----------
+    threshold: :class:`float`
+        Lowest similarity :meth:`resolve` accepts. Defaults to 0.6.
+    """
+
+    __slots__ = (
+        'threshold',
+        '_names',
+        '_ids',
+        '_grams',
+        '_exact',
+        '_postings',
+        '_lock',
+    )
+
+    def __init__(self, threshold: float = 0.6) -> None:
+        self.threshold = threshold
+        self._names: List[str] = []
+        self._ids: List[List[Optional[int]]] = []
+        self._grams: List[int] = []
+        self._exact: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'<NameResolver names={len(self)}>'
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, name: str, game_id: Optional[int] = None, app_id: Optional[int] = None) -> None:
+        """Indexes a name. Adding a known name fills in its missing ids."""
+        normalized = normalize_name(name or '')
+        if not normalized:
+            return
+        with self._lock:
+            doc = self._exact.get(normalized)
+            if doc is not None:
+                ids = self._ids[doc]
+                ids[0] = ids[0] if game_id is None else game_id
+                ids[1] = ids[1] if app_id is None else app_id
+                return
+            doc = self._exact[normalized] = len(self._names)
+            self._names.append(name)
+            self._ids.append([game_id, app_id])
+            grams = trigrams(normalized)
+            self._grams.append(len(grams))
+            for gram in grams:
+                self._postings[gram].append(doc)
+
+    def add_installed(self, games: Iterable[dict]) -> None:
+        """Indexes installed Steam games, as returned by ``steam_helpers.get_installed_games()``."""
+        for game in games:
+            self.add(game.get('name'), app_id=int(game['appid']) if game.get('appid') else None)
+
+    def lookup(self, name: str, limit: int = 5) -> List[NameMatch]:
+        """Returns up to ``limit`` indexed names most similar to ``name``, best first."""
+        normalized = normalize_name(name or '')
+        if not normalized:
+            return []
+        doc = self._exact.get(normalized)
+        if doc is not None and limit == 1:
+            return [self._match(doc, 1.0)]
+
+        grams = trigrams(normalized)
+        shared: Dict[int, int] = defaultdict(int)
+        postings = self._postings
+        for gram in grams:
+            for other in postings.get(gram, ()):
+                shared[other] += 1
+        sizes, query_size = self._grams, len(grams)
+        scored = heapq.nlargest(
+            limit,
+            ((2.0 * count / (query_size + sizes[other]), other) for other, count in shared.items()),
+        )
+        if doc is not None:
+            scored = [(1.0, doc)] + [item for item in scored if item[1] != doc][:limit - 1]
+        return [self._match(other, score) for score, other in scored]
+
+    def resolve(self, name: str, threshold: Optional[float] = None) -> Optional[NameMatch]:
+        """Optional[:class:`NameMatch`]: Returns the best match of ``name`` if it reaches the threshold."""
+        matches = self.lookup(name, limit=1)
+        minimum = self.threshold if threshold is None else threshold
+        return matches[0] if matches and matches[0].score >= minimum else None
+
+    def similarity(self, a: str, b: str) -> float:
+        """:class:`float`: Returns the trigram similarity of two names."""
+        a, b = normalize_name(a or ''), normalize_name(b or '')
+        if not a or not b:
+            return 0.0
+        if a == b:
+            return 1.0
+        grams_a, grams_b = trigrams(a), trigrams(b)
+        return 2.0 * len(grams_a & grams_b) / (len(grams_a) + len(grams_b))
+
+    def _match(self, doc: int, score: float) -> NameMatch:
+        game_id, app_id = self._ids[doc]
+        return NameMatch(self._names[doc], score, game_id, app_id)
@@ -0,0 +1,367 @@
+"""
+The MIT License (MIT)
+Copyright (c) 2015-present Rapptz
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import struct
+import sys
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .asset import Asset
+from .enums import AssetType
+from .game import Game
+from .author import Author
+from .table import AssetTable, _COLUMNS
+
+__all__ = (
+    'Snapshot',
+    'SnapshotError',
+)
+
+MAGIC = b'SGDS'
+VERSION = 2
+
+_HEADER = struct.Struct('<4sH')
+_COUNT = struct.Struct('<I')
+_ARRAY = struct.Struct('<cI')
+
+# On disk every integer column has a fixed width, whatever the platform's C long
+_DISK_TYPECODES = {'b': 'b', 'B': 'B', 'H': 'H', 'i': 'i', 'I': 'I', 'l': 'q', 'q': 'q'}
+
+class SnapshotError(Exception):
+    """Exception raised when a snapshot cannot be decoded."""
+    pass
+
+class _Writer:
+    __slots__ = ('parts',)
+
+    def __init__(self) -> None:
+        self.parts: List[bytes] = []
+
+    def count(self, n: int) -> None:
+        self.parts.append(_COUNT.pack(n))
+
+    def array(self, values: Union[array, Sequence[int]], typecode: str) -> None:
+        typecode = _DISK_TYPECODES[typecode]
+        if not isinstance(values, array) or values.typecode != typecode:
+            values = array(typecode, values)
+        if sys.byteorder == 'big':
+            values = array(typecode, values)
+            values.byteswap()
+        self.parts.append(_ARRAY.pack(typecode.encode(), len(values)))
+        self.parts.append(values.tobytes())
+
+    def strings(self, values: Sequence[Optional[str]]) -> None:
+        # The UTF-8 byte length of every string, -1 for None, then the
+        # concatenated UTF-8, so strings may hold any character.
+        encoded = [None if value is None else value.encode('utf-8') for value in values]
+        self.array([-1 if value is None else len(value) for value in encoded], 'i')
+        blob = b''.join(value for value in encoded if value)
+        self.count(len(blob))
+        self.parts.append(blob)
+
+    def getvalue(self) -> bytes:
+        return b''.join(self.parts)
+
+class _Reader:
+    __slots__ = ('data', 'offset')
+
+    def __init__(self, data: bytes) -> None:
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def _take(self, size: int) -> memoryview:
+        if self.offset + size > len(self.data):
+            raise SnapshotError('Snapshot is truncated.')
+        chunk = self.data[self.offset:self.offset + size]
+        self.offset += size
+        return chunk
+
+    def count(self) -> int:
+        return _COUNT.unpack(self._take(_COUNT.size))[0]
+
+    def array(self) -> array:
+        typecode, length = _ARRAY.unpack(self._take(_ARRAY.size))
+        values = array(typecode.decode())
+        values.frombytes(self._take(length * values.itemsize))
+        if sys.byteorder == 'big':
+            values.byteswap()
+        return values
+
+    def strings(self) -> List[Optional[str]]:
+        lengths = self.array()
+        blob = bytes(self._take(self.count()))
+        if sum(length for length in lengths if length > 0) != len(blob):
+            raise SnapshotError('Corrupt string column.')
+        try:
+            text = blob.decode('utf-8')
+        except UnicodeDecodeError:
+            raise SnapshotError('Corrupt string column.') from None
+        # Byte offsets are character offsets when the blob is ASCII
+        source = text if len(text) == len(blob) else blob
+        values: List[Optional[str]] = []
+        offset = 0
+        for length in lengths:
+            if length < 0:
+                values.append(None)
+                continue
+            value = source[offset:offset + length]
+            values.append(value if source is text else value.decode('utf-8'))
+            offset += length
+        return values
+
+def _code_typecode(strings: Sequence[Optional[str]]) -> str:
+    # Codes are 16-bit unless there are more distinct strings than that;
+    # arrays carry their typecode, so readers need not know which.
+    return 'H' if len(strings) <= 0x10000 else 'I'
+
+def _intern(values: Iterable[Optional[str]]) -> tuple:
+    table: List[Optional[str]] = []
+    index: Dict[Optional[str], int] = {}
+    codes: List[int] = []
+    for value in values:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(table)
+            table.append(value)
+        codes.append(code)
+    return table, array(_code_typecode(table), codes)
+
+def _tables_from_assets(assets: Dict[int, Dict[AssetType, List[Asset]]], http) -> List[AssetTable]:
+    tables: Dict[AssetType, AssetTable] = {}
+    for game_id, by_type in assets.items():
+        for asset_type, items in by_type.items():
+            table = tables.get(asset_type)
+            if table is None:
+                table = tables[asset_type] = AssetTable(asset_type, http)
+            table.extend((asset.to_json() for asset in items), game_id)
+    return list(tables.values())
+
+class Snapshot:
+    """A versioned, compact binary snapshot of fetched games and assets.
+
+    Assets are stored per :class:`AssetType` as the typed columns of an
+    :class:`AssetTable`, with every string interned or packed into a single
+    blob, so loading costs a few ``array.frombytes`` calls and the asset
+    dicts are only rebuilt for the rows that are turned into objects.
+
+    Use :meth:`SteamGridDB.dump_snapshot` and :meth:`SteamGridDB.load_snapshot`.
+
+    Attributes
+    -----------
+    games: List[:class:`Game`]
+        The games of the snapshot.
+    tables: Dict[:class:`AssetType`, :class:`AssetTable`]
+        The assets of the snapshot, by type. The ``game_id`` column holds the
+        id the assets were fetched under.
+    authors: List[:class:`Author`]
+        The distinct authors of the assets.
+    """
+
+    __slots__ = (
+        'games',
+        'tables',
+        'authors',
+    )
+
+    def __init__(self, games: List[Game], tables: Dict[AssetType, AssetTable], authors: List[Author]) -> None:
+        self.games = games
+        self.tables = tables
+        self.authors = authors
+
+    def __repr__(self) -> str:
+        rows = sum(len(table) for table in self.tables.values())
+        return f'<Snapshot games={len(self.games)} assets={rows} authors={len(self.authors)}>'
+
+    def assets(self) -> Dict[int, Dict[AssetType, List[Asset]]]:
+        """Builds the assets in the shape returned by :meth:`SteamGridDB.bulk_assets`."""
+        results: Dict[int, Dict[AssetType, List[Asset]]] = {}
+        for asset_type, table in self.tables.items():
+            for game_id, rows in table.games().items():
+                by_type = results.setdefault(game_id, {t: [] for t in self.tables})
+                by_type[asset_type] = table.assets(rows)
+        return results
+
+    @staticmethod
+    def dumps(
+        tables: Iterable[AssetTable] = (),
+        games: Iterable[Game] = (),
+        platform_ids: Iterable[Tuple[str, str, int]] = (),
+    ) -> bytes:
+        """Encodes asset tables and games.
+
+        Parameters
+        -----------
+        tables: Iterable[:class:`AssetTable`]
+            The asset tables.
+        games: Iterable[:class:`Game`]
+            The games.
+        platform_ids: Iterable[Tuple[:class:`str`, :class:`str`, :class:`int`]]
+            ``(platform, platform_id, game_id)`` links of the games, as
+            returned by :meth:`GameRegistry.links`. Links to other games
+            are dropped.
+
+        Returns
+        --------
+        :class:`bytes`
+            The snapshot.
+        """
+        tables = list(tables)
+        games = list(games)
+        w = _Writer()
+        w.parts.append(_HEADER.pack(MAGIC, VERSION))
+
+        # Games
+        payloads = [game.to_json() for game in games]
+        w.count(len(payloads))
+        w.array([p.get('id') or 0 for p in payloads], 'q')
+        w.array([p.get('release_date') or 0 for p in payloads], 'q')
+        w.array([-1 if p.get('verified') is None else int(bool(p.get('verified'))) for p in payloads], 'b')
+        w.strings([p.get('name') for p in payloads])
+        types, type_codes = _intern(
+            None if p.get('types') is None else '\x1f'.join(p['types']) for p in payloads
+        )
+        w.strings(types)
+        w.array(type_codes, type_codes.typecode)
+        game_ids = {p.get('id') for p in payloads}
+        links = [link for link in platform_ids if link[2] in game_ids]
+        platforms, platform_codes = _intern(platform for platform, _, _ in links)
+        w.strings(platforms)
+        w.array(platform_codes, platform_codes.typecode)
+        w.strings([str(platform_id) for _, platform_id, _ in links])
+        w.array([game_id for _, _, game_id in links], 'q')
+
+        # Authors shared by every table
+        author_index: Dict[tuple, int] = {}
+        authors: List[dict] = []
+        table_codes = []
+        for table in tables:
+            # Maps the table's own author codes to codes into ``authors``
+            shared = []
+            for author in table._author_payloads:
+                key = (author.get('steam64'), author.get('name'), author.get('avatar'))
+                code = author_index.get(key)
+                if code is None:
+                    code = author_index[key] = len(authors)
+                    authors.append(author)
+                shared.append(code)
+            table_codes.append(array('q', (shared[code] for code in table.author)))
+        w.strings([a.get('name') for a in authors])
+        w.strings([a.get('steam64') for a in authors])
+        w.strings([a.get('avatar') for a in authors])
+
+        # Asset tables
+        w.count(len(tables))
+        for table, author_codes in zip(tables, table_codes):
+            w.strings([table.type.value])
+            w.strings(table.mimes)
+            w.strings(table.styles)
+            for name, typecode in _COLUMNS:
+                w.array(getattr(table, name), typecode)
+            w.array(author_codes, 'q')
+            w.strings(table._url)
+            w.strings(table._thumb)
+            for strings, codes in ((table._languages, table._language), (table._notes_strings, table._notes)):
+                w.strings(strings)
+                w.array(codes, _code_typecode(strings))
+
+        return w.getvalue()
+
+    @classmethod
+    def loads(cls, data: bytes, http) -> 'Snapshot':
+        """Decodes a snapshot made by :meth:`dumps`.
+
+        Raises
+        --------
+        SnapshotError
+            If ``data`` is not a snapshot or was written by an unsupported version.
+
+        Returns
+        --------
+        :class:`Snapshot`
+            The games, asset tables and authors, bound to ``http``.
+        """
+        if len(data) < _HEADER.size:
+            raise SnapshotError('Not a snapshot.')
+        magic, version = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise SnapshotError('Not a snapshot.')
+        if version != VERSION:
+            raise SnapshotError(f'Unsupported snapshot version {version}.')
+        r = _Reader(data)
+        r.offset = _HEADER.size
+
+        # Games
+        count = r.count()
+        ids, release_dates, verified, names = r.array(), r.array(), r.array(), r.strings()
+        types, type_codes = r.strings(), r.array()
+        games = []
+        for i in range(count):
+            game_types = types[type_codes[i]]
+            payload = {
+                'id': ids[i],
+                'name': names[i],
+                'release_date': release_dates[i] or None,
+                'types': None if game_types is None else game_types.split('\x1f'),
+                'verified': None if verified[i] < 0 else bool(verified[i]),
+            }
+            games.append(http.games.add(payload))
+        platforms, platform_codes, links, link_games = r.strings(), r.array(), r.strings(), r.array()
+        if not len(platform_codes) == len(links) == len(link_games) or any(
+            code >= len(platforms) for code in platform_codes
+        ):
+            raise SnapshotError('Corrupt platform ids.')
+        for code, platform_id, game_id in zip(platform_codes, links, link_games):
+            if game_id in http.games:
+                http.games.link(game_id, platforms[code], platform_id)
+
+        # Authors
+        author_payloads = [
+            {'name': name, 'steam64': steam64, 'avatar': avatar}
+            for name, steam64, avatar in zip(r.strings(), r.strings(), r.strings())
+        ]
+        authors = [http.authors.get(payload) for payload in author_payloads]
+
+        # Asset tables
+        tables = {}
+        for _ in range(r.count()):
+            asset_type = AssetType(r.strings()[0])
+            table = AssetTable(asset_type, http)
+            table.mimes = r.strings()
+            table.styles = r.strings()
+            table._mime_index = {value: code for code, value in enumerate(table.mimes)}
+            table._style_index = {value: code for code, value in enumerate(table.styles)}
+            for name, _ in _COLUMNS:
+                setattr(table, name, r.array())
+            table.author = r.array()
+            table.authors = [a['steam64'] or a['name'] or '' for a in author_payloads]
+            table._author_index = {value: code for code, value in enumerate(table.authors)}
+            table._author_payloads = author_payloads
+            table._url, table._thumb = r.strings(), r.strings()
+            table._languages, table._language = r.strings(), r.array()
+            table._notes_strings, table._notes = r.strings(), r.array()
+            table._language_index = {value: code for code, value in enumerate(table._languages)}
+            table._notes_index = {value: code for code, value in enumerate(table._notes_strings)}
+            columns = [getattr(table, name) for name, _ in _COLUMNS]
+            columns += [table.author, table._thumb, table._language, table._notes]
+            if any(len(column) != len(table._url) for column in columns):
+                raise SnapshotError('Corrupt asset table.')
+            tables[asset_type] = table
+
+        return cls(games, tables, authors)
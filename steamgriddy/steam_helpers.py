@@ -2,12 +2,41 @@ import json
 import os
 import platform
 import requests
+import threading
+import time
 import vdf
 import xmltodict
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
-def get_steam_installation():
+from .appinfo import AppInfo, AppInfoError, read_shortcuts
+from .vdfparse import select_file
+
+# (connect, read) timeouts for requests to Steam
+STEAM_TIMEOUT = (5, 30)
+
+# First steam64 id; userdata folders are named after the offset from it
+STEAM_ID64_BASE = 76561197960265728
+
+# Seconds persona names fetched from steamcommunity.com are cached for
+PERSONA_CACHE_TTL = 7 * 86400
+
+_session = None
+
+def _http_session():
+    """Return the pooled session shared by every request to Steam."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        _session.mount('https://', adapter)
+        _session.mount('http://', adapter)
+    return _session
+
+def _find_steam_path():
     # Check if the STEAM environment variable is set
     steam_path = os.getenv("STEAM")
     if steam_path:
@@ -34,38 +63,427 @@ def get_steam_installation():
     # If no installation path is found
     raise FileNotFoundError("Could not find Steam installation")
 
+def _read_appmanifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            game_data = vdf.load(f)
+    except Exception as e:
+        print(f"Failed to read {path}: {e}")
+        return None
+    app_state = game_data.get('AppState', {})
+    name = app_state.get('name')
+    appid = app_state.get('appid')
+    if name and appid:
+        return {'name': name, 'appid': appid}
+    return None
+
+def _folder_device(folder):
+    try:
+        return os.stat(folder).st_dev
+    except OSError:
+        return None
+
+class ManifestScanner:
+    """Incremental scanner of the ``appmanifest_*.acf`` files of Steam libraries.
+
+    Manifests are listed with ``os.scandir`` and indexed by path, mtime and
+    size: a rescan only parses files that are new or changed since the last
+    one, and forgets deleted ones. Changed files are parsed on a thread pool
+    per drive, so libraries on different disks are read in parallel.
+
+    Parameters
+    -----------
+    workers_per_drive: int
+        Most manifests parsed at once on one drive.
+    """
+
+    def __init__(self, workers_per_drive=4):
+        self.workers_per_drive = workers_per_drive
+        self._index = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'<ManifestScanner manifests={len(self._index)}>'
+
+    def __len__(self):
+        return len(self._index)
+
+    def _list(self, folder):
+        try:
+            with os.scandir(folder) as it:
+                for entry in it:
+                    name = entry.name
+                    if name.startswith("appmanifest_") and name.endswith(".acf"):
+                        stat = entry.stat()
+                        yield entry.path, (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return
+
+    def _parse(self, path, key):
+        game = _read_appmanifest(path)
+        with self._lock:
+            self._index[path] = (key, game)
+        return game
+
+    def scan(self, folders):
+        """Yield the installed games of ``folders`` as ``{'name', 'appid'}`` dicts.
+
+        Unchanged manifests are yielded first, straight from the index, then
+        the others as soon as each one is parsed. Manifests that fail to
+        parse are reported and skipped.
+        """
+        folders = list(dict.fromkeys(os.path.normpath(folder) for folder in folders))
+        by_device = {}
+        for folder in folders:
+            by_device.setdefault(_folder_device(folder), []).append(folder)
+
+        seen = set()
+        changed = {}
+        for device, device_folders in by_device.items():
+            for folder in device_folders:
+                for path, key in self._list(folder):
+                    seen.add(path)
+                    cached = self._index.get(path)
+                    if cached is not None and cached[0] == key:
+                        if cached[1] is not None:
+                            yield dict(cached[1])
+                    else:
+                        changed.setdefault(device, []).append((path, key))
+
+        with self._lock:
+            for path in [path for path in self._index if os.path.dirname(path) in folders and path not in seen]:
+                del self._index[path]
+
+        if not changed:
+            return
+
+        executors = [ThreadPoolExecutor(max_workers=self.workers_per_drive) for _ in changed]
+        futures = []
+        try:
+            for executor, manifests in zip(executors, changed.values()):
+                for path, key in manifests:
+                    futures.append(executor.submit(self._parse, path, key))
+            for future in as_completed(futures):
+                game = future.result()
+                if game is not None:
+                    yield dict(game)
+        finally:
+            # Drops the parses still queued when the caller stops early
+            for future in futures:
+                future.cancel()
+            for executor in executors:
+                executor.shutdown(wait=True)
+
+    def clear(self):
+        """Forget every indexed manifest."""
+        with self._lock:
+            self._index.clear()
+
+# Key paths read with vdfparse instead of parsing whole files
+_ACCOUNTS = 'InstallConfigStore/Software/Valve/Steam/Accounts'
+_APPS = 'InstallConfigStore/Software/Valve/Steam/apps'
+_PERSONA_NAME = 'UserLocalConfigStore/friends/PersonaName'
+_USER_APPS = 'UserLocalConfigStore/Software/Valve/Steam/apps'
+
+# appinfo.vdf types of the apps shown in the library
+_LIBRARY_TYPES = {'game', 'application', 'tool', 'demo', 'mod'}
+
+def _close(data):
+    # Releases cached values holding a file, such as a memory-mapped AppInfo
+    close = getattr(data, 'close', None)
+    if close is not None:
+        close()
+
+def _load_text_vdf(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return vdf.load(f)
+
+class SteamInstallation:
+    """A local Steam installation whose VDF files are parsed at most once.
+
+    Every parsed file is cached with the ``st_mtime_ns`` and ``st_size``
+    it had when read, and is only parsed again once either changes, so
+    helpers asking for the same ``config.vdf`` or ``localconfig.vdf``
+    share one parse per process. The cache is thread-safe. A replaced or
+    invalidated AppInfo is closed, so do not keep one across changes to
+    appinfo.vdf.
+
+    Parameters
+    -----------
+    path: Optional[str]
+        The Steam directory. Defaults to the ``STEAM`` environment variable
+        or the first default location that exists.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or _find_steam_path()
+        self.manifests = ManifestScanner()
+        self._vdf_cache = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f'<SteamInstallation path={self.path!r} cached={len(self._vdf_cache)}>'
+
+    def load_vdf(self, path, select=None):
+        """Return the parsed VDF file at ``path``, re-parsing it only if it changed on disk.
+
+        With ``select``, a tuple of key paths, only those are read (see
+        vdfparse.select) and a dict of the values found is returned.
+        """
+        if select is None:
+            return self._load(path, path, _load_text_vdf)
+        return self._load(path, (path, select), lambda path: select_file(path, select))
+
+    def _load(self, path, cache_key, loader):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"{os.path.basename(path)} not found at {path}")
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._vdf_cache.get(cache_key)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            data = loader(path)
+        except Exception as e:
+            raise IOError(f"Failed to read {os.path.basename(path)}: {e}")
+
+        with self._lock:
+            cached = self._vdf_cache.get(cache_key)
+            if cached is not None and cached[0] == key:
+                # Another thread loaded the same version first
+                stale, data = data, cached[1]
+            else:
+                self._vdf_cache[cache_key] = (key, data)
+                stale = cached[1] if cached is not None else None
+        _close(stale)
+        return data
+
+    def invalidate(self):
+        """Forget every parsed file, closing the memory-mapped ones."""
+        with self._lock:
+            stale = [data for _, data in self._vdf_cache.values()]
+            self._vdf_cache.clear()
+        for data in stale:
+            _close(data)
+        self.manifests.clear()
+
+    @property
+    def config_path(self):
+        return os.path.join(self.path, "config", "config.vdf")
+
+    @property
+    def userdata_path(self):
+        return os.path.join(self.path, "userdata")
+
+    def config(self):
+        """Return the parsed ``config/config.vdf``."""
+        return self.load_vdf(self.config_path)
+
+    def accounts(self):
+        """Return the ``Accounts`` section of config.vdf, keyed by username."""
+        return self.load_vdf(self.config_path, (_ACCOUNTS,)).get(_ACCOUNTS, {})
+
+    def apps(self):
+        """Return the ``apps`` section of config.vdf, keyed by app id."""
+        return self.load_vdf(self.config_path, (_APPS,)).get(_APPS, {})
+
+    def user_ids(self):
+        """Return the account ids that have a ``userdata`` folder, skipping ``anonymous``."""
+        try:
+            return [folder for folder in os.listdir(self.userdata_path) if folder != "anonymous"]
+        except FileNotFoundError:
+            return []
+
+    def localconfig_path(self, user_id):
+        return os.path.join(self.userdata_path, str(user_id), "config", "localconfig.vdf")
+
+    def localconfig(self, user_id):
+        """Return the parsed ``userdata/<user_id>/config/localconfig.vdf``."""
+        return self.load_vdf(self.localconfig_path(user_id))
+
+    def played_apps(self, user_id):
+        """Return the ids of the apps listed in a user's localconfig.vdf, as strings."""
+        return list(self.load_vdf(self.localconfig_path(user_id), (_USER_APPS,)).get(_USER_APPS, {}))
+
+    def shortcuts(self, user_id):
+        """Return the non-Steam games of a user's shortcuts.vdf, empty if it has none."""
+        path = os.path.join(self.userdata_path, str(user_id), "config", "shortcuts.vdf")
+        if not os.path.exists(path):
+            return []
+        return self._load(path, path, read_shortcuts)
+
+    def appinfo(self):
+        """Return the AppInfo of ``appcache/appinfo.vdf``, ``None`` if there is none."""
+        path = os.path.join(self.path, "appcache", "appinfo.vdf")
+        if not os.path.exists(path):
+            return None
+        return self._load(path, path, AppInfo)
+
+    def persona_name(self, user_id):
+        """Return the persona name stored in a user's localconfig.vdf, ``None`` if missing."""
+        return self.load_vdf(self.localconfig_path(user_id), (_PERSONA_NAME,)).get(_PERSONA_NAME) or None
+
+    def grid_folder(self, user_id):
+        return os.path.join(self.userdata_path, str(user_id), "config", "grid")
+
+    @property
+    def librarycache_folder(self):
+        return os.path.join(self.path, "appcache", "librarycache")
+
+    def library_folders(self):
+        """Return the ``steamapps`` folder of every library, the main one first."""
+        library_data = self.load_vdf(os.path.join(self.path, "steamapps", "libraryfolders.vdf"))
+
+        library_folders = [os.path.join(self.path, "steamapps")]
+        additional_folders = library_data.get('libraryfolders', {})
+
+        for key, value in additional_folders.items():
+            if key.isdigit():
+                path = value.get('path')
+                if path:
+                    library_folders.append(os.path.join(path, "steamapps"))
+
+        return library_folders
+
+    def installed_games(self):
+        """Yield the installed games of every library, see ManifestScanner.scan."""
+        return self.manifests.scan(self.library_folders())
+
+_installation = None
+
+def get_installation():
+    """Return the shared SteamInstallation, rediscovering it if ``STEAM`` changed."""
+    global _installation
+    steam_path = os.getenv("STEAM")
+    if _installation is None or (steam_path and steam_path != _installation.path):
+        _installation = SteamInstallation(steam_path)
+    return _installation
+
+def get_steam_installation():
+    return get_installation().path
+
+def _steam_user(steam_username, data, profile_names):
+    steam_id = data.get('SteamID')
+    return {'username': steam_username, 'steam_id': steam_id, 'steam_profile_name': profile_names.get(steam_id)}
+
 def get_steam_users():
     """Retrieve Steam user names and IDs by parsing config.vdf."""
-    steam_path = get_steam_installation()
-    config_path = os.path.join(steam_path, "config", "config.vdf")
+    accounts = {
+        steam_username: data
+        for steam_username, data in get_installation().accounts().items()
+        if steam_username
+    }
+    profile_names = get_steam_profile_names(data.get('SteamID') for data in accounts.values())
+    return [_steam_user(steam_username, data, profile_names) for steam_username, data in accounts.items()]
+
+def _persona_cache_path():
+    base = os.getenv('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'steamgriddy', 'persona_names.json')
 
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"config.vdf not found at {config_path}")
+_persona_lock = threading.Lock()
 
+def _load_persona_cache():
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = vdf.load(f)
-    except Exception as e:
-        raise IOError(f"Failed to read config.vdf: {e}")
+        with open(_persona_cache_path(), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
 
-    users = []
-    user_data = config_data.get('InstallConfigStore', {}).get('Software', {}).get('Valve', {}).get('Steam', {}).get('Accounts', {})
-    
-    for steam_username, data in user_data.items():
-        steam_id = data.get('SteamID')
-        profile_name = get_steam_profile_name(steam_id)
-        if steam_username:
-            users.append({'username': steam_username, 'steam_id': steam_id, 'steam_profile_name': profile_name})
-    
-    return users
+def _save_persona_cache(cache):
+    path = _persona_cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+        os.replace(path + '.tmp', path)
+    except OSError:
+        pass
+
+def _local_persona_name(installation, steam_id):
+    # userdata folders are named after the 32-bit account id of the steam64 id
+    try:
+        account_id = int(steam_id) - STEAM_ID64_BASE
+    except (TypeError, ValueError):
+        return None
+    if account_id <= 0 or not os.path.exists(installation.localconfig_path(account_id)):
+        return None
+    try:
+        return installation.persona_name(account_id)
+    except IOError:
+        return None
+
+def get_steam_profile_names(steam_ids, max_workers=8):
+    """Resolve the persona names of several steam64 ids at once.
+
+    Names are read from the local ``userdata/<id>/config/localconfig.vdf``
+    files first. The remaining ids are looked up on the persistent cache,
+    then fetched concurrently from steamcommunity.com over the shared
+    session; fetched names are cached for ``PERSONA_CACHE_TTL`` seconds.
+
+    Parameters
+    -----------
+    steam_ids: iterable of str
+        The steam64 ids.
+    max_workers: int
+        Most profile pages fetched at once.
+
+    Returns
+    --------
+    dict
+        The persona name of every id, ``None`` when it could not be found.
+    """
+    steam_ids = [str(steam_id) for steam_id in dict.fromkeys(steam_ids) if steam_id]
+    names = {}
+    try:
+        installation = get_installation()
+    except (EnvironmentError, FileNotFoundError):
+        installation = None
+    if installation is not None:
+        for steam_id in steam_ids:
+            names[steam_id] = _local_persona_name(installation, steam_id)
+
+    missing = [steam_id for steam_id in steam_ids if not names.get(steam_id)]
+    if not missing:
+        return names
+
+    now = time.time()
+    with _persona_lock:
+        cache = _load_persona_cache()
+    for steam_id in list(missing):
+        cached = cache.get(steam_id)
+        if cached and now - cached[1] < PERSONA_CACHE_TTL:
+            names[steam_id] = cached[0]
+            missing.remove(steam_id)
+    if not missing:
+        return names
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+        fetched = dict(zip(missing, executor.map(_fetch_steam_profile_name, missing)))
+    names.update(fetched)
+
+    with _persona_lock:
+        cache = _load_persona_cache()
+        cache.update((steam_id, [name, now]) for steam_id, name in fetched.items() if name)
+        _save_persona_cache(cache)
+    return names
 
 def get_steam_profile_name(steam_id):
+    """Resolve one persona name, see get_steam_profile_names."""
+    return get_steam_profile_names([steam_id]).get(str(steam_id))
+
+def _fetch_steam_profile_name(steam_id):
 
     # Construct the URL for the Steam profile page
     url = f'https://steamcommunity.com/profiles/{steam_id}'
 
     # Send a request to the URL
-    response = requests.get(url)
+    try:
+        response = _http_session().get(url, timeout=STEAM_TIMEOUT)
+    except requests.exceptions.RequestException:
+        return None
 
     # Check if the request was successful
     if response.status_code == 200:
@@ -81,141 +499,112 @@ def get_steam_profile_name(steam_id):
 
 def get_steam_user_details(username):
     """Retrieve Steam user details parsing config.vdf."""
-    steam_path = get_steam_installation()
-    config_path = os.path.join(steam_path, "config", "config.vdf")
-
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"config.vdf not found at {config_path}")
-
-    try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = vdf.load(f)
-    except Exception as e:
-        raise IOError(f"Failed to read config.vdf: {e}")
-
-    user_data = config_data.get('InstallConfigStore', {}).get('Software', {}).get('Valve', {}).get('Steam', {}).get('Accounts', {})
-    for steam_username, data in user_data.items():
-        steam_id = data.get('SteamID')
-        profile_name = get_steam_profile_name(steam_id)
-        if steam_username:
-            return {'username': steam_username, 'steam_id': steam_id, 'steam_profile_name': profile_name}
+    for steam_username, data in get_installation().accounts().items():
+        if steam_username and steam_username.lower() == username.lower():
+            return _steam_user(steam_username, data, get_steam_profile_names([data.get('SteamID')]))
 
 def get_profile(user_id):
     """Retrieve the Steam profile information for a given user by parsing the localconfig.vdf file."""
-    steam_path = get_steam_installation()
-    user_data_path = os.path.join(steam_path, "userdata", str(user_id), "config", "localconfig.vdf")
-
-    if not os.path.exists(user_data_path):
-        raise FileNotFoundError(f"localconfig.vdf not found at {user_data_path}")
-
-    try:
-        with open(user_data_path, 'r', encoding='utf-8') as f:
-            user_data = vdf.load(f)
-    except Exception as e:
-        raise IOError(f"Failed to read localconfig.vdf: {e}")
-
-    profile_data = user_data.get('UserLocalConfigStore', {}).get('friends', {}).get('PersonaName', None)
+    profile_data = get_installation().persona_name(user_id)
     
     if not profile_data:
         raise ValueError("Profile data not found in localconfig.vdf")
 
     return profile_data
 
+def iter_installed_games():
+    """Yield installed Steam games as their appmanifest_*.acf files are parsed."""
+    return get_installation().installed_games()
+
 def get_installed_games():
     """Retrieve a list of installed Steam games by parsing appmanifest_*.acf files."""
-    library_folders = get_library_folders()
-    games = []
-
-    for folder in library_folders:
-        for file_name in os.listdir(folder):
-            if file_name.startswith("appmanifest_") and file_name.endswith(".acf"):
-                appmanifest_path = os.path.join(folder, file_name)
-                try:
-                    with open(appmanifest_path, 'r', encoding='utf-8') as f:
-                        game_data = vdf.load(f)
-                    app_state = game_data.get('AppState', {})
-                    name = app_state.get('name')
-                    appid = app_state.get('appid')
-                    if name and appid:
-                        games.append({'name': name, 'appid': appid})
-                except Exception as e:
-                    print(f"Failed to read {appmanifest_path}: {e}")
-    
-    return games
+    return list(iter_installed_games())
 
 def get_librarycache_folder():
     """ Sets the target path to the librarycache folder """
-    steam_path = get_steam_installation()
-    return os.path.join(steam_path, "appcache", "librarycache")
+    return get_installation().librarycache_folder
 
 def get_grid_folder(steam_user_id, steam_profile_name):
     """ Sets the target path to the grid folder """
-    steam_path = get_steam_installation()
-    steam_userdata = os.path.join(steam_path, "userdata")
-
-    for folder in os.listdir(steam_userdata):
-        # Skip anonymous folder
-        if folder == "anonymous":
-            continue
-        localvdf = os.path.join(steam_path, "userdata", folder, "config", "localconfig.vdf")
-        if os.path.exists(localvdf):
-            with open(localvdf, 'r', encoding='utf-8') as f:
-                config_data = vdf.load(f)
-                # Does the request profile name match the local config?
-                profile_in_vdf = config_data.get('UserLocalConfigStore', {}).get('friends', {}).get('PersonaName', {})
-                if not profile_in_vdf:
-                    exit("Failed to find Steam profile name in localconfig.vdf!")
-                if profile_in_vdf == steam_profile_name:
-                    return os.path.join(steam_path, "userdata", folder, "config", "grid")
+    installation = get_installation()
+
+    for folder in installation.user_ids():
+        if os.path.exists(installation.localconfig_path(folder)):
+            # Does the request profile name match the local config?
+            profile_in_vdf = installation.persona_name(folder)
+            if not profile_in_vdf:
+                exit("Failed to find Steam profile name in localconfig.vdf!")
+            if profile_in_vdf == steam_profile_name:
+                return installation.grid_folder(folder)
 
 def get_library_folders():
     """Retrieve a list of library folders by parsing libraryfolders.vdf."""
-    steam_path = get_steam_installation()
-    library_folders_path = os.path.join(steam_path, "steamapps", "libraryfolders.vdf")
+    return get_installation().library_folders()
 
-    if not os.path.exists(library_folders_path):
-        raise FileNotFoundError(f"libraryfolders.vdf not found at {library_folders_path}")
+def get_all_games():
+    """Retrieve a list of all games by parsing config.vdf."""
+    installation = get_installation()
+    games = []
+    accounts = installation.apps()
 
-    try:
-        with open(library_folders_path, 'r', encoding='utf-8') as f:
-            library_data = vdf.load(f)
-    except Exception as e:
-        raise IOError(f"Failed to read libraryfolders.vdf: {e}")
+    for appid, app_data in accounts.items():
+        name = app_data.get('name')
+        if name:
+            games.append({'name': name, 'appid': appid})
 
-    library_folders = [os.path.join(steam_path, "steamapps")]
-    additional_folders = library_data.get('libraryfolders', {})
-    
-    for key, value in additional_folders.items():
-        if key.isdigit():
-            path = value.get('path')
-            if path:
-                library_folders.append(os.path.join(path, "steamapps"))
+    return games
 
-    return library_folders
+def _account_id(steam_id):
+    steam_id = int(steam_id)
+    return steam_id - STEAM_ID64_BASE if steam_id > STEAM_ID64_BASE else steam_id
 
-def get_all_games():
-    """Retrieve a list of all games by parsing config.vdf."""
-    steam_path = get_steam_installation()
-    config_path = os.path.join(steam_path, "config", "config.vdf")
+def get_game_inventory(steam_id):
+    """Build a user's game list offline, non-Steam shortcuts included.
 
-    if not os.path.exists(config_path):
-        raise FileNotFoundError(f"config.vdf not found at {config_path}")
+    App ids come from the installed appmanifest files and the apps listed
+    in the user's localconfig.vdf; names and types come from the local
+    appinfo.vdf cache. DLC and other apps that are not shown in the
+    library are left out.
 
-    try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_data = vdf.load(f)
-    except Exception as e:
-        raise IOError(f"Failed to read config.vdf: {e}")
+    Parameters
+    -----------
+    steam_id: str or int
+        The steam64 or 32-bit account id of the user.
 
-    games = []
-    accounts = config_data.get('InstallConfigStore', {}).get('Software', {}).get('Valve', {}).get('Steam', {}).get('apps', {})
-    print(json.dumps(config_data, indent=4))
+    Returns
+    --------
+    list
+        ``{'appID', 'name', 'non_steam'}`` dicts, the same keys as
+        ``fetch_and_parse_games_xml``. ``appID`` of a shortcut is its
+        32-bit id, which is also the name of its grid images.
+    """
+    installation = get_installation()
+    account_id = _account_id(steam_id)
+    names = {str(game['appid']): game['name'] for game in installation.installed_games()}
+    if os.path.exists(installation.localconfig_path(account_id)):
+        for appid in installation.played_apps(account_id):
+            names.setdefault(appid, None)
 
-    for appid, app_data in accounts.items():
-        name = app_data.get('name')
+    try:
+        appinfo = installation.appinfo()
+    except IOError:
+        # An unsupported or corrupt appinfo.vdf only costs the names and types
+        appinfo = None
+    games = []
+    for appid, name in names.items():
+        try:
+            summary = appinfo.summary(int(appid)) if appinfo is not None and appid.isdigit() else None
+        except AppInfoError:
+            summary = None
+        if summary is not None:
+            if summary['type'] is not None and summary['type'] not in _LIBRARY_TYPES:
+                continue
+            name = summary['name'] or name
         if name:
-            games.append({'name': name, 'appid': appid})
+            games.append({'appID': appid, 'name': name, 'non_steam': False})
 
+    for shortcut in installation.shortcuts(account_id):
+        games.append({'appID': str(shortcut.app_id), 'name': shortcut.name, 'non_steam': True})
     return games
 
 def fetch_and_parse_games_xml(profile_id):
@@ -240,7 +629,7 @@ def fetch_and_parse_games_xml(profile_id):
     url = f"https://steamcommunity.com/profiles/{profile_id}/games?xml=1"
     
     try:
-        response = requests.get(url)
+        response = _http_session().get(url, timeout=STEAM_TIMEOUT)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         raise SystemExit(f"Error fetching data from Steam: {e}")
@@ -283,7 +672,7 @@ def download_grid_image(target_file, image_url, grid_directory):
     # * `<GAME_ID>_logo.png`
 
     # Send a GET request to the image URL
-    response = requests.get(image_url)
+    response = _http_session().get(image_url, timeout=STEAM_TIMEOUT)
     target_location = f"{grid_directory}/{target_file}"
     
     # Check if the request was successful
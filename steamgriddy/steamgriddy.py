@@ -18,22 +18,86 @@ FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 DEALINGS IN THE SOFTWARE.
 """
 
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from .http import HTTPClient
-from .game import Game
+from .http import HTTPClient, HTTPException
+from .ratelimit import RateLimiter, Backoff
+from .cache import ResponseCache, MemoryCache, AutocompleteCache
+from .transport import Transport
+from .game import Game, GameRegistry
+from .author import AuthorRegistry
 from .enums import (
     StyleType, 
     MimeType, 
     ImageType,
-    PlatformType
+    PlatformType,
+    AssetType
 )
 from .asset import *
+from .asset import Asset
+from .table import AssetTable
+from .query import AssetQuery
+from .snapshot import Snapshot, _tables_from_assets
+from . import bulk
 
 __all__ = (
     'SteamGridDB',
 )
 
+def _query(
+    query: Optional[AssetQuery],
+    styles: List[StyleType],
+    dimensions: List[str],
+    mimes: List[MimeType],
+    types: List[ImageType],
+    is_nsfw: bool,
+    is_humor: bool,
+) -> AssetQuery:
+    # A prebuilt query replaces the keyword filters and skips their checks.
+    if query is None:
+        return AssetQuery(styles, dimensions, mimes, types, is_nsfw, is_humor)
+    if not isinstance(query, AssetQuery):
+        raise TypeError('\'query\' must be an AssetQuery.')
+    return query
+
+def _bulk_queries(asset_types: List[AssetType], filters: Union[AssetQuery, dict, None]) -> Dict[AssetType, dict]:
+    # ``filters`` is an AssetQuery or the keyword filters of get_*_by_platform,
+    # either once for every asset type or keyed by AssetType.
+    filters = filters or {}
+    if not isinstance(filters, (dict, AssetQuery)):
+        raise TypeError('\'filters\' must be a dict or an AssetQuery.')
+
+    per_type = isinstance(filters, dict) and bool(filters) and all(isinstance(k, AssetType) for k in filters)
+    queries = {}
+    for asset_type in asset_types:
+        options = filters.get(asset_type, {}) if per_type else filters
+        if not isinstance(options, AssetQuery):
+            options = AssetQuery(**options)
+        queries[asset_type] = options.params
+    return queries
+
+def _bulk_jobs(http, app_ids: List[int], platform: PlatformType, queries: Dict[AssetType, dict]) -> list:
+    jobs = []
+    for asset_type, query in queries.items():
+        prefix = http.BASE_URL + '/' + bulk.ASSET_PATHS[asset_type] + '/' + platform.value + '/'
+        for chunk in bulk.chunk_ids(app_ids, prefix, query):
+            jobs.append((asset_type, chunk))
+    return jobs
+
+def _page_queries(game_id: int, query: AssetQuery) -> dict:
+    if not isinstance(game_id, int):
+        raise TypeError('\'game_id\' must be an integer.')
+    return query.params
+
+def _closest_game(resolver, name: str, games: Optional[List[Game]], threshold: Optional[float]) -> Optional[Game]:
+    scored = [(resolver.similarity(name, game.name), game) for game in games or ()]
+    if not scored:
+        return None
+    score, game = max(scored, key=lambda item: item[0])
+    minimum = 0.0 if threshold is None else threshold
+    return game if score >= minimum else None
+
 class SteamGridDB:
     """Represents a custom author.
 
@@ -41,13 +105,147 @@ class SteamGridDB:
     -----------
     auth_key: :class:`str`
         The auth key of the steamgriddb for authorization.
+    rate_limiter: Optional[:class:`RateLimiter`]
+        Token bucket shared by every request of this client. Defaults to
+        no limit.
+    backoff: Optional[:class:`Backoff`]
+        Retry policy for ``429`` and ``5xx`` responses. Defaults to three
+        retries with jittered exponential backoff, honoring ``Retry-After``.
+    cache: Union[:class:`bool`, :class:`str`, :class:`ResponseCache`, None]
+        Persistent cache of ``GET`` responses. ``True`` uses the default
+        location under ``~/.cache/steamgriddy``, a string is the database
+        path. Defaults to no cache.
+    memo: Union[:class:`bool`, :class:`MemoryCache`, None]
+        In-process LRU memo of game and asset-list lookups, checked before
+        ``cache``. ``True`` uses the default size and time-to-live.
+        Defaults to no memo.
+    transport: Optional[:class:`Transport`]
+        The HTTP backend, with its connection pool and timeouts. Defaults to
+        :class:`RequestsTransport` with its default settings.
+    decoder: Optional[:class:`str`]
+        JSON decoder of response bodies: ``'orjson'``, ``'msgspec'`` or
+        ``'json'``. Defaults to the fastest one installed.
+    keep_payload: :class:`bool`
+        Whether models keep the decoded response dict they were built from.
+        When ``False`` the dict is dropped after its fields are copied and
+        ``to_json()`` rebuilds it on demand. Defaults to ``True``.
+    base_url: Optional[:class:`str`]
+        Root URL of the API, e.g. a local :class:`~steamgriddy.fakeserver.FakeSteamGridDB`.
+        Defaults to ``https://www.steamgriddb.com/api/v2``.
+    lazy: :class:`bool`
+        Whether models decode their fields from the response dict on first
+        access instead of up front, so that e.g. reading only ``url`` never
+        builds the :class:`Author`. Lazy models always keep the response
+        dict. Defaults to ``False``.
+    autocomplete: Union[:class:`bool`, :class:`AutocompleteCache`, None]
+        Prefix-trie cache of :meth:`search_game` results, so that longer
+        terms can be answered locally. ``True`` uses the default time-to-live.
+        Defaults to no cache.
     
     """
 
     __slots__ = ('_http')
 
-    def __init__(self, auth_key: str) -> None:
-        self._http = HTTPClient(auth_key)
+    def __init__(
+        self,
+        auth_key: str,
+        rate_limiter: Optional[RateLimiter] = None,
+        backoff: Optional[Backoff] = None,
+        cache: Union[bool, str, ResponseCache, None] = None,
+        memo: Union[bool, MemoryCache, None] = None,
+        transport: Optional[Transport] = None,
+        decoder: Optional[str] = None,
+        keep_payload: bool = True,
+        base_url: Optional[str] = None,
+        lazy: bool = False,
+        autocomplete: Union[bool, AutocompleteCache, None] = None,
+    ) -> None:
+        self._http = HTTPClient(
+            auth_key,
+            rate_limiter=rate_limiter,
+            backoff=backoff,
+            cache=cache,
+            memo=memo,
+            transport=transport,
+            decoder=decoder,
+            keep_payload=keep_payload,
+            base_url=base_url,
+            lazy=lazy,
+            autocomplete=autocomplete
+        )
+
+    def close(self) -> None:
+        """Closes the pooled connections of the transport."""
+        self._http.close()
+
+    @property
+    def authors(self) -> AuthorRegistry:
+        """:class:`AuthorRegistry`: The shared authors of every asset built by this client, with their aggregates."""
+        return self._http.authors
+
+    @property
+    def games(self) -> GameRegistry:
+        """:class:`GameRegistry`: The identity map of every game looked up by this client."""
+        return self._http.games
+
+    def invalidate(self) -> None:
+        """Forgets every memoized game and asset-list lookup, including :attr:`games`.
+
+        The persistent ``cache``, if any, is left untouched.
+        """
+        if self._http.memo is not None:
+            self._http.memo.invalidate()
+        self._http.games.clear()
+
+    def dump_snapshot(
+        self,
+        assets: Union[Dict[int, Dict[AssetType, List[Asset]]], Iterable[AssetTable], None] = None,
+        games: Optional[Iterable[Game]] = None,
+    ) -> bytes:
+        """Encodes fetched games and assets as a compact binary :class:`Snapshot`.
+
+        Parameters
+        -----------
+        assets: Union[Dict[:class:`int`, Dict[:class:`AssetType`, List[:class:`Asset`]]], Iterable[:class:`AssetTable`], None]
+            The output of :meth:`bulk_assets`, or asset tables such as the
+            output of :meth:`bulk_asset_table`. Defaults to no assets.
+        games: Optional[Iterable[:class:`Game`]]
+            The games to include, with their platform ids. Defaults to every
+            game in :attr:`games`.
+
+        Returns
+        --------
+        :class:`bytes`
+            The snapshot.
+        """
+        if isinstance(assets, dict):
+            assets = _tables_from_assets(assets, self._http)
+        return Snapshot.dumps(
+            assets or (), self._http.games if games is None else games, self._http.games.links()
+        )
+
+    def load_snapshot(self, data: bytes) -> Snapshot:
+        """Decodes a snapshot made by :meth:`dump_snapshot`.
+
+        Its games and their platform ids are merged into :attr:`games`, its authors into
+        :attr:`authors`, and its assets are bound to this client.
+
+        Parameters
+        -----------
+        data: :class:`bytes`
+            The snapshot.
+
+        Raises
+        --------
+        SnapshotError
+            If ``data`` is not a snapshot or was written by an unsupported version.
+
+        Returns
+        --------
+        :class:`Snapshot`
+            The games, asset tables and authors of the snapshot.
+        """
+        return Snapshot.loads(data, self._http)
 
     def auth_key(self) -> str:
         """:class:`str`: Returns the auth key of the steamgriddb.
@@ -85,8 +283,12 @@ class SteamGridDB:
         if not isinstance(game_id, int):
             raise TypeError('\'game_id\' must be an integer.')
 
+        game = self._http.games.get(game_id)
+        if game is not None:
+            return game
+
         payload = self._http.get_game(game_id, 'game')
-        return Game(payload) if payload != [] else None
+        return self._http.games.add(payload) if payload != [] else None
 
     def get_game_by_steam_appid(
         self,
@@ -114,8 +316,12 @@ class SteamGridDB:
         if not isinstance(app_id, int):
             raise TypeError('\'app_id\' must be an integer.')
 
+        game = self._http.games.by_platform(PlatformType.Steam.value, app_id)
+        if game is not None:
+            return game
+
         payload = self._http.get_game(app_id, 'steam')
-        return Game(payload) if payload != [] else None
+        return self._http.games.add(payload, PlatformType.Steam.value, app_id) if payload != [] else None
     
     def get_grids_by_gameid(
         self,
@@ -126,6 +332,7 @@ class SteamGridDB:
         types: List[ImageType] = [],
         is_nsfw: bool = False,
         is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
     ) -> Optional[List[Grid]]:
         """Optional[List[:class:`Grid`]] Returns a list of grids by game id.
 
@@ -145,6 +352,8 @@ class SteamGridDB:
             Whether or not the grids are NSFW. Defaults to False.
         is_humor: :class:`bool`
             Whether or not the grids are humor. Defaults to False.
+        query: Optional[:class:`AssetQuery`]
+            Prebuilt filters, used instead of the keyword filters.
 
         Raises
         --------
@@ -160,27 +369,7 @@ class SteamGridDB:
         """
         if not isinstance(game_ids, List):
             raise TypeError('\'game_ids\' must be a list of integers.')
-        if not isinstance(styles, List):
-            raise TypeError('\'styles\' must be a list of StyleType.')
-        if not isinstance(dimensions, List):
-            raise TypeError('\'dimensions\' must be a list of str.')
-        if not isinstance(mimes, List):
-            raise TypeError('\'mimes\' must be a list of MimeType.')
-        if not isinstance(types, List):
-            raise TypeError('\'types\' must be a list of ImageType.')
-        if not isinstance(is_nsfw, bool):
-            raise TypeError('\'is_nsfw\' must be a boolean.')
-        if not isinstance(is_humor, bool):
-            raise TypeError('\'is_humor\' must be a boolean.')
-    
-        queries = {
-            'styles': ','.join(i.value for i in styles),
-            'dimensions': ','.join(str(i) for i in dimensions),
-            'mimes': ','.join(i.value for i in mimes),
-            'types': ','.join(i.value for i in types),
-            'nsfw': str(is_nsfw).lower(),
-            'humor': str(is_humor).lower(),
-        }
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
         payloads = self._http.get_grid(game_ids, 'game', queries=queries)
         if payloads != []:
             return [Grid(payload, self._http) for payload in payloads]
@@ -196,6 +385,7 @@ class SteamGridDB:
         types: List[ImageType] = [],
         is_nsfw: bool = False,
         is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
     ) -> Optional[List[Grid]]:
 
         """Optional[List[:class:`Grid`]] Returns a list of grids by platform.
@@ -218,6 +408,8 @@ class SteamGridDB:
             Whether or not the grids are NSFW. Defaults to False.
         is_humor: :class:`bool`
             Whether or not the grids are humor. Defaults to False.
+        query: Optional[:class:`AssetQuery`]
+            Prebuilt filters, used instead of the keyword filters.
         
         Raises
         --------
@@ -235,27 +427,7 @@ class SteamGridDB:
             raise TypeError('\'game_ids\' must be a list of integers.')
         if not isinstance(platform, PlatformType):
             raise TypeError('\'platform\' must be a PlatformType.')
-        if not isinstance(styles, List):
-            raise TypeError('\'styles\' must be a list of StyleType.')
-        if not isinstance(dimensions, List):
-            raise TypeError('\'dimensions\' must be a list of str.')
-        if not isinstance(mimes, List):
-            raise TypeError('\'mimes\' must be a list of MimeType.')
-        if not isinstance(types, List):
-            raise TypeError('\'types\' must be a list of ImageType.')
-        if not isinstance(is_nsfw, bool):
-            raise TypeError('\'is_nsfw\' must be a boolean.')
-        if not isinstance(is_humor, bool):
-            raise TypeError('\'is_humor\' must be a boolean.')
-
-        queries = {
-            'styles': ','.join(str(i) for i in styles),
-            'dimensions': ','.join(str(i) for i in dimensions),
-            'mimes': ','.join(str(i) for i in mimes),
-            'types': ','.join(str(i) for i in types),
-            'nsfw': str(is_nsfw).lower(),
-            'humor': str(is_humor).lower(),
-        }
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
 
         payloads = self._http.get_grid(
             game_ids,
@@ -276,6 +448,7 @@ class SteamGridDB:
         types: List[ImageType] = [],
         is_nsfw: bool = False,
         is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
     ) -> Optional[List[Hero]]:
         """Optional[List[:class:`Hero`]] Returns a list of heroes by game id.
 
@@ -295,6 +468,8 @@ class SteamGridDB:
             Whether or not the heroes are NSFW. Defaults to False.
         is_humor: :class:`bool`
             Whether or not the heroes are humor. Defaults to False.
+        query: Optional[:class:`AssetQuery`]
+            Prebuilt filters, used instead of the keyword filters.
         
         Raises
         --------
@@ -310,27 +485,7 @@ class SteamGridDB:
         """
         if not isinstance(game_ids, List):
             raise TypeError('\'game_ids\' must be a list of integers.')
-        if not isinstance(styles, List):
-            raise TypeError('\'styles\' must be a list of StyleType.')
-        if not isinstance(dimensions, List):
-            raise TypeError('\'dimensions\' must be a list of str.')
-        if not isinstance(mimes, List):
-            raise TypeError('\'mimes\' must be a list of MimeType.')
-        if not isinstance(types, List):
-            raise TypeError('\'types\' must be a list of ImageType.')
-        if not isinstance(is_nsfw, bool):
-            raise TypeError('\'is_nsfw\' must be a boolean.')
-        if not isinstance(is_humor, bool):
-            raise TypeError('\'is_humor\' must be a boolean.')
-
-        queries = {
-            'styles': ','.join(i.value for i in styles),
-            'dimensions': ','.join(str(i) for i in dimensions),
-            'mimes': ','.join(i.value for i in mimes),
-            'types': ','.join(i.value for i in types),
-            'nsfw': str(is_nsfw).lower(),
-            'humor': str(is_humor).lower(),
-        }
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
 
         payloads = self._http.get_hero(game_ids, 'game', queries=queries)
         if payloads != []:
@@ -342,11 +497,12 @@ class SteamGridDB:
         game_ids: List[int],
         platform: PlatformType,
         styles: List[StyleType] = [],
-        dimeions: List[str] = [],
+        dimensions: List[str] = [],
         mimes: List[MimeType] = [],
         types: List[ImageType] = [],
         is_nsfw: bool = False,
         is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
     ) -> Optional[List[Hero]]:
         """Optional[List[:class:`Hero`]] Returns a list of heroes by platform.
 
@@ -368,6 +524,8 @@ class SteamGridDB:
             Whether or not the heroes are NSFW. Defaults to False.
         is_humor: :class:`bool`
             Whether or not the heroes are humor. Defaults to False.
+        query: Optional[:class:`AssetQuery`]
+            Prebuilt filters, used instead of the keyword filters.
         
         Raises
         --------
@@ -385,27 +543,7 @@ class SteamGridDB:
             raise TypeError('\'game_ids\' must be a list of integers.')
         if not isinstance(platform, PlatformType):
             raise TypeError('\'platform\' must be a PlatformType.')
-        if not isinstance(styles, List):
-            raise TypeError('\'styles\' must be a list of StyleType.')
-        if not isinstance(dimensions, List):
-            raise TypeError('\'dimensions\' must be a list of str.')
-        if not isinstance(mimes, List):
-            raise TypeError('\'mimes\' must be a list of MimeType.')
-        if not isinstance(types, List):
-            raise TypeError('\'types\' must be a list of ImageType.')
-        if not isinstance(is_nsfw, bool):
-            raise TypeError('\'is_nsfw\' must be a boolean.')
-        if not isinstance(is_humor, bool):
-            raise TypeError('\'is_humor\' must be a boolean.')
-
-        queries = {
-            'styles': ','.join(str(i) for i in styles),
-            'dimensions': ','.join(str(i) for i in dimensions),
-            'mimes': ','.join(str(i) for i in mimes),
-            'types': ','.join(str(i) for i in types),
-            'nsfw': str(is_nsfw).lower(),
-            'humor': str(is_humor).lower(),
-        }
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
 
         payloads = self._http.get_hero(
             game_ids, 
@@ -414,7 +552,7 @@ class SteamGridDB:
             queries=queries
         )
         if payloads != []:
-            return [Grid(payload, self._http) for payload in payloads]
+            return [Hero(payload, self._http) for payload in payloads]
         return None
 
     def get_logos_by_gameid(
@@ -426,6 +564,7 @@ class SteamGridDB:
         types: List[ImageType] = [],
         is_nsfw: bool = False,
         is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
     ) -> Optional[List[Logo]]:
         """Optional[List[:class:`Logo`]] Returns a list of logos by game id.
 
@@ -445,6 +584,8 @@ class SteamGridDB:
             Whether or not the logos are NSFW. Defaults to False.
         is_humor: :class:`bool`
             Whether or not the logos are humor. Defaults to False.
+        query: Optional[:class:`AssetQuery`]
+            Prebuilt filters, used instead of the keyword filters.
         
         Raises
         --------
@@ -460,27 +601,7 @@ class SteamGridDB:
         """
         if not isinstance(game_ids, List):
             raise TypeError('\'game_ids\' must be a list of integers.')
-        if not isinstance(styles, List):
-            raise TypeError('\'styles\' must be a list of StyleType.')
-        if not isinstance(dimensions, List):
-            raise TypeError('\'dimensions\' must be a list of str.')
-        if not isinstance(mimes, List):
-            raise TypeError('\'mimes\' must be a list of MimeType.')
-        if not isinstance(types, List):
-            raise TypeError('\'types\' must be a list of ImageType.')
-        if not isinstance(is_nsfw, bool):
-            raise TypeError('\'is_nsfw\' must be a boolean.')
-        if not isinstance(is_humor, bool):
-            raise TypeError('\'is_humor\' must be a boolean.')
-
-        queries = {
-            'styles': ','.join(i.value for i in styles),
-            'dimensions': ','.join(str(i) for i in dimensions),
-            'mimes': ','.join(i.value for i in mimes),
-            'types': ','.join(i.value for i in types),
-            'nsfw': str(is_nsfw).lower(),
-            'humor': str(is_humor).lower(),
-        }
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
 
         payloads = self._http.get_logo(game_ids, 'game', queries=queries)
         if payloads != []:
@@ -497,6 +618,7 @@ class SteamGridDB:
         types: List[ImageType] = [],
         is_nsfw: bool = False,
         is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
     ) -> Optional[List[Logo]]:
         """Optional[List[:class:`Logo`]] Returns a list of logos by platform.
 
@@ -514,32 +636,14 @@ class SteamGridDB:
             The mimes of the logos. Defaults to all mimes.
         types: List[:class:`ImageType`]
             The types of the logos. Defaults to all types.
+        query: Optional[:class:`AssetQuery`]
+            Prebuilt filters, used instead of the keyword filters.
         """
         if not isinstance(game_ids, List):
             raise TypeError('\'game_ids\' must be a list of integers.')
         if not isinstance(platform, PlatformType):
             raise TypeError('\'platform\' must be a PlatformType.')
-        if not isinstance(styles, List):
-            raise TypeError('\'styles\' must be a list of StyleType.')
-        if not isinstance(dimensions, List):
-            raise TypeError('\'dimensions\' must be a list of str.')
-        if not isinstance(mimes, List):
-            raise TypeError('\'mimes\' must be a list of MimeType.')
-        if not isinstance(types, List):
-            raise TypeError('\'types\' must be a list of ImageType.')
-        if not isinstance(is_nsfw, bool):
-            raise TypeError('\'is_nsfw\' must be a boolean.')
-        if not isinstance(is_humor, bool):
-            raise TypeError('\'is_humor\' must be a boolean.')
-
-        queries = {
-            'styles': ','.join(str(i) for i in styles),
-            'dimensins': ','.join(str(i) for i in dimensions),
-            'mimes': ','.join(str(i) for i in mimes),
-            'types': ','.join(str(i) for i in types),
-            'nsfw': str(is_nsfw).lower(),
-            'humor': str(is_humor).lower(),
-        }
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
 
         payloads = self._http.get_logo(
             game_ids, 
@@ -560,6 +664,7 @@ class SteamGridDB:
         types: List[ImageType] = [],
         is_nsfw: bool = False,
         is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
     ) -> Optional[List[Icon]]:
         """Optional[List[:class:`Icon`]] Returns a list of icons by game id.
         
@@ -579,6 +684,8 @@ class SteamGridDB:
             Whether or not the icons are NSFW. Defaults to False.
         is_humor: :class:`bool`
             Whether or not the icons are humor. Defaults to False.
+        query: Optional[:class:`AssetQuery`]
+            Prebuilt filters, used instead of the keyword filters.
         
         Raises
         --------
@@ -594,27 +701,7 @@ class SteamGridDB:
         """
         if not isinstance(game_ids, List):
             raise TypeError('\'game_ids\' must be a list of integers.')
-        if not isinstance(styles, List):
-            raise TypeError('\'styles\' must be a list of StyleType.')
-        if not isinstance(dimensions, List):
-            raise TypeError('\'dimensions\' must be a list of str.')
-        if not isinstance(mimes, List):
-            raise TypeError('\'mimes\' must be a list of MimeType.')
-        if not isinstance(types, List):
-            raise TypeError('\'types\' must be a list of ImageType.')
-        if not isinstance(is_nsfw, bool):
-            raise TypeError('\'is_nsfw\' must be a boolean.')
-        if not isinstance(is_humor, bool):
-            raise TypeError('\'is_humor\' must be a boolean.')
-
-        queries = {
-            'styles': ','.join(i.value for i in styles),
-            'dimensions': ','.join(str(i) for i in dimensions),
-            'mimes': ','.join(i.value for i in mimes),
-            'types': ','.join(i.value for i in types),
-            'nsfw': str(is_nsfw).lower(),
-            'humor': str(is_humor).lower(),
-        }
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
 
         payloads = self._http.get_icon(game_ids, 'game', queries=queries)
         if payloads != []:
@@ -631,6 +718,7 @@ class SteamGridDB:
         types: List[ImageType] = [],
         is_nsfw: bool = False,
         is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
     ) -> Optional[List[Icon]]:
         """Optional[List[:class:`Icon`]] Returns a list of icons by platform.
 
@@ -652,6 +740,8 @@ class SteamGridDB:
             Whether or not the icons are NSFW. Defaults to False.
         is_humor: :class:`bool`
             Whether or not the icons are humor. Defaults to False.
+        query: Optional[:class:`AssetQuery`]
+            Prebuilt filters, used instead of the keyword filters.
         
         Raises
         --------
@@ -669,27 +759,7 @@ class SteamGridDB:
             raise TypeError('\'game_ids\' must be a list of integers.')
         if not isinstance(platform, PlatformType):
             raise TypeError('\'platform\' must be a PlatformType.')
-        if not isinstance(styles, List):
-            raise TypeError('\'styles\' must be a list of StyleType.')
-        if not isinstance(dimensions, List):
-            raise TypeError('\'dimensions\' must be a list of str.')
-        if not isinstance(mimes, List):
-            raise TypeError('\'mimes\' must be a list of MimeType.')
-        if not isinstance(types, List):
-            raise TypeError('\'types\' must be a list of ImageType.')
-        if not isinstance(is_nsfw, bool):
-            raise TypeError('\'is_nsfw\' must be a boolean.')
-        if not isinstance(is_humor, bool):
-            raise TypeError('\'is_humor\' must be a boolean.')
-
-        queries = {
-            'styles': ','.join(str(i) for i in styles),
-            'dimensions': ','.join(str(i) for i in dimensions),
-            'mimes': ','.join(str(i) for i in mimes),
-            'types': ','.join(str(i) for i in types),
-            'nsfw': str(is_nsfw).lower(),
-            'humor': str(is_humor).lower(),
-        }
+        queries = _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor).params
 
         payloads = self._http.get_icon(
             game_ids, 
@@ -701,6 +771,293 @@ class SteamGridDB:
             return [Icon(payload, self._http) for payload in payloads]
         return None
 
+    def _iter_assets(self, asset_type: AssetType, game_id: int, queries: dict) -> Iterator[Asset]:
+        getter = getattr(self._http, bulk.HTTP_GETTERS[asset_type])
+        cls = bulk.ASSET_CLASSES[asset_type]
+        page = 0
+        while True:
+            payloads = getter([game_id], 'game', queries=dict(queries, page=str(page)))
+            for payload in payloads or ():
+                yield cls(payload, self._http)
+            if not payloads or len(payloads) < bulk.PAGE_SIZE:
+                return
+            page += 1
+
+    def iter_grids(
+        self,
+        game_id: int,
+        dimensions: List[str] = [],
+        styles: List[StyleType] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> Iterator[Grid]:
+        """Iterator[:class:`Grid`] Lazily iterates over the grids of a game.
+
+        Pages are fetched only when the previous one has been consumed and
+        each :class:`Grid` is built as it is yielded, so breaking out of the
+        loop stops all further requests. Takes the same filters as
+        :meth:`get_grids_by_gameid`.
+
+        Parameters
+        -----------
+        game_id: :class:`int`
+            The game id of the game.
+        query: Optional[:class:`AssetQuery`]
+            Prebuilt filters, used instead of the keyword filters.
+
+        Raises
+        --------
+        TypeError
+            If one of the parameters is not of the correct type.
+        HTTPException
+            If there is an error with the request.
+
+        Yields
+        --------
+        :class:`Grid`
+            The grids of the game, page by page.
+        """
+        queries = _page_queries(game_id, _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor))
+        return self._iter_assets(AssetType.Grid, game_id, queries)
+
+    def iter_heroes(
+        self,
+        game_id: int,
+        styles: List[StyleType] = [],
+        dimensions: List[str] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> Iterator[Hero]:
+        """Iterator[:class:`Hero`] Lazily iterates over the heroes of a game.
+
+        See :meth:`iter_grids`. Takes the same filters as :meth:`get_heroes_by_gameid`.
+        """
+        queries = _page_queries(game_id, _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor))
+        return self._iter_assets(AssetType.Hero, game_id, queries)
+
+    def iter_logos(
+        self,
+        game_id: int,
+        styles: List[StyleType] = [],
+        dimensions: List[str] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> Iterator[Logo]:
+        """Iterator[:class:`Logo`] Lazily iterates over the logos of a game.
+
+        See :meth:`iter_grids`. Takes the same filters as :meth:`get_logos_by_gameid`.
+        """
+        queries = _page_queries(game_id, _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor))
+        return self._iter_assets(AssetType.Logo, game_id, queries)
+
+    def iter_icons(
+        self,
+        game_id: int,
+        styles: List[StyleType] = [],
+        dimensions: List[str] = [],
+        mimes: List[MimeType] = [],
+        types: List[ImageType] = [],
+        is_nsfw: bool = False,
+        is_humor: bool = False,
+        query: Optional[AssetQuery] = None,
+    ) -> Iterator[Icon]:
+        """Iterator[:class:`Icon`] Lazily iterates over the icons of a game.
+
+        See :meth:`iter_grids`. Takes the same filters as :meth:`get_icons_by_gameid`.
+        """
+        queries = _page_queries(game_id, _query(query, styles, dimensions, mimes, types, is_nsfw, is_humor))
+        return self._iter_assets(AssetType.Icon, game_id, queries)
+
+    def bulk_assets(
+        self,
+        app_ids: List[int],
+        asset_types: List[AssetType] = [AssetType.Grid],
+        filters: Union[AssetQuery, dict, None] = None,
+        platform: PlatformType = PlatformType.Steam,
+        max_workers: int = 4,
+    ) -> Dict[int, Dict[AssetType, List[Asset]]]:
+        """Fetches assets for many games at once through the multi-id platform endpoints.
+
+        The ids are packed into as few ``/{assets}/{platform}/{id,id,...}``
+        requests as the URL length and per-request id limits allow, and the
+        requests are sent from ``max_workers`` threads under the client's
+        rate limiter.
+
+        Parameters
+        -----------
+        app_ids: List[:class:`int`]
+            The platform ids of the games, Steam app ids by default.
+        asset_types: List[:class:`AssetType`]
+            The kinds of assets to fetch. Defaults to grids only.
+        filters: Union[:class:`AssetQuery`, :class:`dict`, None]
+            An :class:`AssetQuery` or the keyword filters of
+            :meth:`get_grids_by_platform` (``styles``, ``dimensions``, ``mimes``,
+            ``types``, ``is_nsfw``, ``is_humor``), either applied to every
+            asset type or keyed by :class:`AssetType`.
+        platform: :class:`PlatformType`
+            The platform the ids belong to. Defaults to Steam.
+        max_workers: :class:`int`
+            How many requests may be in flight at once. Defaults to 4.
+
+        Raises
+        --------
+        TypeError
+            If one of the parameters is not of the correct type.
+        HTTPException
+            If there is an error with the request.
+
+        Returns
+        --------
+        Dict[:class:`int`, Dict[:class:`AssetType`, List[:class:`Asset`]]]
+            The assets of every requested id, by asset type. Ids unknown to
+            SteamGridDB map to empty lists.
+        """
+        results = {}
+        for asset_type, app_id, items in self._bulk_fetch(app_ids, asset_types, filters, platform, max_workers):
+            results.setdefault(app_id, {t: [] for t in asset_types})[asset_type] = bulk.build_assets(asset_type, items, self._http)
+        return results
+
+    def bulk_asset_table(
+        self,
+        app_ids: List[int],
+        asset_type: AssetType = AssetType.Grid,
+        filters: Union[AssetQuery, dict, None] = None,
+        platform: PlatformType = PlatformType.Steam,
+        max_workers: int = 4,
+    ) -> AssetTable:
+        """Same as :meth:`bulk_assets` for a single asset type, but returns the
+        assets as a columnar :class:`AssetTable` instead of objects.
+
+        The ``game_id`` column holds the platform id each asset was fetched for.
+
+        Raises
+        --------
+        TypeError
+            If one of the parameters is not of the correct type.
+        HTTPException
+            If there is an error with the request.
+
+        Returns
+        --------
+        :class:`AssetTable`
+            The assets of every requested id.
+        """
+        table = AssetTable(asset_type, self._http)
+        for _, app_id, items in self._bulk_fetch(app_ids, [asset_type], filters, platform, max_workers):
+            table.extend(items, app_id)
+        return table
+
+    def _bulk_fetch(
+        self,
+        app_ids: List[int],
+        asset_types: List[AssetType],
+        filters: Union[AssetQuery, dict, None],
+        platform: PlatformType,
+        max_workers: int,
+    ) -> Iterator[Tuple[AssetType, int, List[dict]]]:
+        # Yields (asset type, app id, asset dicts) for every requested id;
+        # validation happens before the first request.
+        if not isinstance(app_ids, List):
+            raise TypeError('\'app_ids\' must be a list of integers.')
+        if not isinstance(platform, PlatformType):
+            raise TypeError('\'platform\' must be a PlatformType.')
+
+        app_ids = bulk.unique(app_ids)
+        queries = _bulk_queries(asset_types, filters)
+        results = {app_id: {asset_type: [] for asset_type in asset_types} for app_id in app_ids}
+
+        def fetch(job):
+            asset_type, chunk = job
+            getter = getattr(self._http, bulk.HTTP_GETTERS[asset_type])
+            try:
+                payloads = getter(chunk, 'platform', platform=platform.value, queries=queries[asset_type])
+            except HTTPException as e:
+                # A lone unknown id is a plain 404 rather than an envelope.
+                if len(chunk) == 1 and e.status == 404:
+                    payloads = []
+                else:
+                    raise
+            return asset_type, chunk, payloads
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for asset_type, chunk, payloads in executor.map(fetch, _bulk_jobs(self._http, app_ids, platform, queries)):
+                for app_id, items in bulk.split_platform_payload(chunk, payloads).items():
+                    results[app_id][asset_type] = items
+
+        for app_id, by_type in results.items():
+            for asset_type, items in by_type.items():
+                yield asset_type, app_id, items
+
+    def bulk_delete(
+        self,
+        asset_ids: List[int],
+        asset_type: AssetType = AssetType.Grid,
+        max_workers: int = 4,
+    ) -> bulk.DeleteReport:
+        """Deletes many assets of one type, reporting the outcome of every id.
+
+        The ids are split into URL-safe chunks that are deleted from
+        ``max_workers`` threads under the client's rate limiter. A chunk
+        rejected with a client error (e.g. an asset you do not own) is
+        bisected until the offending ids are isolated; other errors fail the
+        whole chunk. Nothing is raised for failed ids.
+
+        Parameters
+        -----------
+        asset_ids: List[:class:`int`]
+            The asset ids to delete.
+        asset_type: :class:`AssetType`
+            The type of the assets. Defaults to grids.
+        max_workers: :class:`int`
+            How many requests may be in flight at once. Defaults to 4.
+
+        Raises
+        --------
+        TypeError
+            If one of the parameters is not of the correct type.
+
+        Returns
+        --------
+        :class:`DeleteReport`
+            The error of every id, ``None`` for deleted ones.
+        """
+        if not isinstance(asset_ids, List):
+            raise TypeError('\'asset_ids\' must be a list of integers.')
+        if not isinstance(asset_type, AssetType):
+            raise TypeError('\'asset_type\' must be an AssetType.')
+
+        deleter = getattr(self._http, bulk.HTTP_DELETERS[asset_type])
+        prefix = self._http.BASE_URL + '/' + bulk.ASSET_PATHS[asset_type] + '/'
+        results = {}
+
+        def delete(chunk):
+            try:
+                deleter(chunk)
+            except HTTPException as e:
+                if len(chunk) > 1 and bulk.should_split(e):
+                    middle = len(chunk) // 2
+                    delete(chunk[:middle])
+                    delete(chunk[middle:])
+                else:
+                    results.update(dict.fromkeys(chunk, e))
+            else:
+                results.update(dict.fromkeys(chunk))
+
+        asset_ids = bulk.unique(asset_ids)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(delete, bulk.chunk_ids(asset_ids, prefix)))
+
+        return bulk.DeleteReport(asset_type, {i: results[i] for i in asset_ids})
+
     def delete_grid(
         self,
         grid_ids: List[int],
@@ -819,8 +1176,58 @@ class SteamGridDB:
         if not isinstance(term, str):
             raise TypeError('\'term\' must be a string.')
 
-        payloads = self._http.search_games(term)
-        return [Game(payload) for payload in payloads]
+        cache = self._http.autocomplete
+        payloads = cache.get(term) if cache is not None else None
+        if payloads is None:
+            payloads = self._http.search_games(term)
+            if cache is not None:
+                cache.set(term, payloads)
+        return [self._http.games.add(payload) for payload in payloads]
+
+    def resolve_game(
+        self,
+        name: str,
+        threshold: Optional[float] = None,
+    ) -> Optional[Game]:
+        """Returns the game best matching a name, preferring the local index.
+
+        The name is first looked up in ``games.names``, the offline index
+        of every game seen by this client plus anything added to it, such
+        as ``steam_helpers.get_installed_games()``. Only when nothing there
+        is similar enough is the website searched, and its closest result
+        returned.
+
+        Parameters
+        -----------
+        name: :class:`str`
+            The name of the game, e.g. the name of a Steam library entry.
+        threshold: Optional[:class:`float`]
+            Lowest similarity to accept. Defaults to the resolver threshold.
+
+        Raises
+        --------
+        TypeError
+            If the name is not a string.
+        HTTPException
+            If there is an error with the request.
+
+        Returns
+        --------
+        Optional[:class:`Game`]
+            The game, ``None`` if nothing matches.
+        """
+        if not isinstance(name, str):
+            raise TypeError('\'name\' must be a string.')
+
+        resolver = self._http.games.names
+        match = resolver.resolve(name, threshold)
+        if match is not None and match.game_id is not None:
+            return self.get_game_by_gameid(match.game_id)
+        if match is not None and match.app_id is not None:
+            game = self.get_game_by_steam_appid(match.app_id)
+            if game is not None:
+                return game
+        return _closest_game(resolver, name, self.search_game(name), threshold)
 
     def set_auth_key(
         self, 
@@ -847,4 +1254,4 @@ class SteamGridDB:
         if len(auth_key) != 32:
             raise ValueError('\'auth_key\' must be a 32-character string.')
 
-        self._http.session.headers['Authorization'] = f'Bearer {auth_key}'
+        self._http.set_auth_key(auth_key)
@@ -0,0 +1,372 @@
+"""
+The MIT License (MIT)
+Copyright (c) 2015-present Rapptz
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import heapq
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .asset import Asset
+from .bulk import ASSET_CLASSES
+from .enums import AssetType
+
+__all__ = (
+    'AssetTable',
+)
+
+# Numeric columns and their array typecodes
+_COLUMNS = (
+    ('id', 'q'),
+    ('game_id', 'q'),
+    ('score', 'l'),
+    ('width', 'l'),
+    ('height', 'l'),
+    ('upvotes', 'l'),
+    ('downvotes', 'l'),
+    ('nsfw', 'b'),
+    ('humor', 'b'),
+    ('epilepsy', 'b'),
+    ('lock', 'b'),
+    ('mime', 'H'),
+    ('style', 'H'),
+)
+
+def _code(values: Iterable[Any], index: Dict[Any, int]) -> set:
+    return {index[value] for value in values if value in index}
+
+class AssetTable:
+    """A columnar result set of assets of one type.
+
+    The numeric fields of every asset are held in typed :mod:`array` columns
+    and ``mime``/``style`` as codes into interned string tables, so filtering,
+    sorting and top-k selection never build :class:`Asset` objects. The
+    response dicts are not kept: the dict of a row is rebuilt from the
+    columns only when its :class:`Asset` is created through :meth:`asset`
+    or :meth:`assets`.
+
+    Rows are plain integers; the selection methods take and return sequences
+    of rows so that they can be chained.
+
+    .. container:: operations
+        .. describe:: len(x)
+            Returns the number of rows.
+        .. describe:: x[row]
+            Returns the :class:`Asset` of a row.
+
+    Attributes
+    -----------
+    type: :class:`AssetType`
+        The type of the assets.
+    id, game_id, score, width, height, upvotes, downvotes: :class:`array.array`
+        Integer columns. ``game_id`` is the id the asset was fetched under,
+        e.g. the Steam app id for :meth:`SteamGridDB.bulk_asset_table`.
+    nsfw, humor, epilepsy, lock: :class:`array.array`
+        Flag columns holding ``0`` or ``1``.
+    mime, style, author: :class:`array.array`
+        Codes into :attr:`mimes`, :attr:`styles` and :attr:`authors`.
+    mimes, styles: List[:class:`str`]
+        The interned strings of the ``mime`` and ``style`` columns.
+    authors: List[:class:`str`]
+        The interned ``steam64`` of the ``author`` column.
+    """
+
+    __slots__ = (
+        '_http',
+        '_url',
+        '_thumb',
+        '_language',
+        '_languages',
+        '_language_index',
+        '_notes',
+        '_notes_strings',
+        '_notes_index',
+        '_author_payloads',
+        '_mime_index',
+        '_style_index',
+        '_author_index',
+        '_by_game',
+        'type',
+        'mimes',
+        'styles',
+        'author',
+        'authors',
+        '__weakref__',
+    ) + tuple(name for name, _ in _COLUMNS)
+
+    def __init__(self, type: AssetType, http) -> None:
+        self._http = http
+        self._url: List[Optional[str]] = []
+        self._thumb: List[Optional[str]] = []
+        self._language = array('l')
+        self._languages: List[Optional[str]] = []
+        self._language_index: Dict[Optional[str], int] = {}
+        self._notes = array('l')
+        self._notes_strings: List[Optional[str]] = []
+        self._notes_index: Dict[Optional[str], int] = {}
+        self._author_payloads: List[dict] = []
+        self._mime_index: Dict[str, int] = {}
+        self._style_index: Dict[str, int] = {}
+        self._author_index: Dict[str, int] = {}
+        self._by_game: Optional[Dict[int, array]] = None
+        self.type = type
+        self.mimes: List[str] = []
+        self.styles: List[str] = []
+        self.author = array('l')
+        self.authors: List[str] = []
+        for name, typecode in _COLUMNS:
+            setattr(self, name, array(typecode))
+
+    @classmethod
+    def from_payloads(
+        cls,
+        type: AssetType,
+        payloads: Iterable[dict],
+        http,
+        game_id: int = 0,
+    ) -> 'AssetTable':
+        """Builds a table from asset response dicts, all fetched for ``game_id``."""
+        table = cls(type, http)
+        table.extend(payloads, game_id)
+        return table
+
+    def __repr__(self) -> str:
+        return f'<AssetTable type={self.type.name} rows={len(self)}>'
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def __getitem__(self, row: int) -> Asset:
+        return self.asset(row)
+
+    def _intern(self, value: Optional[str], index: Dict[str, int], strings: List[str]) -> int:
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(strings)
+            strings.append(value)
+        return code
+
+    def extend(self, payloads: Iterable[dict], game_id: int = 0) -> None:
+        """Appends asset response dicts fetched for ``game_id``."""
+        for asset in payloads:
+            self.id.append(asset.get('id') or 0)
+            self.game_id.append(game_id)
+            self.score.append(asset.get('score') or 0)
+            self.width.append(asset.get('width') or 0)
+            self.height.append(asset.get('height') or 0)
+            self.upvotes.append(asset.get('upvotes') or 0)
+            self.downvotes.append(asset.get('downvotes') or 0)
+            self.nsfw.append(bool(asset.get('nsfw')))
+            self.humor.append(bool(asset.get('humor')))
+            self.epilepsy.append(bool(asset.get('epilepsy')))
+            self.lock.append(bool(asset.get('lock')))
+            self.mime.append(self._intern(asset.get('mime'), self._mime_index, self.mimes))
+            self.style.append(self._intern(asset.get('style'), self._style_index, self.styles))
+            self._url.append(asset.get('url'))
+            self._thumb.append(asset.get('thumb'))
+            self._language.append(self._intern(asset.get('language'), self._language_index, self._languages))
+            self._notes.append(self._intern(asset.get('notes'), self._notes_index, self._notes_strings))
+            author = asset.get('author') or {}
+            steam64 = author.get('steam64') or author.get('name') or ''
+            code = self._intern(steam64, self._author_index, self.authors)
+            if code == len(self._author_payloads):
+                self._author_payloads.append(author)
+            self.author.append(code)
+        self._by_game = None
+
+    def _payload(self, row: int) -> dict:
+        # Rebuilds the response dict of a row from the columns
+        return {
+            'id': self.id[row],
+            'score': self.score[row],
+            'style': self.styles[self.style[row]],
+            'width': self.width[row],
+            'height': self.height[row],
+            'nsfw': bool(self.nsfw[row]),
+            'humor': bool(self.humor[row]),
+            'notes': self._notes_strings[self._notes[row]],
+            'mime': self.mimes[self.mime[row]],
+            'language': self._languages[self._language[row]],
+            'url': self._url[row],
+            'thumb': self._thumb[row],
+            'lock': bool(self.lock[row]),
+            'epilepsy': bool(self.epilepsy[row]),
+            'upvotes': self.upvotes[row],
+            'downvotes': self.downvotes[row],
+            'author': self._author_payloads[self.author[row]],
+        }
+
+    def rows(self) -> range:
+        """:class:`range`: Returns every row."""
+        return range(len(self))
+
+    def games(self) -> Dict[int, array]:
+        """Dict[:class:`int`, :class:`array.array`]: Returns the rows of every ``game_id``, in table order."""
+        if self._by_game is None:
+            by_game: Dict[int, array] = {}
+            for row, game_id in enumerate(self.game_id):
+                rows = by_game.get(game_id)
+                if rows is None:
+                    rows = by_game[game_id] = array('l')
+                rows.append(row)
+            self._by_game = by_game
+        return self._by_game
+
+    def filter(
+        self,
+        rows: Optional[Sequence[int]] = None,
+        game_ids: Optional[Iterable[int]] = None,
+        dimensions: Optional[Iterable[str]] = None,
+        mimes: Optional[Iterable[str]] = None,
+        styles: Optional[Iterable[str]] = None,
+        min_score: Optional[int] = None,
+        min_upvotes: Optional[int] = None,
+        nsfw: Optional[bool] = None,
+        humor: Optional[bool] = None,
+        epilepsy: Optional[bool] = None,
+    ) -> array:
+        """Selects the rows matching every given condition.
+
+        Parameters
+        -----------
+        rows: Optional[Sequence[:class:`int`]]
+            The rows to select from. Defaults to every row.
+        game_ids: Optional[Iterable[:class:`int`]]
+            Keep the rows of these games only.
+        dimensions: Optional[Iterable[:class:`str`]]
+            Keep these ``'WIDTHxHEIGHT'`` sizes only.
+        mimes: Optional[Iterable[:class:`str`]]
+            Keep these MIME types only.
+        styles: Optional[Iterable[:class:`str`]]
+            Keep these styles only.
+        min_score: Optional[:class:`int`]
+            Keep rows scoring at least this much.
+        min_upvotes: Optional[:class:`int`]
+            Keep rows with at least this many upvotes.
+        nsfw: Optional[:class:`bool`]
+            Keep rows with this NSFW flag only.
+        humor: Optional[:class:`bool`]
+            Keep rows with this humor flag only.
+        epilepsy: Optional[:class:`bool`]
+            Keep rows with this epilepsy flag only.
+
+        Returns
+        --------
+        :class:`array.array`
+            The matching rows, in input order.
+        """
+        if rows is None:
+            rows = self.rows()
+        if game_ids is not None:
+            by_game = self.games()
+            wanted = set()
+            for game_id in game_ids:
+                wanted.update(by_game.get(game_id, ()))
+            rows = [row for row in rows if row in wanted]
+        if dimensions is not None:
+            sizes = set()
+            for dimension in dimensions:
+                width, height = (int(i) for i in str(dimension).split('x'))
+                sizes.add((width, height))
+            width_column, height_column = self.width, self.height
+            rows = [row for row in rows if (width_column[row], height_column[row]) in sizes]
+        if mimes is not None:
+            rows = self._keep(rows, self.mime, _code(mimes, self._mime_index))
+        if styles is not None:
+            rows = self._keep(rows, self.style, _code(styles, self._style_index))
+        if min_score is not None:
+            column = self.score
+            rows = [row for row in rows if column[row] >= min_score]
+        if min_upvotes is not None:
+            column = self.upvotes
+            rows = [row for row in rows if column[row] >= min_upvotes]
+        for column, flag in ((self.nsfw, nsfw), (self.humor, humor), (self.epilepsy, epilepsy)):
+            if flag is not None:
+                rows = self._keep(rows, column, {int(flag)})
+        return array('l', rows)
+
+    @staticmethod
+    def _keep(rows: Sequence[int], column: array, codes: set) -> List[int]:
+        return [row for row in rows if column[row] in codes]
+
+    def _key(self, key: str) -> Callable[[int], Any]:
+        if key == 'votes':
+            upvotes, downvotes = self.upvotes, self.downvotes
+            return lambda row: upvotes[row] - downvotes[row]
+        if key not in {name for name, _ in _COLUMNS}:
+            raise ValueError(f'Unknown column {key!r}.')
+        return getattr(self, key).__getitem__
+
+    def sort(
+        self,
+        rows: Optional[Sequence[int]] = None,
+        key: str = 'score',
+        reverse: bool = True,
+    ) -> array:
+        """Sorts rows by a column, or by ``'votes'`` (upvotes minus downvotes).
+
+        The sort is stable and descending by default.
+        """
+        if rows is None:
+            rows = self.rows()
+        return array('l', sorted(rows, key=self._key(key), reverse=reverse))
+
+    def top(
+        self,
+        k: int,
+        rows: Optional[Sequence[int]] = None,
+        key: str = 'score',
+    ) -> array:
+        """Returns the ``k`` rows with the highest ``key``, best first."""
+        if rows is None:
+            rows = self.rows()
+        return array('l', heapq.nlargest(k, rows, key=self._key(key)))
+
+    def top_per_game(
+        self,
+        k: int,
+        rows: Optional[Sequence[int]] = None,
+        key: str = 'score',
+    ) -> Dict[int, array]:
+        """Returns the ``k`` rows with the highest ``key`` of every game, best first."""
+        if rows is None:
+            groups = self.games()
+        else:
+            groups = {}
+            game_column = self.game_id
+            for row in rows:
+                groups.setdefault(game_column[row], []).append(row)
+        sort_key = self._key(key)
+        return {
+            game_id: array('l', heapq.nlargest(k, group, key=sort_key))
+            for game_id, group in groups.items()
+        }
+
+    def asset(self, row: int) -> Asset:
+        """:class:`Asset`: Builds the asset object of a row."""
+        return ASSET_CLASSES[self.type](self._payload(row), self._http)
+
+    def assets(self, rows: Optional[Sequence[int]] = None) -> List[Asset]:
+        """List[:class:`Asset`]: Builds the asset objects of the given rows, by default all of them."""
+        if rows is None:
+            rows = self.rows()
+        return [self.asset(row) for row in rows]
+
+    def __iter__(self) -> Iterator[Asset]:
+        for row in self.rows():
+            yield self.asset(row)
@@ -0,0 +1,252 @@
+"""
+The MIT License (MIT)
+Copyright (c) 2015-present Rapptz
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import asyncio
+from typing import Mapping, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+__all__ = (
+    'Response',
+    'TransportError',
+    'Transport',
+    'AsyncTransport',
+    'RequestsTransport',
+    'AiohttpTransport',
+)
+
+DEFAULT_TIMEOUT: Tuple[float, float] = (5.0, 30.0)
+
+class TransportError(Exception):
+    """Exception raised by a transport when no response could be obtained,
+    e.g. on connection failures and timeouts. These are retried by the client.
+    """
+    pass
+
+
+class Response:
+    """A response as returned by a transport.
+
+    Attributes
+    -----------
+    status: :class:`int`
+        The HTTP status code.
+    headers: Mapping[:class:`str`, :class:`str`]
+        The response headers. Lookups must be case-insensitive.
+    content: :class:`bytes`
+        The raw response body.
+    """
+
+    __slots__ = (
+        'status',
+        'headers',
+        'content',
+    )
+
+    def __init__(self, status: int, headers: Mapping[str, str], content: bytes) -> None:
+        self.status = status
+        self.headers = headers
+        self.content = content
+
+    def __repr__(self) -> str:
+        return f'<Response status={self.status} size={len(self.content)}>'
+
+
+class Transport:
+    """Interface of the blocking transports used by :class:`HTTPClient`.
+
+    Implement :meth:`request` to plug in another HTTP library, for example
+    an HTTP/2-capable one.
+    """
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> Response:
+        """Sends one request and returns its :class:`Response`.
+
+        Raises :exc:`TransportError` if no response was received.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Releases pooled connections."""
+        pass
+
+
+class AsyncTransport:
+    """Interface of the asyncio transports used by :class:`AsyncHTTPClient`."""
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> Response:
+        """Sends one request and returns its :class:`Response`.
+
+        Raises :exc:`TransportError` if no response was received.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Releases pooled connections."""
+        pass
+
+
+class RequestsTransport(Transport):
+    """Transport backed by a pooled :class:`requests.Session`.
+
+    Parameters
+    -----------
+    pool_connections: :class:`int`
+        Number of hosts to keep connection pools for. Defaults to 4.
+    pool_maxsize: :class:`int`
+        Maximum connections kept open per host. Should be at least the number
+        of threads sharing the client. Defaults to 32.
+    pool_block: :class:`bool`
+        Whether to wait for a free connection instead of opening a throwaway
+        one when the pool is exhausted. Defaults to False.
+    keep_alive: :class:`bool`
+        Whether connections are reused between requests. Defaults to True.
+    timeout: Tuple[:class:`float`, :class:`float`]
+        The ``(connect, read)`` timeouts in seconds. Defaults to ``(5, 30)``.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 32,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+    ) -> None:
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> Response:
+        try:
+            responce = self.session.request(
+                method, url, params=params, data=data, headers=headers, timeout=self.timeout
+            )
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            raise TransportError(str(e)) from e
+
+        return Response(responce.status_code, responce.headers, responce.content)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class AiohttpTransport(AsyncTransport):
+    """Transport backed by a pooled :class:`aiohttp.ClientSession`.
+
+    The session is created on first use, inside the running event loop.
+
+    Parameters
+    -----------
+    limit: :class:`int`
+        Maximum number of open connections. Defaults to 100.
+    limit_per_host: :class:`int`
+        Maximum number of open connections per host. Defaults to 32.
+    keep_alive: :class:`bool`
+        Whether connections are reused between requests. Defaults to True.
+    timeout: Tuple[:class:`float`, :class:`float`]
+        The ``(connect, read)`` timeouts in seconds. Defaults to ``(5, 30)``.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 32,
+        keep_alive: bool = True,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+    ) -> None:
+        if aiohttp is None:
+            raise RuntimeError('aiohttp is required for the asyncio client: pip install aiohttp')
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.session = None
+
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        # The session is bound to the running loop, so it is created lazily.
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                force_close=not self.keep_alive
+            )
+            connect, read = self.timeout
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+            )
+        return self.session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> Response:
+        session = self._get_session()
+        try:
+            async with session.request(method, url, params=params, data=data, headers=headers) as responce:
+                return Response(responce.status, responce.headers, await responce.read())
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            raise TransportError(str(e)) from e
+
+    async def close(self) -> None:
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
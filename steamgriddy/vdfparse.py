@@ -0,0 +1,205 @@
+"""
+The MIT License (MIT)
+Copyright (c) 2015-present Rapptz
+Permission is hereby granted, free of charge, to any person obtaining a
+copy of this software and associated documentation files (the "Software"),
+to deal in the Software without restriction, including without limitation
+the rights to use, copy, modify, merge, publish, distribute, sublicense,
+and/or sell copies of the Software, and to permit persons to whom the
+Software is furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in
+all copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS
+OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+DEALINGS IN THE SOFTWARE.
+"""
+
+import mmap
+import re
+from typing import Any, Dict, Iterable, Tuple, Union
+
+__all__ = (
+    'VDFError',
+    'select',
+    'select_file',
+)
+
+# Whitespace, comments and platform conditionals such as [$WIN32] are
+# skipped before every token.
+_TOKEN = re.compile(rb'(?:\s+|//[^\n]*|\[[^\]\n]*\])*(?:"((?:[^"\\]|\\.)*)"|([{}])|([^\s{}"]+)|\Z)')
+
+# Everything up to the next brace. Strings and comments are consumed whole so
+# braces inside them are ignored; written unrolled so the regex engine does
+# not backtrack.
+_FLAT = rb'[^{}"/]*(?:(?:"[^"\\]*(?:\\.[^"\\]*)*"|//[^\n]*|/)[^{}"/]*)*'
+
+def _nested(depth: int) -> bytes:
+    body = _FLAT
+    for _ in range(depth):
+        body = _FLAT + rb'(?:\{' + body + rb'\}' + _FLAT + rb')*'
+    return body
+
+# Consumes the content of a block, nested blocks up to four levels deep
+# included, so skipped subtrees are walked by the regex engine alone.
+_SKIP = re.compile(_nested(4))
+
+_ESCAPES = re.compile(rb'\\(.)')
+_ESCAPED = {b'n': b'\n', b't': b'\t', b'\\': b'\\', b'"': b'"'}
+
+class VDFError(Exception):
+    """Exception raised when a text VDF document is malformed."""
+
+def _unescape(raw: bytes) -> str:
+    if b'\\' in raw:
+        raw = _ESCAPES.sub(lambda m: _ESCAPED.get(m.group(1), m.group(0)), raw)
+    return raw.decode('utf-8', 'replace')
+
+class _Reader:
+    __slots__ = ('data', 'pos')
+
+    def __init__(self, data: Union[bytes, mmap.mmap]) -> None:
+        self.data = data
+        self.pos = 0
+
+    def token(self) -> Tuple[int, Any]:
+        # Returns (kind, value): 0 for a string, 1 for a brace, -1 at the end.
+        m = _TOKEN.match(self.data, self.pos)
+        if m is None:
+            raise VDFError(f'Unexpected character at offset {self.pos}.')
+        self.pos = m.end()
+        quoted, brace, bare = m.groups()
+        if brace is not None:
+            return 1, brace
+        if quoted is not None:
+            return 0, quoted
+        if bare is not None:
+            return 0, bare
+        return -1, None
+
+    def skip(self) -> None:
+        # Skips the rest of a subtree whose opening brace was just read.
+        data, depth = self.data, 1
+        while depth:
+            pos = _SKIP.match(data, self.pos).end()
+            brace = data[pos:pos + 1]
+            if brace == b'{':
+                depth += 1
+            elif brace == b'}':
+                depth -= 1
+            else:
+                raise VDFError(f'Unterminated block at offset {pos}.')
+            self.pos = pos + 1
+
+    def subtree(self) -> Dict[str, Any]:
+        # Builds the rest of a subtree whose opening brace was just read,
+        # merging duplicate blocks like the vdf package does.
+        result: Dict[str, Any] = {}
+        while True:
+            kind, key = self.token()
+            if kind == 1 and key == b'}':
+                return result
+            if kind != 0:
+                raise VDFError(f'Expected a key at offset {self.pos}.')
+            kind, value = self.token()
+            name = _unescape(key)
+            if kind == 0:
+                result[name] = _unescape(value)
+            elif value == b'{':
+                child = self.subtree()
+                existing = result.get(name)
+                if isinstance(existing, dict):
+                    existing.update(child)
+                else:
+                    result[name] = child
+            else:
+                raise VDFError(f'Expected a value for {name!r} at offset {self.pos}.')
+
+def _split(path: str) -> Tuple[str, ...]:
+    return tuple(part.lower() for part in path.strip('/').split('/'))
+
+def select(data: Union[str, bytes, mmap.mmap], paths: Iterable[str]) -> Dict[str, Any]:
+    """Reads only the requested key paths of a text VDF document.
+
+    The document is scanned once. Subtrees that cannot contain a requested
+    path are skipped without being decoded, and scanning stops as soon as
+    every path has been found. Like Steam, keys are matched without regard
+    to case; when a path occurs more than once the first occurrence wins.
+
+    Parameters
+    -----------
+    data: Union[:class:`str`, :class:`bytes`, :class:`mmap.mmap`]
+        The document.
+    paths: Iterable[:class:`str`]
+        ``/``-separated key paths, e.g. ``'UserLocalConfigStore/friends/PersonaName'``.
+
+    Raises
+    --------
+    VDFError
+        If the document is malformed before every path was found.
+
+    Returns
+    --------
+    Dict[:class:`str`, Any]
+        The value of every path found, keyed by path as given. Values are
+        strings, or dicts for whole subtrees.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    wanted = {_split(path): path for path in paths}
+    prefixes = {key[:i] for key in wanted for i in range(1, len(key))}
+    found: Dict[str, Any] = {}
+    if not wanted:
+        return found
+
+    reader = _Reader(data)
+    stack: Tuple[str, ...] = ()
+    while True:
+        kind, key = reader.token()
+        if kind == -1:
+            if stack:
+                raise VDFError('Unexpected end of document.')
+            return found
+        if kind == 1:
+            if key != b'}' or not stack:
+                raise VDFError(f'Unexpected brace at offset {reader.pos}.')
+            stack = stack[:-1]
+            continue
+
+        kind, value = reader.token()
+        if kind == -1:
+            raise VDFError('Unexpected end of document.')
+        if kind == 1 and value != b'{':
+            raise VDFError(f'Expected a value at offset {reader.pos}.')
+
+        path = stack + (_unescape(key).lower(),)
+        if path in wanted:
+            found[wanted.pop(path)] = _unescape(value) if kind == 0 else reader.subtree()
+            if not wanted:
+                return found
+            prefixes = {key[:i] for key in wanted for i in range(1, len(key))}
+        elif kind == 1:
+            if path in prefixes:
+                stack = path
+            else:
+                reader.skip()
+
+def select_file(path: str, paths: Iterable[str]) -> Dict[str, Any]:
+    """Same as :func:`select`, reading the document from a file.
+
+    The file is memory-mapped, so the parts after the last requested path
+    are never read from disk.
+    """
+    with open(path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return select(b'', paths)
+        try:
+            return select(data, paths)
+        finally:
+            data.close()
@@ -0,0 +1,99 @@
+import struct
+
+import pytest
+
+from steamgriddy import SteamGridDB
+from steamgriddy.fakeserver import FakeSteamGridDB
+
+AUTH_KEY = 'a' * 32
+
+
+@pytest.fixture(scope='session')
+def fake():
+    with FakeSteamGridDB(games=40, auth_key=AUTH_KEY, seed=1) as server:
+        yield server
+
+
+@pytest.fixture
+def sgdb(fake):
+    fake.reset()
+    client = SteamGridDB(AUTH_KEY, base_url=fake.base_url)
+    yield client
+    client.close()
+
+
+def asset_payload(asset_id, **fields):
+    payload = {
+        'id': asset_id,
+        'score': 0,
+        'style': 'alternate',
+        'width': 600,
+        'height': 900,
+        'nsfw': False,
+        'humor': False,
+        'notes': None,
+        'mime': 'image/png',
+        'language': 'en',
+        'url': f'https://cdn.example.invalid/{asset_id}.png',
+        'thumb': f'https://cdn.example.invalid/thumb/{asset_id}.png',
+        'lock': False,
+        'epilepsy': False,
+        'upvotes': 0,
+        'downvotes': 0,
+        'author': {'name': 'artist', 'steam64': '76561198000000001', 'avatar': 'a.png'},
+    }
+    payload.update(fields)
+    return payload
+
+
+MAGICS = {27: 0x07564427, 28: 0x07564428, 29: 0x07564429}
+
+
+def encode(mapping, keys=None):
+    """Binary VDF of ``mapping``; with ``keys`` (a dict) keys are string table indexes."""
+    out = bytearray()
+
+    def key(name):
+        if keys is None:
+            return name.encode() + b'\x00'
+        return struct.pack('<I', keys.setdefault(name, len(keys)))
+
+    for name, value in mapping.items():
+        if isinstance(value, dict):
+            out += b'\x00' + key(name) + encode(value, keys) + b'\x08'
+        elif isinstance(value, int):
+            out += b'\x02' + key(name) + struct.pack('<i', value)
+        else:
+            out += b'\x01' + key(name) + value.encode() + b'\x00'
+    return bytes(out)
+
+
+def app(app_id, kind='Game'):
+    return {'appinfo': {
+        'appid': app_id,
+        'extended': {'developer': 'Valve', 'nested': {'deep': {'deeper': 'x'}}},
+        'common': {
+            'name': f'Game {app_id}',
+            'type': kind,
+            'clienticon': f'icon{app_id}',
+            'library_assets': {'library_capsule': 'en'},
+        },
+    }}
+
+
+def write_appinfo(path, version, apps):
+    keys = {} if version == 29 else None
+    header_size = 40 if version == 27 else 60
+    records = bytearray()
+    for app_id, payload in apps.items():
+        blob = encode(payload, keys) + b'\x08'
+        records += struct.pack('<II', app_id, header_size + len(blob)) + b'\x00' * header_size + blob
+    records += struct.pack('<I', 0)
+    if version == 29:
+        head = struct.pack('<IIq', MAGICS[version], 1, 16 + len(records))
+        table = struct.pack('<I', len(keys)) + b''.join(name.encode() + b'\x00' for name in keys)
+        data = head + bytes(records) + table
+    else:
+        data = struct.pack('<II', MAGICS[version], 1) + bytes(records)
+    path.write_bytes(data)
+    return str(path)
@@ -0,0 +1,81 @@
+import struct
+
+import pytest
+
+from steamgriddy.appinfo import AppInfo, AppInfoError, _Decoder, read_shortcuts
+
+from conftest import app, encode, write_appinfo
+
+
+@pytest.mark.parametrize('version', [27, 28, 29])
+def test_appinfo_versions(tmp_path, version):
+    apps = {10: app(10), 20: app(20, 'DLC'), 30: app(30)}
+    with AppInfo(write_appinfo(tmp_path / 'appinfo.vdf', version, apps)) as appinfo:
+        assert appinfo.version == version
+        assert len(appinfo) == 3 and list(appinfo) == [10, 20, 30]
+        assert 20 in appinfo and 40 not in appinfo
+        assert appinfo.name(30) == 'Game 30'
+        assert appinfo.type(20) == 'dlc'
+        assert appinfo.assets(10) == {'clienticon': 'icon10', 'library_assets': {'library_capsule': 'en'}}
+        assert appinfo.summary(10)['name'] == 'Game 10'
+        assert appinfo.get(10) == apps[10]['appinfo']
+        assert appinfo.name(40) is None and appinfo.get(40) is None and appinfo.summary(40) is None
+
+
+def test_appinfo_rejects_other_files(tmp_path):
+    path = tmp_path / 'appinfo.vdf'
+    path.write_bytes(struct.pack('<II', 0x12345678, 1))
+    with pytest.raises(AppInfoError):
+        AppInfo(str(path))
+    path.write_bytes(b'')
+    with pytest.raises(AppInfoError):
+        AppInfo(str(path))
+
+
+def test_read_shortcuts(tmp_path):
+    path = tmp_path / 'shortcuts.vdf'
+    path.write_bytes(encode({'shortcuts': {
+        '0': {'appid': -1234567890, 'AppName': 'Emulator', 'Exe': '"/usr/bin/emu"', 'StartDir': '"/usr/bin/"',
+              'tags': {'0': 'favorite'}},
+        '1': {'appname': 'Old Shortcut', 'exe': '"old.exe"'},
+    }}) + b'\x08')
+    emulator, old = read_shortcuts(str(path))
+    assert emulator.name == 'Emulator' and emulator.exe == '"/usr/bin/emu"' and emulator.tags == ['favorite']
+    assert emulator.app_id == -1234567890 & 0xFFFFFFFF
+    assert emulator.game_id == (emulator.app_id << 32) | 0x02000000
+    # Shortcuts without a stored id get the checksum Steam derives from exe and name
+    assert old.name == 'Old Shortcut' and old.app_id & 0x80000000
+
+    path.write_bytes(b'')
+    assert read_shortcuts(str(path)) == []
+
+
+def test_wide_strings():
+    assert _Decoder('hé'.encode('utf-16-le') + b'\x00\x00').value(0x05, 0) == ('hé', 6)
+    # 'Ā' encodes as b'\x00\x01', so the terminator must start at an even offset
+    assert _Decoder(b'a\x00\x00\x01\x00\x00').value(0x05, 0) == ('aĀ', 6)
+
+
+@pytest.mark.parametrize('data', [
+    b'a\x00b',
+    b'a\x00\x00',
+])
+def test_unterminated_wide_string(data):
+    with pytest.raises(AppInfoError):
+        _Decoder(data).value(0x05, 0)
+
+
+@pytest.mark.parametrize('data', [
+    b'\x00child',
+    b'\x00child\x00\x01name',
+    b'\x00child\x00\x02n\x00\x01',
+    b'\x00child\x00\x08',
+])
+def test_corrupt_maps(data):
+    decoder = _Decoder(data)
+    with pytest.raises(AppInfoError):
+        decoder.skip(0)
+    with pytest.raises(AppInfoError):
+        decoder.decode(0)
+    with pytest.raises(AppInfoError):
+        decoder.select(0, [('missing', 'key')])
@@ -0,0 +1,23 @@
+from steamgriddy import AssetType, AuthorRegistry, PlatformType
+
+AUTHOR = {'name': 'artist', 'steam64': '76561198000000001', 'avatar': 'a.png'}
+
+
+def test_assets_are_counted_once_per_type_and_id():
+    registry = AuthorRegistry()
+    registry.record(AUTHOR, AssetType.Grid, 42, 10)
+    registry.record(AUTHOR, AssetType.Grid, 42, 10)
+    registry.record(AUTHOR, AssetType.Hero, 42, 4)
+    registry.record(AUTHOR, AssetType.Logo, None, 1)
+
+    assert registry.count(AUTHOR['steam64']) == 3
+    assert registry.mean_score(AUTHOR['steam64']) == 5.0
+
+
+def test_assets_built_by_the_client_are_counted(sgdb, fake):
+    app_id = fake.app_ids(1)[0]
+    grids = sgdb.get_grids_by_platform([app_id], PlatformType.Steam)
+    sgdb.get_grids_by_platform([app_id], PlatformType.Steam)
+    heroes = sgdb.get_heroes_by_platform([app_id], PlatformType.Steam)
+    total = sum(sgdb.authors.count(author.steam64) for author in sgdb.authors)
+    assert total == len(grids) + len(heroes)
@@ -0,0 +1,71 @@
+import pytest
+
+from steamgriddy import AssetType, SteamGridDB
+from steamgriddy.bulk import chunk_ids, should_split, unique
+from steamgriddy.fakeserver import FakeSteamGridDB
+from steamgriddy.http import HTTPException
+
+from conftest import AUTH_KEY
+
+
+def test_unique_keeps_first_occurrence():
+    assert unique([3, 1, 3, 2, 1]) == [3, 1, 2]
+
+
+def test_chunk_ids_limits():
+    ids = list(range(250))
+    chunks = list(chunk_ids(ids, '/grids/'))
+    assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+    assert sum(chunks, []) == ids
+
+    prefix = 'https://example.invalid/grids/'
+    ids = list(range(10 ** 9, 10 ** 9 + 300))
+    for chunk in chunk_ids(ids, prefix, {'dimensions': '600x900'}, max_url_length=200):
+        assert len(prefix) + len(','.join(map(str, chunk))) + len('?dimensions=600x900') <= 200
+
+
+@pytest.mark.parametrize('status, split', [
+    (400, True),
+    (403, True),
+    (404, True),
+    (401, False),
+    (429, False),
+    (500, False),
+    (None, False),
+])
+def test_should_split(status, split):
+    assert should_split(HTTPException('failed', status)) is split
+
+
+@pytest.fixture
+def foreign():
+    with FakeSteamGridDB(games=10, auth_key=AUTH_KEY, seed=1, foreign_every=7) as server:
+        yield server
+
+
+def test_bulk_delete_isolates_rejected_ids(foreign):
+    sgdb = SteamGridDB(AUTH_KEY, base_url=foreign.base_url)
+    try:
+        ids = list(range(1, 120)) + [5, 14]
+        report = sgdb.bulk_delete(ids, AssetType.Grid)
+    finally:
+        sgdb.close()
+
+    expected = [i for i in range(1, 120) if i % 7]
+    assert len(report) == 119
+    assert sorted(report.deleted) == expected
+    assert sorted(report.failed) == [i for i in range(1, 120) if i % 7 == 0]
+    assert all(error.status == 403 for error in report.failed.values())
+    assert foreign.deleted == set(expected)
+
+
+def test_bulk_delete_does_not_split_auth_errors(foreign):
+    sgdb = SteamGridDB('b' * 32, base_url=foreign.base_url)
+    try:
+        report = sgdb.bulk_delete(list(range(1, 50)), AssetType.Hero)
+    finally:
+        sgdb.close()
+
+    assert not report.deleted
+    assert {error.status for error in report.failed.values()} == {401}
+    assert foreign.total_requests == 1
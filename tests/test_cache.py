@@ -0,0 +1,59 @@
+import pytest
+
+from steamgriddy import AssetType, AutocompleteCache, ResponseCache, SteamGridDB
+
+from conftest import AUTH_KEY
+
+GAMES = [{'id': 1, 'name': 'Half-Life'}, {'id': 2, 'name': 'Half-Life 2'}, {'id': 3, 'name': 'Halo: Reach'}]
+
+
+def test_exact_and_prefix_hits():
+    cache = AutocompleteCache()
+    cache.set('Hal', GAMES)
+    assert cache.get('hal') == GAMES
+    assert cache.get('Half-Life 2') == [GAMES[1]]
+    assert cache.get('half life') == GAMES[:2]
+    assert (cache.hits, cache.prefix_hits, cache.misses) == (1, 2, 0)
+
+
+def test_misses():
+    cache = AutocompleteCache(limit=3)
+    assert cache.get('portal') is None
+    cache.set('half', GAMES[:2])
+    # Nothing cached matches, but the fuzzy API search might still find games
+    assert cache.get('halfway') is None
+    cache.set('ha', GAMES)
+    # A full result list may have been truncated by the API
+    assert cache.get('hal') is None
+    assert cache.misses == 3
+
+
+def test_expired_entries_are_dropped():
+    cache = AutocompleteCache(ttl=0)
+    cache.set('half', GAMES)
+    assert cache.get('half') is None
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize('memo', [False, True])
+def test_deleted_assets_leave_cached_lists(fake, tmp_path, memo):
+    fake.reset()
+    cache = ResponseCache(str(tmp_path / 'responses.sqlite'))
+    sgdb = SteamGridDB(AUTH_KEY, base_url=fake.base_url, cache=cache, memo=memo)
+    game_id = fake.GAME_ID_OFFSET + fake.app_ids(1)[0]
+    try:
+        grids = sgdb.get_grids_by_gameid([game_id])
+        heroes = sgdb.get_heroes_by_gameid([game_id])
+        sgdb.delete_grid([grids[0].id])
+        assert grids[0].id not in [grid.id for grid in sgdb.get_grids_by_gameid([game_id])]
+
+        report = sgdb.bulk_delete([grid.id for grid in grids[1:]], AssetType.Grid)
+        assert len(report.deleted) == len(grids) - 1
+        assert not sgdb.get_grids_by_gameid([game_id])
+        # Lists of other asset types stay cached
+        requests = fake.total_requests
+        assert len(sgdb.get_heroes_by_gameid([game_id])) == len(heroes)
+        assert fake.total_requests == requests
+    finally:
+        sgdb.close()
+        cache.close()
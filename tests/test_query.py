@@ -0,0 +1,41 @@
+import pytest
+
+from steamgriddy import AssetQuery, ImageType, MimeType, StyleType
+
+
+def test_raw_values_are_coerced():
+    query = AssetQuery(styles=['alternate'], dimensions=['600x900', '342x482'], mimes=['image/png'])
+    same = AssetQuery(styles=[StyleType.Alternate], dimensions=('600x900', '342x482'), mimes=[MimeType.PNG])
+    assert query == same and hash(query) == hash(same)
+    assert query.params['styles'] == 'alternate'
+    assert query.params['dimensions'] == '600x900,342x482'
+
+
+@pytest.mark.parametrize('filters', [
+    {'styles': ['alternative']},
+    {'mimes': ['png']},
+    {'types': ['Animated']},
+    {'dimensions': ['600x']},
+    {'dimensions': ['600 x 900']},
+])
+def test_invalid_values_fail_at_construction(filters):
+    with pytest.raises(ValueError):
+        AssetQuery(**filters)
+
+
+@pytest.mark.parametrize('filters', [
+    {'styles': 'alternate'},
+    {'styles': [MimeType.PNG]},
+    {'dimensions': [600]},
+    {'types': [None]},
+    {'is_nsfw': 'yes'},
+])
+def test_wrong_types_fail(filters):
+    with pytest.raises(TypeError):
+        AssetQuery(**filters)
+
+
+def test_client_filters_are_checked(sgdb):
+    with pytest.raises(ValueError):
+        sgdb.get_grids_by_gameid([1], styles=['alternative'])
+    assert AssetQuery(types=[ImageType.Animated]).params['types'] == 'animated'
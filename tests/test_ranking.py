@@ -0,0 +1,87 @@
+import gc
+
+from steamgriddy import AssetTable, AssetType, AuthorRegistry, Ranker, RankingPolicy, SlotType
+
+from conftest import asset_payload
+
+
+def make_table(http):
+    return AssetTable.from_payloads(AssetType.Grid, [
+        asset_payload(1, width=600, height=900, score=5),
+        asset_payload(2, width=342, height=482, score=3),
+        asset_payload(3, width=920, height=430, score=9),
+        asset_payload(4, width=600, height=900, score=1, nsfw=True),
+    ], http, game_id=10)
+
+
+def ids(table, rows):
+    return [table.id[row] for row in rows]
+
+
+def test_rank_filters_and_orders(sgdb):
+    table = make_table(sgdb._http)
+    ranker = Ranker()
+    assert ids(table, ranker.rank(table, SlotType.Capsule)) == [1, 2]
+    assert ids(table, ranker.rank(table, SlotType.Wide)) == [3]
+    assert ids(table, ranker.rank(table, SlotType.Capsule, k=1)) == [1]
+    assert ids(table, ranker.rank(table, SlotType.Capsule, game_id=11)) == []
+    assert ranker.best(table, SlotType.Capsule, game_id=10).id == 1
+
+
+def test_replaced_policy_is_used(sgdb):
+    table = make_table(sgdb._http)
+    ranker = Ranker()
+    assert ids(table, ranker.rank(table, SlotType.Capsule)) == [1, 2]
+
+    ranker.policies[SlotType.Capsule] = RankingPolicy(
+        AssetType.Grid, dimensions=('342x482', '600x900'), require_dimensions=True, allow_nsfw=True,
+    )
+    assert ids(table, ranker.rank(table, SlotType.Capsule)) == [2, 1, 4]
+
+
+def test_changed_policy_is_used(sgdb):
+    table = make_table(sgdb._http)
+    policy = RankingPolicy(AssetType.Grid, dimensions=('600x900',), require_dimensions=True)
+    ranker = Ranker({SlotType.Capsule: policy})
+    assert ids(table, ranker.rank(table, SlotType.Capsule)) == [1]
+
+    policy.dimensions = ('342x482',)
+    assert ids(table, ranker.rank(table, SlotType.Capsule)) == [2]
+    policy.deny_authors = frozenset({'76561198000000001'})
+    assert ids(table, ranker.rank(table, SlotType.Capsule)) == []
+
+
+def test_grown_table_is_reindexed(sgdb):
+    table = make_table(sgdb._http)
+    ranker = Ranker()
+    assert ids(table, ranker.rank(table, SlotType.Capsule)) == [1, 2]
+    table.extend([asset_payload(5, width=660, height=930, score=200, style='blurred')], 10)
+    assert ids(table, ranker.rank(table, SlotType.Capsule)) == [5, 1, 2]
+
+
+def test_indexes_die_with_their_table(sgdb):
+    ranker = Ranker()
+    table = make_table(sgdb._http)
+    ranker.rank(table, SlotType.Capsule)
+    assert len(ranker._indexes) == 1
+
+    del table
+    gc.collect()
+    assert len(ranker._indexes) == 0
+
+
+def test_author_means_follow_the_registry(sgdb):
+    registry = AuthorRegistry()
+    table = AssetTable.from_payloads(AssetType.Grid, [
+        asset_payload(1, author={'name': 'a', 'steam64': '1'}),
+        asset_payload(2, author={'name': 'b', 'steam64': '2'}),
+    ], sgdb._http, game_id=10)
+    policy = RankingPolicy(AssetType.Grid, author_weight=1.0)
+    ranker = Ranker({SlotType.Capsule: policy}, authors=registry)
+    registry.record({'steam64': '1'}, AssetType.Grid, 100, 10)
+    assert ids(table, ranker.rank(table, SlotType.Capsule)) == [1, 2]
+
+    registry.record({'steam64': '2'}, AssetType.Grid, 101, 50)
+    assert ids(table, ranker.rank(table, SlotType.Capsule)) == [2, 1]
+    registry.clear()
+    assert ids(table, ranker.rank(table, SlotType.Capsule)) == [1, 2]
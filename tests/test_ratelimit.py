@@ -0,0 +1,23 @@
+import time
+from email.utils import formatdate
+
+import pytest
+
+from steamgriddy import Backoff
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('120', 120.0),
+    ('0.5', 0.5),
+    ('-3', 0.0),
+    (None, None),
+    ('', None),
+    ('soon', None),
+])
+def test_parse_retry_after(value, expected):
+    assert Backoff.parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date():
+    assert 25 < Backoff.parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+    assert Backoff.parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0.0
@@ -0,0 +1,52 @@
+from steamgriddy import NameResolver
+from steamgriddy.resolver import normalize_name
+
+
+def test_normalize_name():
+    assert normalize_name('Pokémon™ Mystery Dungeon: Explorers') == 'pokemon mystery dungeon explorers'
+    assert normalize_name('  Ratchet & Clank® ') == 'ratchet and clank'
+    assert normalize_name('!!!') == ''
+
+
+def make_resolver():
+    resolver = NameResolver()
+    resolver.add('Half-Life 2', game_id=1, app_id=220)
+    resolver.add('Half-Life', game_id=2, app_id=70)
+    resolver.add('Portal 2', game_id=3)
+    resolver.add('Stardew Valley', game_id=4, app_id=413150)
+    return resolver
+
+
+def test_exact_match():
+    match = make_resolver().resolve('half life 2')
+    assert (match.name, match.score, match.game_id, match.app_id) == ('Half-Life 2', 1.0, 1, 220)
+
+
+def test_fuzzy_match_and_threshold():
+    resolver = make_resolver()
+    assert resolver.resolve('Stardew Valey').game_id == 4
+    assert resolver.resolve('Counter-Strike') is None
+    assert resolver.resolve('Stardew Valey', threshold=1.0) is None
+    assert resolver.resolve('') is None
+
+
+def test_lookup_orders_by_similarity():
+    matches = make_resolver().lookup('Half-Life 2', limit=3)
+    assert [match.game_id for match in matches[:2]] == [1, 2]
+    assert matches[0].score == 1.0 > matches[1].score
+
+
+def test_add_fills_in_ids():
+    resolver = make_resolver()
+    resolver.add_installed([{'appid': '620', 'name': 'Portal 2'}, {'appid': '400', 'name': 'Portal'}])
+    assert len(resolver) == 5
+    match = resolver.resolve('PORTAL 2')
+    assert (match.game_id, match.app_id) == (3, 620)
+    assert resolver.resolve('Portal').app_id == 400
+
+
+def test_similarity():
+    resolver = NameResolver()
+    assert resolver.similarity('Half-Life', 'half life') == 1.0
+    assert 0 < resolver.similarity('Half-Life', 'Half-Life 2') < 1
+    assert resolver.similarity('Half-Life', '') == 0.0
@@ -0,0 +1,79 @@
+import struct
+
+import pytest
+
+from steamgriddy import AssetTable, AssetType, Snapshot, SnapshotError, SteamGridDB
+from steamgriddy.snapshot import MAGIC, VERSION
+
+from conftest import AUTH_KEY, asset_payload
+
+
+def test_round_trip(fake, sgdb):
+    app_ids = fake.app_ids(5)
+    table = sgdb.bulk_asset_table(app_ids, AssetType.Grid)
+    games = [sgdb.get_game_by_steam_appid(app_id) for app_id in app_ids[:2]]
+    assert len(table)
+
+    snapshot = sgdb.load_snapshot(sgdb.dump_snapshot([table], games))
+    assert [game.to_json() for game in snapshot.games] == [game.to_json() for game in games]
+    loaded = snapshot.tables[AssetType.Grid]
+    assert len(loaded) == len(table)
+    assert [loaded._payload(row) for row in loaded.rows()] == [table._payload(row) for row in table.rows()]
+    assert loaded.games().keys() == table.games().keys()
+    assert {author.steam64 for author in snapshot.authors} == set(table.authors)
+
+
+def test_many_distinct_strings(sgdb):
+    # Past 65535 distinct values the string codes no longer fit in 16 bits
+    payloads = [asset_payload(i, notes=f'note {i}') for i in range(70000)]
+    table = AssetTable.from_payloads(AssetType.Grid, payloads, sgdb._http, game_id=7)
+
+    loaded = sgdb.load_snapshot(sgdb.dump_snapshot([table], [])).tables[AssetType.Grid]
+    assert loaded._payload(69999)['notes'] == 'note 69999'
+    assert loaded._payload(0) == table._payload(0)
+
+
+def test_strings_keep_any_character(sgdb):
+    notes = ['a\x00b', '', None, '\x00', 'héllo\x00wörld', 'plain']
+    payloads = [
+        asset_payload(i, notes=note, author={'name': f'n\x00{i}', 'steam64': str(i), 'avatar': None})
+        for i, note in enumerate(notes)
+    ]
+    table = AssetTable.from_payloads(AssetType.Grid, payloads, sgdb._http)
+
+    loaded = sgdb.load_snapshot(sgdb.dump_snapshot([table], [])).tables[AssetType.Grid]
+    assert [loaded._payload(row)['notes'] for row in loaded.rows()] == notes
+    assert [loaded._payload(row)['author'] for row in loaded.rows()] == [p['author'] for p in payloads]
+
+
+def test_platform_ids_are_restored(fake, sgdb):
+    app_ids = fake.app_ids(3)
+    games = [sgdb.get_game_by_steam_appid(app_id) for app_id in app_ids]
+    data = sgdb.dump_snapshot(games=games[:2])
+
+    other = SteamGridDB(AUTH_KEY, base_url=fake.base_url)
+    try:
+        snapshot = other.load_snapshot(data)
+        assert len(snapshot.games) == 2
+        assert other.games.by_platform('steam', app_ids[0]).id == games[0].id
+        assert other.games.by_platform('steam', app_ids[1]).id == games[1].id
+        assert other.games.by_platform('steam', app_ids[2]) is None
+        assert other.games.names.resolve(games[0].name).app_id == app_ids[0]
+    finally:
+        other.close()
+
+
+def test_empty_snapshot(sgdb):
+    snapshot = sgdb.load_snapshot(Snapshot.dumps())
+    assert snapshot.games == [] and snapshot.tables == {} and snapshot.authors == []
+
+
+@pytest.mark.parametrize('data', [
+    b'',
+    b'SGD',
+    struct.pack('<4sH', b'NOPE', VERSION),
+    struct.pack('<4sH', MAGIC, VERSION + 1),
+])
+def test_rejects_other_data(sgdb, data):
+    with pytest.raises(SnapshotError):
+        sgdb.load_snapshot(data)
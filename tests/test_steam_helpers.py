@@ -0,0 +1,90 @@
+import os
+
+import pytest
+import vdf
+
+from steamgriddy import steam_helpers
+
+from conftest import app, encode, write_appinfo
+
+ACCOUNT_ID = 39734273
+
+
+def write_vdf(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        vdf.dump(data, f, pretty=True)
+
+
+@pytest.fixture
+def steam(tmp_path, monkeypatch):
+    root = tmp_path / 'Steam'
+    write_vdf(str(root / 'steamapps' / 'libraryfolders.vdf'), {'libraryfolders': {'0': {'path': str(root)}}})
+    for app_id in (10, 20):
+        write_vdf(
+            str(root / 'steamapps' / f'appmanifest_{app_id}.acf'),
+            {'AppState': {'appid': str(app_id), 'name': f'Manifest {app_id}'}},
+        )
+    config = root / 'userdata' / str(ACCOUNT_ID) / 'config'
+    write_vdf(str(config / 'localconfig.vdf'), {
+        'UserLocalConfigStore': {'Software': {'Valve': {'Steam': {'apps': {'30': {}}}}}},
+    })
+    (config / 'shortcuts.vdf').write_bytes(
+        encode({'shortcuts': {'0': {'appid': 7, 'AppName': 'Emulator', 'Exe': 'emu'}}}) + b'\x08'
+    )
+    os.makedirs(root / 'appcache')
+    monkeypatch.setenv('STEAM', str(root))
+    monkeypatch.setattr(steam_helpers, '_installation', None)
+    return root
+
+
+def inventory():
+    return sorted((game['appID'], game['name'], game['non_steam']) for game in steam_helpers.get_game_inventory(ACCOUNT_ID))
+
+
+def test_inventory_uses_appinfo(steam):
+    write_appinfo(steam / 'appcache' / 'appinfo.vdf', 29, {10: app(10), 20: app(20, 'DLC'), 30: app(30)})
+    assert inventory() == [('10', 'Game 10', False), ('30', 'Game 30', False), ('7', 'Emulator', True)]
+
+
+@pytest.mark.parametrize('data', [b'\x30\x44\x56\x07\x01\x00\x00\x00', b'garbage'])
+def test_inventory_without_usable_appinfo(steam, data):
+    (steam / 'appcache' / 'appinfo.vdf').write_bytes(data)
+    assert inventory() == [('10', 'Manifest 10', False), ('20', 'Manifest 20', False), ('7', 'Emulator', True)]
+
+
+def test_inventory_skips_corrupt_records(steam):
+    path = write_appinfo(steam / 'appcache' / 'appinfo.vdf', 28, {10: app(10), 20: app(20)})
+    data = open(path, 'rb').read()
+    # Cut the last record short, keeping its header
+    open(path, 'wb').write(data[:-30] + b'\x00' * 4)
+    assert ('10', 'Game 10', False) in inventory()
+
+
+def test_replaced_appinfo_is_closed(steam):
+    path = steam / 'appcache' / 'appinfo.vdf'
+    write_appinfo(path, 29, {10: app(10)})
+    installation = steam_helpers.get_installation()
+    first = installation.appinfo()
+    assert installation.appinfo() is first
+
+    write_appinfo(path, 29, {10: app(10), 20: app(20)})
+    second = installation.appinfo()
+    assert second is not first and len(second) == 2
+    assert first._data.closed and not second._data.closed
+
+    installation.invalidate()
+    assert second._data.closed
+
+
+def test_scan_stops_early(tmp_path):
+    for app_id in range(10, 500, 10):
+        write_vdf(str(tmp_path / f'appmanifest_{app_id}.acf'), {'AppState': {'appid': str(app_id), 'name': f'Game {app_id}'}})
+    scanner = steam_helpers.ManifestScanner(workers_per_drive=1)
+    games = scanner.scan([str(tmp_path)])
+    next(games)
+    games.close()
+    assert len(scanner) >= 1
+
+    assert len(list(scanner.scan([str(tmp_path)]))) == 49
+    assert len(scanner) == 49
@@ -0,0 +1,82 @@
+import pytest
+
+from steamgriddy.vdfparse import VDFError, select, select_file
+
+LOCALCONFIG = r'''
+"UserLocalConfigStore"
+{
+    // comments may contain { braces and "quotes
+    "Software"
+    {
+        "Valve"
+        {
+            "Steam"
+            {
+                "apps"
+                {
+                    "10" { "LastPlayed" "1" "cloud" { "quota" "1" } }
+                    "20" { "LastPlayed" "2" "note" "a } in a string" }
+                }
+            }
+        }
+    }
+    "friends"
+    {
+        "PersonaName"   "Some \"Quoted\" Name"   [$WIN32]
+        "path"          "C:\\Games"
+    }
+}
+'''
+
+
+def test_select_reads_only_requested_paths():
+    found = select(LOCALCONFIG, ['UserLocalConfigStore/friends/PersonaName', 'UserLocalConfigStore/friends/path'])
+    assert found == {
+        'UserLocalConfigStore/friends/PersonaName': 'Some "Quoted" Name',
+        'UserLocalConfigStore/friends/path': 'C:\\Games',
+    }
+
+
+def test_select_is_case_insensitive_and_returns_subtrees():
+    found = select(LOCALCONFIG, ['userlocalconfigstore/software/valve/steam/APPS'])
+    apps = found['userlocalconfigstore/software/valve/steam/APPS']
+    assert apps == {
+        '10': {'LastPlayed': '1', 'cloud': {'quota': '1'}},
+        '20': {'LastPlayed': '2', 'note': 'a } in a string'},
+    }
+
+
+def test_select_skips_missing_paths():
+    assert select(LOCALCONFIG, ['UserLocalConfigStore/friends/nope', 'Other/key']) == {}
+    assert select(LOCALCONFIG, []) == {}
+
+
+def test_select_first_occurrence_wins():
+    assert select('"a" { "b" "1" "b" "2" }', ['a/b']) == {'a/b': '1'}
+
+
+def test_select_skips_deeply_nested_blocks():
+    deep = '"x" ' + '{ "k" ' * 12 + '"v"' + ' }' * 12
+    assert select('"root" { ' + deep + ' "want" "yes" }', ['root/want']) == {'root/want': 'yes'}
+
+
+def test_select_stops_before_trailing_garbage():
+    # Everything after the last requested path is never parsed
+    assert select('"a" { "b" "1" } } } {', ['a/b']) == {'a/b': '1'}
+
+
+@pytest.mark.parametrize('document', ['"a" { "b" "1"', '"a" { "b" { "c" "1" }', '"a" }'])
+def test_select_rejects_malformed_documents(document):
+    with pytest.raises(VDFError):
+        select(document, ['a/missing'])
+
+
+def test_select_file(tmp_path):
+    path = tmp_path / 'localconfig.vdf'
+    path.write_text(LOCALCONFIG, encoding='utf-8')
+    found = select_file(str(path), ['UserLocalConfigStore/friends/PersonaName'])
+    assert found == {'UserLocalConfigStore/friends/PersonaName': 'Some "Quoted" Name'}
+
+    empty = tmp_path / 'empty.vdf'
+    empty.write_bytes(b'')
+    assert select_file(str(empty), ['a']) == {}
@@ -0,0 +1,214 @@
+#!/bin/python
+"""End-to-end benchmarks of the SteamGridDB clients against the bundled fake API.
+
+Nothing is sent to the real service: every scenario runs against a local
+steamgriddy.fakeserver.FakeSteamGridDB. Record the output before and after a
+performance change and compare.
+
+The bulk and cached scenarios run cli.fetch_library_grids, the SteamGridDB
+part of cli.py; the serial, threaded and async ones replay the per-game
+lookups cli.py made before bulk fetching, for comparison.
+
+    python utils/benchmark.py --sizes 100 1000 10000 --latency 0.02
+    python utils/benchmark.py --scenarios bulk cached --json results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from cli import fetch_library_grids
+from steamgriddy import Backoff, RateLimiter, SteamGridDB, AsyncSteamGridDB
+from steamgriddy.fakeserver import FakeSteamGridDB
+from steamgriddy.http import HTTPException
+from steamgriddy.transport import RequestsTransport, AiohttpTransport
+
+SCENARIOS = ('serial', 'threaded', 'async', 'bulk', 'cached')
+
+
+class TimedTransport(RequestsTransport):
+    """Records the wall time of every request sent through it."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.timings = []
+        self._lock = threading.Lock()
+
+    def request(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return super().request(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.timings.append(elapsed)
+
+
+class AsyncTimedTransport(AiohttpTransport):
+    """Records the wall time of every request sent through it."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.timings = []
+
+    async def request(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await super().request(*args, **kwargs)
+        finally:
+            self.timings.append(time.perf_counter() - start)
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def fetch_game_grids(sgdb, app_id):
+    """The pre-bulk cli.py pattern: resolve the game, then list its grids."""
+    try:
+        game = sgdb.get_game_by_steam_appid(app_id)
+    except HTTPException:
+        return None
+    return sgdb.get_grids_by_gameid([game.id], dimensions=['600x900'])
+
+
+def run_serial(fake, app_ids, args):
+    transport = TimedTransport()
+    with closing(SteamGridDB('bench', base_url=fake.base_url, transport=transport, backoff=args.backoff)) as sgdb:
+        for app_id in app_ids:
+            fetch_game_grids(sgdb, app_id)
+    return transport.timings
+
+
+def run_threaded(fake, app_ids, args):
+    transport = TimedTransport(pool_maxsize=args.workers)
+    with closing(SteamGridDB('bench', base_url=fake.base_url, transport=transport, backoff=args.backoff)) as sgdb:
+        with ThreadPoolExecutor(args.workers) as executor:
+            list(executor.map(lambda app_id: fetch_game_grids(sgdb, app_id), app_ids))
+    return transport.timings
+
+
+def run_async(fake, app_ids, args):
+    transport = AsyncTimedTransport(limit=args.workers)
+
+    async def main():
+        semaphore = asyncio.Semaphore(args.workers)
+        async with AsyncSteamGridDB('bench', base_url=fake.base_url, transport=transport, backoff=args.backoff) as sgdb:
+            async def one(app_id):
+                async with semaphore:
+                    try:
+                        game = await sgdb.get_game_by_steam_appid(app_id)
+                    except HTTPException:
+                        return None
+                    return await sgdb.get_grids_by_gameid([game.id], dimensions=['600x900'])
+            await asyncio.gather(*(one(app_id) for app_id in app_ids))
+
+    asyncio.run(main())
+    return transport.timings
+
+
+def run_bulk(fake, app_ids, args):
+    transport = TimedTransport()
+    sgdb = SteamGridDB(
+        'bench',
+        base_url=fake.base_url,
+        transport=transport,
+        backoff=args.backoff,
+        rate_limiter=RateLimiter(args.rate_limit) if args.rate_limit else None,
+        memo=True,
+    )
+    with closing(sgdb):
+        fetch_library_grids(sgdb, app_ids)
+    return transport.timings
+
+
+def run_cached(fake, app_ids, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'cache.sqlite')
+        with closing(SteamGridDB('bench', base_url=fake.base_url, cache=path, backoff=args.backoff)) as sgdb:
+            fetch_library_grids(sgdb, app_ids)
+        fake.reset()
+        transport = TimedTransport()
+        with closing(SteamGridDB('bench', base_url=fake.base_url, cache=path, transport=transport, backoff=args.backoff)) as sgdb:
+            fetch_library_grids(sgdb, app_ids)
+    return transport.timings
+
+
+RUNNERS = {
+    'serial': run_serial,
+    'threaded': run_threaded,
+    'async': run_async,
+    'bulk': run_bulk,
+    'cached': run_cached,
+}
+
+
+def bench(scenario, size, args):
+    fake = FakeSteamGridDB(
+        games=size,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+    )
+    with fake:
+        app_ids = fake.app_ids()
+        start = time.perf_counter()
+        timings = RUNNERS[scenario](fake, app_ids, args)
+        elapsed = time.perf_counter() - start
+        return {
+            'scenario': scenario,
+            'games': size,
+            'seconds': round(elapsed, 4),
+            'games_per_second': round(size / elapsed, 1) if elapsed else None,
+            'requests': fake.total_requests,
+            'p50_ms': round(percentile(timings, 0.50) * 1000, 2),
+            'p99_ms': round(percentile(timings, 0.99) * 1000, 2),
+            'endpoints': dict(fake.requests),
+        }
+
+
+def main():
+    aparser = argparse.ArgumentParser(description="SteamGriddy client benchmarks against a local fake API")
+    aparser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000],
+            help="Library sizes to benchmark (default: 100 1000 10000)")
+    aparser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS))
+    aparser.add_argument('--workers', type=int, default=8, help="Concurrency of the threaded and async scenarios")
+    aparser.add_argument('--latency', type=float, default=0.0, help="Seconds the fake adds to every response")
+    aparser.add_argument('--jitter', type=float, default=0.0, help="Up to this many extra seconds at random")
+    aparser.add_argument('--error-rate', type=float, default=0.0, help="Probability of a 500 response")
+    aparser.add_argument('--throttle-rate', type=float, default=0.0, help="Probability of a 429 response")
+    aparser.add_argument('--rate-limit', type=float, default=0.0,
+            help="Client rate limit of the bulk scenario, like cli.py -r (default: none)")
+    aparser.add_argument('--json', metavar='PATH', help="Also write the results to a JSON file")
+    args = aparser.parse_args()
+    args.backoff = Backoff(max_retries=10, base=0.01, cap=0.5)
+
+    results = []
+    print(f"{'scenario':<10} {'games':>7} {'seconds':>9} {'games/s':>9} {'requests':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for size in args.sizes:
+        for scenario in args.scenarios:
+            result = bench(scenario, size, args)
+            results.append(result)
+            print(f"{scenario:<10} {size:>7} {result['seconds']:>9} {result['games_per_second']:>9} "
+                  f"{result['requests']:>9} {result['p50_ms']:>8} {result['p99_ms']:>8}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()